@@ -0,0 +1,194 @@
+import asyncio
+import importlib
+from abc import ABC, abstractmethod
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional
+from bot.config import Config
+from bot.models.token import AnalysisResult
+
+logger = logging.getLogger("NotificationBus")
+
+# What a full sink queue does with a new event
+DROP_OLDEST = "drop_oldest" # Make room: stale alerts are worth less than fresh ones
+DROP_NEWEST = "drop_newest" # Keep the backlog, discard the incoming event
+
+# Sink name -> "module:Class". Modules are only imported when the sink is enabled,
+# so e.g. plyer is never loaded on a headless server.
+SINK_CLASSES = {
+    "telegram": "bot.alerts.sinks:TelegramSink",
+    "desktop": "bot.alerts.desktop:DesktopSink",
+    "webhook": "bot.alerts.sinks:WebhookSink",
+    "jsonl": "bot.alerts.sinks:JsonlSink",
+}
+
+@dataclass
+class Notification:
+    kind: str                                # "alert" or "trade"
+    text: str = ""                           # Ready-made message (trades)
+    result: Optional[AnalysisResult] = None  # Alerts carry the full result
+    priority: int = 2
+    strategy: Optional[str] = None
+    skip: FrozenSet[str] = frozenset()       # Sinks that already handled this (e.g. provisional Telegram alert)
+    ts: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {"kind": self.kind, "ts": self.ts, "strategy": self.strategy, "text": self.text}
+        if self.result:
+            token = self.result.token
+            data.update({
+                "action": self.result.action,
+                "score": self.result.score,
+                "risk_flags": self.result.risk_flags,
+                "chain_id": token.chain_id,
+                "pair_address": token.pair_address,
+                "token_address": token.base_token_address,
+                "symbol": token.base_token_symbol,
+                "price_usd": token.price_usd,
+                "liquidity_usd": token.liquidity_usd,
+                "fdv": token.fdv,
+                "url": token.url,
+            })
+        return data
+
+class Sink(ABC):
+    """
+    Base class for notification sinks. Subclasses must implement handle() (a sink
+    without it fails at construction); open()/close() are for sessions and files.
+    Each sink gets its own queue and worker from the bus.
+    """
+    name = "sink"
+    kinds = {"alert", "trade"}
+    policy = DROP_OLDEST
+    queue_size = None # None = Config.NOTIFY_QUEUE_SIZE
+
+    def __init__(self, **deps):
+        pass
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    @abstractmethod
+    async def handle(self, event: Notification):
+        """Delivers one notification; raising counts as a failure for this sink."""
+
+class _SinkWorker:
+    """Queue + worker + failure accounting for one sink."""
+    def __init__(self, sink: Sink):
+        self.sink = sink
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=sink.queue_size or Config.NOTIFY_QUEUE_SIZE)
+        self.task: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.consecutive_failures = 0
+        self.disabled_until = 0.0
+
+    def offer(self, event: Notification):
+        if event.kind not in self.sink.kinds or self.sink.name in event.skip:
+            return
+        if time.monotonic() < self.disabled_until:
+            self.dropped += 1 # Sink is cooling down after repeated failures
+            return
+        if self.queue.full():
+            self.dropped += 1
+            if self.sink.policy == DROP_NEWEST:
+                return
+            self.queue.get_nowait()
+            self.queue.task_done()
+        self.queue.put_nowait(event)
+
+    async def run(self):
+        try:
+            await self.sink.open()
+        except Exception as e:
+            logger.error(f"Sink {self.sink.name} failed to open: {e}")
+        while True:
+            event = await self.queue.get()
+            try:
+                if time.monotonic() < self.disabled_until:
+                    self.dropped += 1 # Backlog from before the breaker tripped
+                    continue
+                await asyncio.wait_for(self.sink.handle(event), Config.NOTIFY_SINK_TIMEOUT)
+                self.sent += 1
+                self.consecutive_failures = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed += 1
+                self.consecutive_failures += 1
+                logger.warning(f"Sink {self.sink.name} failed: {e!r}")
+                if self.consecutive_failures >= Config.NOTIFY_FAILURE_THRESHOLD:
+                    # Circuit breaker: stop feeding a broken sink for a while
+                    self.disabled_until = time.monotonic() + Config.NOTIFY_COOLDOWN
+                    self.consecutive_failures = 0
+                    logger.error(f"Sink {self.sink.name} disabled for {Config.NOTIFY_COOLDOWN}s after repeated failures")
+            finally:
+                self.queue.task_done()
+
+class NotificationBus:
+    """
+    Fans notifications out to independent sinks. publish() never blocks or
+    raises: each sink has a bounded queue and its own worker, so a slow or broken
+    sink only drops its own events and never delays scanning or the other sinks.
+    """
+    def __init__(self, sinks: List[Sink]):
+        self.workers = [_SinkWorker(sink) for sink in sinks]
+
+    @classmethod
+    def from_config(cls, names: Optional[List[str]] = None, **deps) -> "NotificationBus":
+        """Builds the sinks listed in Config.NOTIFY_SINKS; deps (outbox, digest...) go to every sink."""
+        sinks = []
+        for name in (Config.NOTIFY_SINKS if names is None else names):
+            path = SINK_CLASSES.get(name)
+            if not path:
+                logger.error(f"Unknown notification sink: {name}")
+                continue
+            module_name, class_name = path.split(":")
+            try:
+                sink_cls = getattr(importlib.import_module(module_name), class_name)
+                sinks.append(sink_cls(**deps))
+            except Exception as e:
+                # A missing optional dependency (plyer...) only costs that sink
+                logger.error(f"Sink {name} unavailable: {e}")
+        return cls(sinks)
+
+    @property
+    def sink_names(self) -> List[str]:
+        return [w.sink.name for w in self.workers]
+
+    def start(self):
+        for worker in self.workers:
+            if worker.task is None:
+                worker.task = asyncio.create_task(worker.run())
+
+    async def stop(self, timeout: float = 5.0):
+        """Gives the sinks a moment to drain, then shuts them down."""
+        pending = [w.queue.join() for w in self.workers if w.task]
+        if pending:
+            try:
+                await asyncio.wait_for(asyncio.gather(*pending), timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Notification sinks didn't drain before shutdown")
+        for worker in self.workers:
+            if worker.task:
+                worker.task.cancel()
+                worker.task = None
+            try:
+                await worker.sink.close()
+            except Exception as e:
+                logger.error(f"Sink {worker.sink.name} failed to close: {e}")
+
+    def publish(self, event: Notification):
+        for worker in self.workers:
+            worker.offer(event)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            w.sink.name: {"queued": w.queue.qsize(), "sent": w.sent, "failed": w.failed, "dropped": w.dropped}
+            for w in self.workers
+        }
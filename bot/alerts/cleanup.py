@@ -0,0 +1,92 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+from bot.alerts.outbox import TelegramOutbox, PRIORITY_COMMAND, PRIORITY_REPORT
+
+logger = logging.getLogger("ChatCleanup")
+
+# Telegram's deleteMessages limit
+BATCH_SIZE = 100
+
+class ChatCleanup:
+    """
+    Deletes logged bot messages in the background (used by /reset).
+    - Groups ids per chat and sends them as deleteMessages batches of up to 100.
+    - All batches are queued at once at report priority; the outbox keeps them inside
+      the rate limits and lets alerts and command replies jump ahead.
+    - A rejected batch falls back to single deletes so one bad id doesn't keep the rest.
+    - Progress goes to on_progress(done, total); run() returns (deleted, failed ids).
+    """
+    def __init__(self, outbox: TelegramOutbox, message_ids: List[Tuple[str, int]],
+                 on_progress: Optional[Callable[[int, int], None]] = None):
+        self.outbox = outbox
+        self.on_progress = on_progress
+        self.by_chat: Dict[str, List[int]] = defaultdict(list)
+        for chat_id, message_id in message_ids:
+            self.by_chat[chat_id].append(message_id)
+        self.total = len(message_ids)
+        self.done = 0
+        self.failed: List[Tuple[str, int]] = []
+
+    def chunks(self):
+        for chat_id, ids in self.by_chat.items():
+            for i in range(0, len(ids), BATCH_SIZE):
+                yield chat_id, ids[i:i + BATCH_SIZE]
+
+    async def run(self) -> Tuple[int, List[Tuple[str, int]]]:
+        if self.total:
+            await asyncio.gather(*(self._delete_chunk(cid, ids) for cid, ids in self.chunks()))
+        deleted = self.total - len(self.failed)
+        logger.info(f"Deleted {deleted}/{self.total} messages ({len(self.failed)} failed)")
+        return deleted, self.failed
+
+    async def _delete_chunk(self, chat_id, ids: List[int]):
+        if await self.outbox.delete_messages(chat_id, ids, PRIORITY_REPORT):
+            self._progress(len(ids))
+            return
+
+        # Batch rejected (e.g. bot lacks rights in that chat, or one id is bad): retry one by one
+        results = await asyncio.gather(*(self.outbox.delete_message(chat_id, mid, PRIORITY_REPORT) for mid in ids))
+        for mid, ok in zip(ids, results):
+            if not ok:
+                self.failed.append((chat_id, mid))
+        self._progress(len(ids))
+
+    def _progress(self, count: int):
+        self.done += count
+        if self.on_progress:
+            self.on_progress(self.done, self.total)
+
+async def run_reset_cleanup(outbox: TelegramOutbox, message_ids: List[Tuple[str, int]]):
+    """
+    /reset housekeeping: posts a status message, keeps it updated while the
+    cleanup runs and ends with a summary listing anything that couldn't be deleted.
+    """
+    status_chat, status_id = None, None
+    if message_ids:
+        status = await outbox.send_message(f"🧹 Deleting {len(message_ids)} messages...", PRIORITY_COMMAND, log=False)
+        if isinstance(status, dict):
+            status_chat, status_id = status["chat"]["id"], status["message_id"]
+
+    last_reported = 0
+
+    def on_progress(done: int, total: int):
+        nonlocal last_reported
+        # Edit every ~10% so the status message doesn't eat the chat's rate budget
+        if status_id and done < total and done - last_reported >= max(BATCH_SIZE, total // 10):
+            last_reported = done
+            outbox.edit_message(status_chat, status_id, f"🧹 Deleting messages... {done}/{total}")
+
+    cleanup = ChatCleanup(outbox, message_ids, on_progress)
+    deleted, failed = await cleanup.run()
+
+    msg = f"♻️ **Bot Reset!**\n\nHistory wiped ({deleted} messages).\nBalance: $200.00."
+    if failed:
+        shown = ", ".join(str(mid) for _, mid in failed[:20])
+        more = f" (+{len(failed) - 20} more)" if len(failed) > 20 else ""
+        msg += f"\n\n⚠️ Couldn't delete {len(failed)} messages: {shown}{more}"
+        logger.warning(f"Failed to delete messages: {failed}")
+    if status_id:
+        outbox.delete_message(status_chat, status_id)
+    outbox.send_message(msg, PRIORITY_COMMAND)
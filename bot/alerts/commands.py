@@ -0,0 +1,102 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import aiohttp
+from bot.config import Config
+from bot.alerts.telegram import TelegramAlert
+
+logger = logging.getLogger("Commands")
+
+# handler(args, update) -> awaitable
+CommandHandler = Callable[[List[str], Dict[str, Any]], Awaitable[None]]
+
+class CommandDispatcher:
+    """Routes '/name arg1 arg2' messages to registered async handlers."""
+    def __init__(self):
+        self._handlers: Dict[str, CommandHandler] = {}
+
+    def register(self, name: str, handler: CommandHandler):
+        self._handlers[name.lstrip("/").lower()] = handler
+
+    def command(self, name: str):
+        """Decorator form of register()."""
+        def wrap(handler: CommandHandler):
+            self.register(name, handler)
+            return handler
+        return wrap
+
+    @property
+    def commands(self) -> List[str]:
+        return sorted(self._handlers)
+
+    def resolve(self, text: str):
+        """Returns (handler, args) for a command message, or (None, []) if unknown."""
+        parts = text.strip().split()
+        if not parts or not parts[0].startswith("/"):
+            return None, []
+        # Strip "@BotName" suffix used in group chats
+        name = parts[0][1:].split("@", 1)[0].lower()
+        return self._handlers.get(name), parts[1:]
+
+    async def dispatch(self, update: Dict[str, Any]) -> bool:
+        text = (update.get("message") or {}).get("text", "")
+        handler, args = self.resolve(text)
+        if not handler:
+            return False
+        await handler(args, update)
+        return True
+
+class TelegramCommandListener:
+    """
+    Long-polls getUpdates over a persistent session and runs each command
+    in its own task, so replies don't wait on scanning (or on each other).
+    """
+    def __init__(self, dispatcher: CommandDispatcher, offset: int = 0):
+        self.dispatcher = dispatcher
+        self.offset = offset
+        self._tasks = set()
+
+    async def run(self):
+        if not Config.TELEGRAM_ENABLED or not Config.TELEGRAM_BOT_TOKEN:
+            return
+
+        poll_timeout = Config.TELEGRAM_POLL_TIMEOUT
+        timeout = aiohttp.ClientTimeout(total=poll_timeout + Config.REQUEST_TIMEOUT)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            failures = 0
+            while True:
+                updates = await self._poll(session, poll_timeout)
+                if updates is None:
+                    failures += 1
+                    await asyncio.sleep(min(2 ** failures, 60))
+                    continue
+                failures = 0
+                for update in updates:
+                    self.offset = update["update_id"] + 1
+                    task = asyncio.create_task(self._handle(update))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+
+    async def _poll(self, session: aiohttp.ClientSession, poll_timeout: int) -> Optional[List[Dict[str, Any]]]:
+        """One long poll. Returns the updates, or None on error."""
+        params = {"offset": self.offset, "timeout": poll_timeout, "allowed_updates": '["message"]'}
+        try:
+            async with session.get(TelegramAlert.api_url("getUpdates"), params=params) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    return data.get("result", [])
+                if resp.status == 409:
+                    logger.error("getUpdates conflict: another poller or a webhook is active")
+                else:
+                    logger.warning(f"getUpdates failed: {resp.status}")
+        except asyncio.TimeoutError:
+            return []
+        except aiohttp.ClientError as e:
+            logger.warning(f"getUpdates error: {e}")
+        return None
+
+    async def _handle(self, update: Dict[str, Any]):
+        try:
+            await self.dispatcher.dispatch(update)
+        except Exception as e:
+            logger.error(f"Command failed: {e}")
@@ -1,6 +1,8 @@
+import asyncio
 import logging
 from plyer import notification
 from bot.models.token import AnalysisResult
+from bot.alerts.bus import Sink, Notification, DROP_OLDEST
 
 logger = logging.getLogger(__name__)
 
@@ -34,3 +36,13 @@ class DesktopNotifier:
             )
         except Exception as e:
             logger.error(f"Desktop notification failed: {e}")
+
+class DesktopSink(Sink):
+    """Desktop popups for alerts. plyer blocks, so it runs in a worker thread."""
+    name = "desktop"
+    kinds = {"alert"}
+    policy = DROP_OLDEST
+    queue_size = 10 # A popup backlog is useless; keep only the latest few
+
+    async def handle(self, event: Notification):
+        await asyncio.to_thread(DesktopNotifier.send_notification, event.result)
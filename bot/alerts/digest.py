@@ -0,0 +1,89 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional
+from bot.config import Config
+from bot.alerts.outbox import TelegramOutbox, PRIORITY_ALERT
+from bot.alerts.telegram import TelegramAlert
+from bot.models.token import AnalysisResult, Token
+from bot.latency import LATENCY
+
+logger = logging.getLogger("Digest")
+
+# Telegram's sendMessage text limit
+MAX_MESSAGE_LENGTH = 4096
+
+SECTION_TITLES = {
+    "trades": "💼 <b>TRADES</b>",
+    "alerts": "🔔 <b>NEW SIGNALS</b>",
+}
+
+class DigestBuffer:
+    """
+    Sits in front of the outbox and coalesces bursts.
+    The first item opens a window of DIGEST_WINDOW seconds; everything added
+    before it closes goes out as one message (split at Telegram's size limit),
+    sent at the most urgent priority among the merged items.
+    """
+    def __init__(self, outbox: TelegramOutbox, window: Optional[float] = None):
+        self.outbox = outbox
+        self.window = Config.DIGEST_WINDOW if window is None else window
+        self._sections: Dict[str, List[str]] = {name: [] for name in SECTION_TITLES}
+        self._priority: Optional[int] = None
+        self._tokens: List[Token] = [] # Alerted tokens, stamped alert_sent when the digest goes out
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def pending(self) -> int:
+        return sum(len(items) for items in self._sections.values())
+
+    def add(self, section: str, text: str, priority: int = PRIORITY_ALERT):
+        self._sections[section].append(text)
+        self._priority = priority if self._priority is None else min(self._priority, priority)
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.window, self.flush)
+
+    def add_alert(self, result: AnalysisResult, priority: int = PRIORITY_ALERT):
+        self._tokens.append(result.token)
+        self.add("alerts", TelegramAlert.build_alert_line(result), priority)
+
+    def add_trade(self, text: str, priority: int):
+        self.add("trades", text, priority)
+
+    def flush(self):
+        """Sends whatever is buffered. Called by the window timer and on shutdown."""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        if not self.pending():
+            return
+
+        count = self.pending()
+        chunks = self.render()
+        sent = [self.outbox.send_message(chunk, self._priority) for chunk in chunks]
+        # A token counts as alerted when the chunk carrying its line is delivered
+        for token, line in zip(self._tokens, self._sections["alerts"]):
+            future = next((f for chunk, f in zip(chunks, sent) if line in chunk), sent[-1])
+            LATENCY.mark_on_delivery(future, token)
+        logger.info(f"Digest: {count} items in {len(chunks)} message(s)")
+
+        for items in self._sections.values():
+            items.clear()
+        self._tokens.clear()
+        self._priority = None
+
+    def render(self) -> List[str]:
+        """Builds the digest text, splitting on item boundaries to stay under the limit."""
+        chunks, current = [], ""
+        for section, items in self._sections.items():
+            if not items:
+                continue
+            header = f"{SECTION_TITLES[section]} ({len(items)})"
+            for i, item in enumerate(items):
+                entry = f"{header}\n\n{item}" if i == 0 else item
+                if current and len(current) + 2 + len(entry) > MAX_MESSAGE_LENGTH:
+                    chunks.append(current)
+                    # Repeat the section header at the top of the chunk it spills into
+                    current, entry = "", f"{header}\n\n{item}"
+                current = f"{current}\n\n{entry}" if current else entry
+        if current:
+            chunks.append(current)
+        return chunks
@@ -0,0 +1,206 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+import aiohttp
+from bot.config import Config
+from bot.alerts.telegram import TelegramAlert
+from bot.models.token import AnalysisResult
+from bot.metrics import observe_request
+
+logger = logging.getLogger("TelegramOutbox")
+
+# Lower number = sent first
+PRIORITY_TRADE = 0    # TP/SL exits
+PRIORITY_COMMAND = 1  # Replies to /commands, reset housekeeping
+PRIORITY_ALERT = 2    # Token alerts
+PRIORITY_REPORT = 3   # Hourly reports, startup banner, bulk /reset deletes
+
+# Methods that post into a chat and therefore count against the per-chat limit
+CHAT_METHODS = {"sendMessage", "sendPhoto", "editMessageText", "editMessageCaption"}
+
+class _Outgoing:
+    __slots__ = ("priority", "seq", "method", "payload", "future", "log", "attempts")
+
+    def __init__(self, priority, seq, method, payload, future, log):
+        self.priority = priority
+        self.seq = seq
+        self.method = method
+        self.payload = payload
+        self.future = future
+        self.log = log
+        self.attempts = 0
+
+    def __lt__(self, other):
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+class TelegramOutbox:
+    """
+    Outbound Telegram queue drained by one background sender.
+    - Callers never wait: post() returns a Future resolving to the API result (None on failure).
+    - Enforces a global rate and a minimum interval per chat.
+    - 429s pause the sender for `retry_after`; transient errors retry with backoff.
+    - Sent message ids are handed to on_sent(chat_id, message_id) for Database.log_message.
+    """
+    def __init__(self, on_sent: Optional[Callable[[Any, int], None]] = None):
+        self.on_sent = on_sent
+        self._heap = []
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._task: Optional[asyncio.Task] = None
+        self._next_global = 0.0
+        self._next_per_chat: Dict[str, float] = {}
+        self._paused_until = 0.0
+        self._pending = set() # Futures not resolved yet (queued, in flight or waiting to retry)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(Config.TELEGRAM_ENABLED and Config.TELEGRAM_BOT_TOKEN)
+
+    def depth(self) -> int:
+        return len(self._heap)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float = 10.0):
+        """Gives queued messages (exits, alerts, the final digest) a moment to go out, then shuts down."""
+        if self._task and self._pending:
+            await asyncio.wait(list(self._pending), timeout=timeout)
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        # Whatever is left fails like any other undeliverable message
+        left = [future for future in self._pending if not future.done()]
+        if left:
+            logger.warning(f"Outbox didn't drain before shutdown, dropping {len(left)} messages")
+        for future in left:
+            future.set_result(None)
+        self._heap = []
+        if self._session:
+            await self._session.close()
+            self._session = None
+
+    # --- Enqueue API ---
+
+    def post(self, method: str, payload: Dict[str, Any], priority: int = PRIORITY_ALERT,
+             log: bool = True) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        if not self.enabled:
+            future.set_result(None)
+            return future
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        self._push(_Outgoing(priority, next(self._seq), method, payload, future, log))
+        return future
+
+    def send_message(self, text: str, priority: int = PRIORITY_ALERT, log: bool = True) -> asyncio.Future:
+        method, payload = TelegramAlert.build_message(text)
+        return self.post(method, payload, priority, log)
+
+    def send_alert(self, result: AnalysisResult, priority: int = PRIORITY_ALERT,
+                   provisional: bool = False) -> asyncio.Future:
+        method, payload = TelegramAlert.build_alert(result, provisional)
+        return self.post(method, payload, priority)
+
+    def delete_message(self, chat_id, message_id, priority: int = PRIORITY_COMMAND) -> asyncio.Future:
+        return self.post("deleteMessage", {"chat_id": chat_id, "message_id": message_id}, priority, log=False)
+
+    def delete_messages(self, chat_id, message_ids, priority: int = PRIORITY_COMMAND) -> asyncio.Future:
+        """Batch delete (Telegram takes 1-100 ids per call). Resolves True on success."""
+        return self.post("deleteMessages", {"chat_id": chat_id, "message_ids": list(message_ids)}, priority, log=False)
+
+    def edit_message(self, chat_id, message_id, text: str, priority: int = PRIORITY_COMMAND) -> asyncio.Future:
+        payload = {"chat_id": chat_id, "message_id": message_id, "text": text, "parse_mode": "HTML"}
+        return self.post("editMessageText", payload, priority, log=False)
+
+    def _push(self, item: _Outgoing):
+        heapq.heappush(self._heap, item)
+        self._wakeup.set()
+
+    # --- Sender ---
+
+    async def _run(self):
+        self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=Config.REQUEST_TIMEOUT))
+        while True:
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            # Global pacing (and any 429 pause) before picking, so late high-priority items still win
+            await self._sleep_until(max(self._next_global, self._paused_until))
+            item = heapq.heappop(self._heap)
+
+            chat_key = str(item.payload.get("chat_id"))
+            if item.method in CHAT_METHODS:
+                await self._sleep_until(self._next_per_chat.get(chat_key, 0.0))
+
+            now = time.monotonic()
+            self._next_global = now + 1.0 / Config.TELEGRAM_GLOBAL_RATE
+            if item.method in CHAT_METHODS:
+                self._next_per_chat[chat_key] = now + Config.TELEGRAM_CHAT_INTERVAL
+
+            try:
+                await self._send(item)
+            except Exception as e:
+                # Never let one message kill the sender
+                logger.error(f"Telegram {item.method} failed: {e}")
+                self._resolve(item, None)
+
+    async def _sleep_until(self, deadline: float):
+        delay = deadline - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _send(self, item: _Outgoing):
+        item.attempts += 1
+        started = time.perf_counter()
+        try:
+            async with self._session.post(TelegramAlert.api_url(item.method), json=item.payload) as resp:
+                status = resp.status
+                try:
+                    data = await resp.json(content_type=None)
+                except ValueError:
+                    data = None # e.g. a proxy's HTML error page
+            observe_request("telegram", status, started)
+            if not isinstance(data, dict):
+                data = {}
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            observe_request("telegram", "error", started)
+            self._retry(item, f"network error: {e}")
+            return
+
+        if status == 200 and data.get("ok"):
+            result = data.get("result")
+            if item.log and isinstance(result, dict) and result.get("message_id") and self.on_sent:
+                self.on_sent(item.payload.get("chat_id"), result["message_id"])
+            self._resolve(item, result)
+        elif status == 429:
+            retry_after = (data.get("parameters") or {}).get("retry_after", 5)
+            self._paused_until = time.monotonic() + retry_after
+            logger.warning(f"Telegram rate limited, pausing sender for {retry_after}s")
+            self._push(item) # Same priority and sequence, so it keeps its place
+        elif status >= 500:
+            self._retry(item, f"status {status}")
+        else:
+            # 400/403 etc. won't succeed on retry (message too old, bad markup...)
+            logger.error(f"Telegram {item.method} rejected: {status} {data.get('description', '')}")
+            self._resolve(item, None)
+
+    def _retry(self, item: _Outgoing, reason: str):
+        if item.attempts >= Config.MAX_RETRIES:
+            logger.error(f"Telegram {item.method} gave up after {item.attempts} attempts ({reason})")
+            self._resolve(item, None)
+            return
+        delay = Config.RETRY_DELAY_EXPONENT ** item.attempts
+        logger.warning(f"Telegram {item.method} failed ({reason}), retrying in {delay}s")
+        asyncio.get_running_loop().call_later(delay, self._push, item)
+
+    def _resolve(self, item: _Outgoing, result):
+        if not item.future.done():
+            item.future.set_result(result)
@@ -0,0 +1,88 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Optional
+import aiohttp
+from bot.config import Config
+from bot.alerts.bus import Sink, Notification, DROP_NEWEST
+from bot.latency import LATENCY
+
+logger = logging.getLogger("Sinks")
+
+class TelegramSink(Sink):
+    """
+    Hands events to the Telegram outbox (or the digest buffer when digest mode is on).
+    Only enqueues, so it never waits on the Telegram API itself.
+    """
+    name = "telegram"
+
+    def __init__(self, outbox=None, digest=None, **deps):
+        self.outbox = outbox
+        self.digest = digest
+
+    async def handle(self, event: Notification):
+        if event.kind == "trade":
+            if self.digest:
+                self.digest.add_trade(event.text, event.priority)
+            else:
+                self.outbox.send_message(event.text, event.priority)
+        elif self.digest and event.result.action != "HIGH_PRIORITY":
+            # HIGH_PRIORITY skips the digest
+            self.digest.add_alert(event.result, event.priority)
+        else:
+            sent = self.outbox.send_alert(event.result, event.priority)
+            LATENCY.mark_on_delivery(sent, event.result.token)
+
+class WebhookSink(Sink):
+    """POSTs each event as JSON to NOTIFY_WEBHOOK_URL (Discord/Slack relays, n8n, ...)."""
+    name = "webhook"
+
+    def __init__(self, **deps):
+        self.url = Config.NOTIFY_WEBHOOK_URL
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def open(self):
+        if not self.url:
+            logger.warning("Webhook sink enabled but NOTIFY_WEBHOOK_URL is empty")
+        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=Config.REQUEST_TIMEOUT))
+
+    async def close(self):
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+    async def handle(self, event: Notification):
+        if not self.url:
+            return
+        async with self.session.post(self.url, json=event.to_dict()) as resp:
+            if resp.status >= 400:
+                raise RuntimeError(f"webhook returned {resp.status}")
+
+class JsonlSink(Sink):
+    """Appends every event to NOTIFY_JSONL_PATH, one JSON object per line."""
+    name = "jsonl"
+    policy = DROP_NEWEST # Keep the log in order; drop the tail if the disk stalls
+
+    def __init__(self, **deps):
+        self.path = Config.NOTIFY_JSONL_PATH
+        self._file = None
+
+    async def open(self):
+        log_dir = os.path.dirname(self.path)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    async def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    async def handle(self, event: Notification):
+        line = json.dumps(event.to_dict(), default=str) + "\n"
+        await asyncio.to_thread(self._write, line)
+
+    def _write(self, line: str):
+        self._file.write(line)
+        self._file.flush()
@@ -1,6 +1,6 @@
-import aiohttp
 import logging
 import html
+from typing import Tuple, Dict, Any
 from bot.config import Config
 from bot.models.token import AnalysisResult
 
@@ -8,13 +8,16 @@ logger = logging.getLogger(__name__)
 
 class TelegramAlert:
     @staticmethod
-    async def send_alert(result: AnalysisResult):
+    def api_url(method: str) -> str:
+        return f"{Config.TELEGRAM_API_URL}/bot{Config.TELEGRAM_BOT_TOKEN}/{method}"
+
+    @staticmethod
+    def build_alert(result: AnalysisResult, provisional: bool = False) -> Tuple[str, Dict[str, Any]]:
         """
-        Sends a formatted alert to Telegram.
+        Formats an alert. Returns (API method, payload) so it can be sent
+        directly or handed to the outbound queue.
+        provisional=True marks an early alert sent before the security checks finish.
         """
-        if not Config.TELEGRAM_ENABLED or not Config.TELEGRAM_BOT_TOKEN:
-            return
-
         token = result.token
         emoji = "🟢" if result.action == "HIGH_PRIORITY" else "⚠️"
         
@@ -35,8 +38,9 @@ class TelegramAlert:
         safe_name = html.escape(token.base_token_name)
         safe_symbol = html.escape(token.base_token_symbol)
 
+        pending = "⏳ <b>PROVISIONAL</b> - security checks pending\n" if provisional else ""
         message = (
-            f"{emoji} <b>{result.action} {result.score:.0f}/100</b>\n"
+            f"{pending}{emoji} <b>{result.action} {result.score:.0f}/100</b>\n"
             f"🎯 <b>Accuracy/Score: {result.score:.0f}%</b> (Passing: {strict_count}/20)\n\n"
             f"🪙 <b>{safe_name}</b> ({safe_symbol})\n"
             f"<code>{token.base_token_address}</code>\n"
@@ -45,7 +49,7 @@ class TelegramAlert:
             f"🚀 <b>Potential: ${(result.predicted_fdv):,.0f} ({(result.predicted_fdv/token.fdv if token.fdv else 0):.1f}x)</b>\n"
             f"📊 1H Vol: ${token.volume_h1:,.0f} | ⏰ Age: {(result.details.get('token_age_minutes', 0)):.1f}m\n\n"
             f"<b>🛡️ Verified Criteria:</b>\n{passed_text}\n\n"
-            f"📡 <b>Data Sources:</b> DexScreener, GoPlus Security, Moralis\n"
+            f"📡 <b>Data Sources:</b> {'DexScreener' if provisional else 'DexScreener, GoPlus Security, Moralis'}\n"
             f"❌ Failed: {len(result.failed_params)} items\n"
             f"🚩 Risks: {', '.join(result.risk_flags) if result.risk_flags else 'None'}\n\n"
             f"<a href='{token.url}'>🔎 View on DexScreener</a>"
@@ -53,109 +57,50 @@ class TelegramAlert:
         
         # Determine endpoint (Photo or Text)
         if token.icon_url:
-            url = f"https://api.telegram.org/bot{Config.TELEGRAM_BOT_TOKEN}/sendPhoto"
-            payload = {
+            return "sendPhoto", {
                 "chat_id": Config.TELEGRAM_CHAT_ID,
                 "photo": token.icon_url,
                 "caption": message,
                 "parse_mode": "HTML"
             }
-        else:
-            url = f"https://api.telegram.org/bot{Config.TELEGRAM_BOT_TOKEN}/sendMessage"
-            payload = {
-                "chat_id": Config.TELEGRAM_CHAT_ID,
-                "text": message,
-                "parse_mode": "HTML",
-                "disable_web_page_preview": True
-            }
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                # For photo, we use 'json' for params? No, usually params or data for POST
-                # Aiohttp handles json kwarg as JSON body. Telegram API supports JSON for sendMessage
-                # For sendPhoto with URL, JSON body works if keys are correct
-                async with session.post(url, json=payload) as resp:
-                    if resp.status == 200:
-                         data = await resp.json()
-                         return data.get("result", {}).get("message_id")
-                    else:
-                        logger.error(f"Failed to send Telegram alert: {resp.status} {await resp.text()}")
-        except Exception as e:
-            logger.error(f"Error sending Telegram alert: {e}")
-        return None
+        return "sendMessage", {
+            "chat_id": Config.TELEGRAM_CHAT_ID,
+            "text": message,
+            "parse_mode": "HTML",
+            "disable_web_page_preview": True
+        }
 
     @staticmethod
-    async def send_message(text: str):
+    def build_edit(sent: Dict[str, Any], text: str) -> Tuple[str, Dict[str, Any]]:
         """
-        Sends a simple text message. Returns message_id.
+        Edit payload for a message we already sent (the sendMessage/sendPhoto result).
+        Photos carry a caption, so they need editMessageCaption.
         """
-        if not Config.TELEGRAM_ENABLED or not Config.TELEGRAM_BOT_TOKEN:
-            return None
+        payload = {"chat_id": sent["chat"]["id"], "message_id": sent["message_id"], "parse_mode": "HTML"}
+        if "photo" in sent:
+            payload["caption"] = text
+            return "editMessageCaption", payload
+        payload["text"] = text
+        payload["disable_web_page_preview"] = True
+        return "editMessageText", payload
 
-        url = f"https://api.telegram.org/bot{Config.TELEGRAM_BOT_TOKEN}/sendMessage"
-        payload = {
+    @staticmethod
+    def build_alert_line(result: AnalysisResult) -> str:
+        """Compact one-alert entry for digest messages."""
+        token = result.token
+        emoji = "🟢" if result.action == "HIGH_PRIORITY" else "⚠️"
+        risks = f" | 🚩 {html.escape(', '.join(result.risk_flags))}" if result.risk_flags else ""
+        return (
+            f"{emoji} <b>{html.escape(token.base_token_symbol)}</b> {result.score:.0f}/100 on {token.chain_id}\n"
+            f"💧 ${token.liquidity_usd:,.0f} | 🧢 ${token.fdv:,.0f} | ⏰ {(result.details.get('token_age_minutes', 0)):.0f}m{risks}\n"
+            f"<code>{token.base_token_address}</code> <a href='{token.url}'>🔎</a>"
+        )
+
+    @staticmethod
+    def build_message(text: str) -> Tuple[str, Dict[str, Any]]:
+        return "sendMessage", {
             "chat_id": Config.TELEGRAM_CHAT_ID,
             "text": text,
             "parse_mode": "HTML",
             "disable_web_page_preview": True
         }
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return data.get("result", {}).get("message_id")
-                    else:
-                        logger.error(f"Report send failed: {resp.status}")
-        except Exception as e:
-             logger.error(f"Error sending report: {e}")
-        return None
-
-    @staticmethod
-    async def delete_message(chat_id, message_id):
-        if not Config.TELEGRAM_ENABLED or not Config.TELEGRAM_BOT_TOKEN:
-            return
-
-        url = f"https://api.telegram.org/bot{Config.TELEGRAM_BOT_TOKEN}/deleteMessage"
-        payload = {"chat_id": chat_id, "message_id": message_id}
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload) as resp:
-                    # Ignore errors (e.g. message too old or already deleted)
-                    pass 
-        except Exception:
-            pass
-
-    @staticmethod
-    async def get_updates(offset: int = 0):
-        """
-        Polls for new updates (messages).
-        Returns Tuple(updates_list, next_offset)
-        """
-        if not Config.TELEGRAM_ENABLED or not Config.TELEGRAM_BOT_TOKEN:
-            return [], offset
-
-        url = f"https://api.telegram.org/bot{Config.TELEGRAM_BOT_TOKEN}/getUpdates"
-        params = {"offset": offset, "timeout": 1}
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        result = data.get("result", [])
-                        
-                        if not result:
-                            return [], offset
-                            
-                        # Calculate next offset
-                        last_update_id = result[-1]["update_id"]
-                        next_offset = last_update_id + 1
-                        
-                        return result, next_offset
-                    else:
-                        return [], offset
-        except Exception:
-            return [], offset
@@ -5,11 +5,11 @@ import random
 import logging
 from typing import Optional, Dict, Any
 from bot.config import Config
+from bot.metrics import observe_request
 
 logger = logging.getLogger("GoPlus")
 
 class GoPlusClient:
-    BASE_URL = "https://api.gopluslabs.io/api/v1"
     
     # Map DexScreener chain IDs to GoPlus Chain IDs
     CHAIN_MAP = {
@@ -24,6 +24,7 @@ class GoPlusClient:
     }
 
     def __init__(self):
+        self.base_url = Config.GOPLUS_BASE_URL
         self.key = Config.GOPLUS_KEY
         self.secret = Config.GOPLUS_SECRET
         self._token = None
@@ -57,12 +58,14 @@ class GoPlusClient:
             # If not mapped, maybe it's already an ID or unchecked
             goplus_chain_id = chain_id 
 
-        url = f"{self.BASE_URL}/token_security/{goplus_chain_id}"
+        url = f"{self.base_url}/token_security/{goplus_chain_id}"
         params = {"contract_addresses": address}
         
+        started = time.perf_counter()
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.get(url, params=params, timeout=5) as response:
+                    observe_request("goplus", response.status, started)
                     if response.status == 200:
                         data = await response.json()
                         # Structure: {"code": 1, "message": "OK", "result": {"addr": {...}}}
@@ -74,6 +77,7 @@ class GoPlusClient:
                     else:
                         logger.warning(f"GoPlus API Error: {response.status} for {chain_id}:{address}")
         except Exception as e:
+            observe_request("goplus", "error", started)
             logger.error(f"GoPlus request failed: {e}")
             
         return {}
@@ -1,12 +1,13 @@
 import aiohttp
 import logging
+import time
 from typing import Dict, Any, List
 from bot.config import Config
+from bot.metrics import observe_request
 
 logger = logging.getLogger("Moralis")
 
 class MoralisClient:
-    BASE_URL = "https://deep-index.moralis.io/api/v2.2"
     
     # Map DexScreener chain IDs to Moralis Chain Hex/Names
     # Moralis usually takes "eth", "0x1", "bsc", "0x38", "solana"
@@ -22,6 +23,7 @@ class MoralisClient:
     }
 
     def __init__(self):
+        self.base_url = Config.MORALIS_BASE_URL
         self.api_key = Config.MORALIS_API_KEY
         self.headers = {
             "Content-Type": "application/json",
@@ -39,12 +41,14 @@ class MoralisClient:
              # Solana uses different endpoint usually: /solana/
              return {} # Placeholder for Solana if needed
 
-        url = f"{self.BASE_URL}/erc20/{address}/owners"
+        url = f"{self.base_url}/erc20/{address}/owners"
         params = {"chain": chain_id, "limit": 20, "order": "DESC"}
         
+        started = time.perf_counter()
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.get(url, headers=self.headers, params=params) as resp:
+                    observe_request("moralis", resp.status, started)
                     if resp.status == 200:
                         data = await resp.json()
                         # data['result'] list of owners
@@ -55,6 +59,7 @@ class MoralisClient:
                         logger.warning(f"Moralis Holders Error: {resp.status}")
                         return {}
         except Exception as e:
+            observe_request("moralis", "error", started)
             logger.error(f"Moralis request failed: {e}")
             return {}
 
@@ -64,15 +69,18 @@ class MoralisClient:
         Logic: Look for transfers TO current holders or FROM Dex pair.
         """
         chain_id = self.CHAIN_MAP.get(chain.lower(), chain)
-        url = f"{self.BASE_URL}/erc20/{address}/transfers"
+        url = f"{self.base_url}/erc20/{address}/transfers"
         params = {"chain": chain_id, "limit": 50, "order": "DESC"}
         
+        started = time.perf_counter()
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.get(url, headers=self.headers, params=params) as resp:
+                    observe_request("moralis", resp.status, started)
                     if resp.status == 200:
                         data = await resp.json()
                         return data.get("result", [])
                     return []
         except Exception:
+            observe_request("moralis", "error", started)
             return []
@@ -1,11 +1,11 @@
-import time
+from bot.clock import Clock
 from bot.models.token import Token
 
 class ParameterExtractor:
     @staticmethod
     def get_token_age_minutes(token: Token) -> float:
         """1. Token age (minutes)"""
-        now_ms = time.time() * 1000
+        now_ms = Clock.now_ms()
         diff_ms = now_ms - token.pair_created_at
         return max(0, diff_ms / 60000)
 
@@ -1,6 +1,7 @@
 from bot.config import Config
 from bot.models.token import Token
 from bot.analyzer.goplus import GoPlusClient
+from bot.latency import LATENCY
 
 class RiskEngine:
     def __init__(self):
@@ -10,6 +11,15 @@ class RiskEngine:
         """
         Evaluates parameters for specific risk flags, including external Security API.
         """
+        flags = self.check_local_risks(params)
+        flags.extend(await self.check_security_risks(token))
+        token.security_flags = flags
+        return flags
+
+    def check_local_risks(self, params: dict) -> list[str]:
+        """
+        Flags computable from DexScreener data alone (no API calls).
+        """
         flags = []
         
         # 1. Low Liquidity
@@ -28,10 +38,19 @@ class RiskEngine:
         if liq_ratio < 0.05 and liq > 1000:
             flags.append("LOW_LIQUIDITY_RATIO")
 
+        return flags
+
+    async def check_security_risks(self, token: Token) -> list[str]:
+        """
+        Flags from GoPlus (and Moralis when configured).
+        """
+        flags = []
+
         # 3. GoPlus Security Checks
         try:
             sec_data = await self.goplus.check_token_security(token.base_token_address, token.chain_id)
             token.security_data = sec_data # Store for reference
+            LATENCY.mark(token, "goplus")
             
             # A. Honeypot
             if int(sec_data.get("is_honeypot", 0)) == 1:
@@ -97,11 +116,11 @@ class RiskEngine:
                 
                 # Check recent activity
                 transfers = await self.moralis.get_whale_activity(token.base_token_address, token.chain_id)
+                LATENCY.mark(token, "moralis")
                 if transfers:
                     flags.append("WHALE_DATA_AVAILABLE")
                 
         except Exception as e:
             pass
         
-        token.security_flags = flags
         return flags
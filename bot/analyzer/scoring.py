@@ -1,8 +1,26 @@
+import logging
 from typing import Dict, Any, Tuple
 from bot.config import Config
 from bot.models.token import Token, AnalysisResult
 from bot.analyzer.parameters import ParameterExtractor
 from bot.analyzer.risk_flags import RiskEngine
+from bot.metrics import STAGE_SECONDS
+from bot.latency import LATENCY
+
+logger = logging.getLogger("Scoring")
+
+# Risk flags that reject a token whatever its score, with the risk level reported,
+# checked in this order by _determine_classification (shadow strategies gate on the same set)
+HARD_REJECTS = {
+    "CRITICAL_LOW_LIQUIDITY": "CRITICAL",
+    "SCAM_HONEYPOT": "CRITICAL",
+    "CRITICAL_HIGH_TAX": "CRITICAL",
+    "HIGH_TAX": "HIGH",                  # Strict Mode Reject
+    "OWNER_CAN_MINT": "HIGH",            # Strict Mode Reject
+    "LP_NOT_LOCKED": "HIGH",             # Unlocked LP is huge risk for rug pull
+    "HIGH_HOLDER_CONCENTRATION": "HIGH", # Top 10 own too much
+}
+HARD_REJECT_FLAGS = frozenset(HARD_REJECTS)
 
 class ScoringEngine:
     def __init__(self):
@@ -13,14 +31,39 @@ class ScoringEngine:
         """
         Full analysis pipeline: Extraction -> Risk Check -> Scoring -> Result.
         """
+        params, risks = await self.enrich(token)
+        return self.score(token, params, risks)
+
+    async def enrich(self, token: Token) -> Tuple[Dict[str, Any], list]:
+        """Steps 1-2 (the slow, I/O bound part): parameters + risk flags incl. GoPlus/Moralis."""
         # 1. Extract Parameters
         params = ParameterExtractor.extract_all(token)
         
         # 2. Check Risks (Async Security Check)
-        risks = await self.risk_engine.check_risks(token, params)
-        
+        with STAGE_SECONDS.labels("enrich").time():
+            risks = await self.risk_engine.check_risks(token, params)
+        return params, risks
+
+    def score(self, token: Token, params: Dict[str, Any], risks: list) -> AnalysisResult:
+        """Steps 3+ (CPU only): score and classify an enriched token."""
+        with STAGE_SECONDS.labels("score").time():
+            result = self._build_result(token, params, risks)
+        LATENCY.mark(token, "scored")
+        return result
+
+    def prescreen(self, token: Token) -> AnalysisResult:
+        """
+        Local-only analysis (DexScreener data, no security APIs).
+        Security flags can only add rejects/risk, so a token that fails here fails
+        the full analysis too; one that passes is a provisional alert candidate.
+        """
+        params = ParameterExtractor.extract_all(token)
+        risks = self.risk_engine.check_local_risks(params)
+        return self._build_result(token, params, risks, quiet=True)
+
+    def _build_result(self, token: Token, params: Dict[str, Any], risks: list, quiet: bool = False) -> AnalysisResult:
         # 3. Calculate Score
-        score, breakdown = self._calculate_score(params, token)
+        score, breakdown = self._calculate_score(params, token, quiet)
 
         # Apply Penalties
         if "OWNER_CAN_MINT" in risks:
@@ -72,7 +115,12 @@ class ScoringEngine:
              return bool(val)
         except: return default
 
-    def _calculate_score(self, params: Dict[str, Any], token: Token) -> Tuple[float, Dict[str, Any]]:
+    def _weighted(self, category: str, points: float, max_points: float) -> float:
+        """Rescales a category's points from its default maximum to the configured weight."""
+        weight = self._safe_float(self.weights.get(category, max_points), max_points)
+        return points * weight / max_points
+
+    def _calculate_score(self, params: Dict[str, Any], token: Token, quiet: bool = False) -> Tuple[float, Dict[str, Any]]:
         """
         Computes the weighted score (0-100).
         Aggressively validated to prevent TypeErrors.
@@ -86,11 +134,11 @@ class ScoringEngine:
             checklist_score, checklist_breakdown = self._evaluate_checklist(params, token)
             breakdown.update(checklist_breakdown)
             
-            # Reject if < 14 passes (User requested 14/20)
-            if checklist_score < 14:
-                # DEBUG: Show user what is failing so they know it's working
-                if Config.LOG_LEVEL == "INFO":
-                    print(f"DEBUG: Rejected {token.base_token_symbol} - Score {checklist_score}/20")
+            # Reject if below the gate (User requested 14/20)
+            if checklist_score < Config.CHECKLIST_MIN_PASSES:
+                # Per-token detail is DEBUG only; the bot logs a per-cycle reject summary
+                if not quiet:
+                    logger.debug("Rejected %s - Score %d/20", token.base_token_symbol, checklist_score)
                 return 0, breakdown
                 
             # Continue with standard scoring if it passes the "Gate"
@@ -114,6 +162,7 @@ class ScoringEngine:
                 s = 5
             else: # Too old
                 s = 2
+            s = self._weighted("age_quality", s, 10)
             score += s
             breakdown["age_score"] = s
             
@@ -126,6 +175,7 @@ class ScoringEngine:
                 s_liq = 10
             else:
                 s_liq = 0
+            s_liq = self._weighted("liquidity_safety", s_liq, 30)
             score += s_liq
             breakdown["liquidity_score"] = s_liq
             
@@ -136,24 +186,25 @@ class ScoringEngine:
                 s_vol = 15
             else:
                 s_vol = 5
+            s_vol = self._weighted("volume_momentum", s_vol, 30)
             score += s_vol
             breakdown["volume_score"] = s_vol
 
             # --- D. Tokenomics (20%) ---
             if self._safe_bool(params.get("mint_disabled"), True):
-                score += 20
-                breakdown["tokenomics_score"] = 20
+                s_tok = self._weighted("contract_tokenomics", 20, 20)
+                score += s_tok
+                breakdown["tokenomics_score"] = s_tok
             else:
                 breakdown["tokenomics_score"] = 0
 
             # --- E. Behavior (10%) ---
-            score += 10
-            breakdown["behavior_score"] = 10
+            s_beh = self._weighted("behavioral", 10, 10)
+            score += s_beh
+            breakdown["behavior_score"] = s_beh
             
         except Exception as e:
-            print(f"ERROR IN CALCULATE SCORE: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Error in calculate score: {e}")
             return 0.0, {"ERROR": -1}
 
         return min(100.0, score), breakdown
@@ -213,9 +264,7 @@ class ScoringEngine:
                  if v: passed += 1
                  
         except Exception as e:
-            import traceback
-            print(f"DEBUG CHECKLIST ERROR: {e}")
-            traceback.print_exc()
+            logger.exception(f"Checklist error: {e}")
             return 0, {}
             
         # Flatten checks into the return dict so they appear in 'breakdown'
@@ -230,22 +279,9 @@ class ScoringEngine:
         Returns (Action, Risk Level)
         """
         # Hard fail on critical risks
-        if "CRITICAL_LOW_LIQUIDITY" in risks:
-            return "REJECT", "CRITICAL"
-        if "SCAM_HONEYPOT" in risks:
-            return "REJECT", "CRITICAL"
-        if "CRITICAL_HIGH_TAX" in risks:
-            return "REJECT", "CRITICAL"
-        if "HIGH_TAX" in risks: # Strict Mode Reject
-            return "REJECT", "HIGH"
-        if "OWNER_CAN_MINT" in risks: # Strict Mode Reject
-            return "REJECT", "HIGH"
-        if "LP_NOT_LOCKED" in risks:
-             # Unlocked LP is huge risk for rug pull
-            return "REJECT", "HIGH"
-        if "HIGH_HOLDER_CONCENTRATION" in risks:
-             # Top 10 own too much
-            return "REJECT", "HIGH"
+        for flag, level in HARD_REJECTS.items():
+            if flag in risks:
+                return "REJECT", level
             
         risk_level = "LOW" if not risks else "MEDIUM"
         if len(risks) >= 2:
@@ -0,0 +1,93 @@
+import random
+from typing import Any, Dict, List, Optional
+from bot.clock import Clock
+
+# Synthetic upstream payloads shaped like the real DexScreener / GoPlus / Moralis
+# responses. Seeded, so a given (seed, index) always yields the same pair and
+# benchmark runs stay comparable.
+
+CHAINS = ("solana", "ethereum", "bsc", "base")
+
+def _address(rng: random.Random, chain: str) -> str:
+    if chain == "solana":
+        alphabet = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+        return "".join(rng.choice(alphabet) for _ in range(44))
+    return "0x" + "".join(rng.choice("0123456789abcdef") for _ in range(40))
+
+def make_pair(index: int, seed: int = 0, now_ms: Optional[float] = None) -> Dict[str, Any]:
+    """One /latest/dex/pairs-style pair object."""
+    rng = random.Random(f"{seed}:{index}")
+    chain = CHAINS[index % len(CHAINS)]
+    now_ms = Clock.now_ms() if now_ms is None else now_ms
+    price = 10 ** rng.uniform(-9, -2)
+    liquidity = 10 ** rng.uniform(2.5, 5.5)
+    fdv = liquidity * rng.uniform(1.5, 20)
+    volume_h1 = fdv * rng.uniform(0, 0.6)
+    buys = rng.randint(0, 800)
+    return {
+        "chainId": chain,
+        "dexId": "raydium" if chain == "solana" else "uniswap",
+        "url": f"https://dexscreener.com/{chain}/pair{index}",
+        "pairAddress": f"pair{seed}x{index}",
+        "baseToken": {"address": _address(rng, chain), "name": f"Token {index}", "symbol": f"T{index}"},
+        "quoteToken": {"address": _address(rng, chain), "symbol": "SOL" if chain == "solana" else "WETH"},
+        "priceUsd": f"{price:.12f}",
+        "liquidity": {"usd": liquidity},
+        "fdv": fdv,
+        "pairCreatedAt": int(now_ms - rng.uniform(0.5, 600) * 60000),
+        "volume": {"h1": volume_h1, "h6": volume_h1 * 4, "h24": volume_h1 * 10},
+        "priceChange": {"h1": rng.uniform(-60, 300), "h6": rng.uniform(-80, 800), "h24": rng.uniform(-90, 2000)},
+        "txns": {"h1": {"buys": buys, "sells": int(buys * rng.uniform(0.3, 1.5))}},
+        "info": {
+            "websites": [{"url": f"https://t{index}.example"}] if rng.random() < 0.6 else [],
+            "socials": [{"type": "twitter", "url": f"https://x.com/t{index}"}] if rng.random() < 0.7 else [],
+        },
+    }
+
+def make_profile(pair: Dict[str, Any]) -> Dict[str, Any]:
+    """The /token-profiles/latest/v1 entry that announces a pair's base token."""
+    return {
+        "chainId": pair["chainId"],
+        "tokenAddress": pair["baseToken"]["address"],
+        "icon": f"https://cdn.example/{pair['baseToken']['symbol']}.png",
+        "url": pair["url"],
+    }
+
+def make_security(address: str, seed: int = 0) -> Dict[str, Any]:
+    """GoPlus token_security result for one contract (the value under result[address])."""
+    rng = random.Random(f"{seed}:sec:{address}")
+    holders = [{"address": _address(rng, "ethereum"), "percent": f"{rng.uniform(0, 0.12):.4f}"} for _ in range(10)]
+    locked = rng.random() < 0.6
+    return {
+        "is_honeypot": "1" if rng.random() < 0.05 else "0",
+        "buy_tax": f"{rng.choice((0, 0, 0, 0.05, 0.1, 0.35, 0.6)):.2f}",
+        "sell_tax": f"{rng.choice((0, 0, 0, 0.05, 0.1, 0.35, 0.6)):.2f}",
+        "is_open_source": "1" if rng.random() < 0.8 else "0",
+        "owner_change_balance": "1" if rng.random() < 0.05 else "0",
+        "holder_count": str(rng.randint(5, 3000)),
+        "holders": holders,
+        "lp_holders": [{
+            "address": "0x000000000000000000000000000000000000dead" if locked else _address(rng, "ethereum"),
+            "is_locked": 1 if locked else 0,
+            "percent": f"{rng.uniform(0.5, 1.0):.4f}",
+        }],
+    }
+
+def make_transfers(address: str, count: int = 50, seed: int = 0) -> List[Dict[str, Any]]:
+    """Moralis /erc20/{address}/transfers result list."""
+    rng = random.Random(f"{seed}:tx:{address}")
+    return [{
+        "token_address": address,
+        "from_address": _address(rng, "ethereum"),
+        "to_address": _address(rng, "ethereum"),
+        "value": str(rng.randint(10 ** 18, 10 ** 24)),
+    } for _ in range(rng.randint(0, count))]
+
+def make_owners(address: str, count: int = 20, seed: int = 0) -> List[Dict[str, Any]]:
+    """Moralis /erc20/{address}/owners result list."""
+    rng = random.Random(f"{seed}:own:{address}")
+    return [{
+        "owner_address": _address(rng, "ethereum"),
+        "balance": str(rng.randint(10 ** 18, 10 ** 24)),
+        "percentage_relative_to_total_supply": rng.uniform(0, 15),
+    } for _ in range(count)]
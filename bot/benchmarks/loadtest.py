@@ -0,0 +1,43 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+
+# Allow `python bot/benchmarks/loadtest.py` as well as `python -m bot.benchmarks.loadtest`
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from bot.benchmarks.macro import run_cycles
+from bot.benchmarks.standin import add_fault_arguments, faults_from_args
+from bot.simulator.backtest import parse_settings
+
+# Scale test: Bot cycles against a synthetic feed of any size with injected
+# latency/429/5xx/timeouts, reporting throughput and tail latency.
+#
+#   python -m bot.benchmarks.loadtest --pairs 1000 --cycles 3 --latency-ms 80 --latency-sigma 0.6 --p429 0.02
+#
+# For 10k+ pairs, run the stand-in in its own process so generating the feed
+# doesn't share the bot's event loop:
+#   python -m bot.benchmarks.standin --pairs 100000 --p5xx 0.01 &
+#   python -m bot.benchmarks.loadtest --upstream http://127.0.0.1:8900 --pairs 100000
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run Bot cycles against the stand-in upstreams at scale.")
+    parser.add_argument("--pairs", type=int, default=1000, help="New pairs per cycle (10 to 100k)")
+    parser.add_argument("--cycles", type=int, default=3)
+    parser.add_argument("--upstream", help="Base URL of a stand-in started separately (fault flags then go to it)")
+    parser.add_argument("--set", dest="settings", action="append", default=[],
+                        help="Override a bot setting, e.g. --set REQUEST_TIMEOUT=5")
+    parser.add_argument("--out", help="Also write the report to this JSON file")
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    report = asyncio.run(run_cycles(args.cycles, args.pairs, faults_from_args(args),
+                                    args.upstream, parse_settings(args.settings)))
+    text = json.dumps(report, indent=2, default=str)
+    print(text)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text)
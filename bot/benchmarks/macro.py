@@ -0,0 +1,99 @@
+import asyncio
+import logging
+import os
+import statistics
+import tempfile
+import time
+from typing import Any, Dict, Optional
+from bot.benchmarks.standin import FaultProfile, StandInServer, standin_urls
+from bot.simulator.backtest import config_overrides
+
+# End-to-end: full Bot.run_cycle() passes (scrape -> enrich -> score ->
+# alert/trade -> checkpoint) against the local stand-in upstreams.
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round((len(ordered) - 1) * pct / 100)))]
+
+async def run_cycles(cycles: int, pairs_per_cycle: int = 30, faults: Optional[Dict[str, FaultProfile]] = None,
+                     upstream: Optional[str] = None, settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Runs `cycles` Bot cycles and returns throughput and cycle-time percentiles.
+    upstream = base URL of a stand-in started separately (python -m bot.benchmarks.standin),
+    which keeps pair generation off the bot's event loop for big feeds; otherwise
+    one is started in-process with `faults`.
+    """
+    server = None
+    if upstream is None:
+        server = StandInServer(pairs_per_cycle, faults=faults)
+        upstream = await server.start()
+    overrides = {
+        **standin_urls(upstream),
+        "TELEGRAM_ENABLED": True,
+        "TELEGRAM_BOT_TOKEN": "bench",
+        "TELEGRAM_GLOBAL_RATE": 10000,
+        "TELEGRAM_CHAT_INTERVAL": 0,
+        "MORALIS_API_KEY": "bench",
+        "NOTIFY_SINKS": ["telegram"],
+        "SNAPSHOT_ARCHIVE": "",
+        "STRATEGIES": {"main": {}},
+        "DIGEST_MODE": False,
+        "PROGRESSIVE_ALERTS": False,
+        "LOG_LEVEL": "WARNING",
+        **(settings or {}),
+    }
+    # Bot keeps its SQLite files under bot/storage/ relative to the cwd
+    cwd = os.getcwd()
+    os.chdir(tempfile.mkdtemp(prefix="bench-macro-"))
+    try:
+        with config_overrides(overrides):
+            from bot.main import Bot
+            from bot.latency import LATENCY
+            from bot.metrics import provider_health
+            bot = Bot()
+            bot.last_report_time = time.time() # No hourly report mid-run
+            bot.outbox.start()
+            bot.bus.start()
+            timings, analyzed = [], 0
+            try:
+                for _ in range(cycles):
+                    started = time.perf_counter()
+                    tokens = await bot.run_cycle()
+                    timings.append(time.perf_counter() - started)
+                    analyzed += len(tokens)
+            finally:
+                await bot.bus.stop()
+                await bot.outbox.stop()
+    finally:
+        os.chdir(cwd)
+        if server:
+            await server.stop()
+
+    total = sum(timings)
+    scored = LATENCY.summary().get("all", {}).get("scored", {}).get("since_feed", {})
+    return {
+        "cycles": cycles,
+        "pairs_per_cycle": pairs_per_cycle,
+        "tokens": analyzed,
+        "cycle_s_median": statistics.median(timings),
+        "cycle_s_p95": percentile(timings, 95),
+        "cycle_s_p99": percentile(timings, 99),
+        "cycle_s_max": max(timings),
+        "tokens_per_s": analyzed / total if total else 0.0,
+        # Per token: first seen in the feed -> scored
+        "feed_to_scored_s": {k: scored.get(k) for k in ("p50", "p90", "p99")},
+        "providers": {name: {k: h[k] for k in ("requests", "errors", "by_status")}
+                      for name, h in provider_health().items()},
+        "upstream": server.stats() if server else None,
+    }
+
+def run_macro(cycles: int = 5, sizes=(30, 300)) -> Dict[str, Dict[str, Any]]:
+    logging.getLogger().setLevel(logging.WARNING)
+    results = {}
+    for size in sizes:
+        name = f"bot_cycle_{size}"
+        results[name] = asyncio.run(run_cycles(cycles, size))
+        r = results[name]
+        print(f"  {name:<22} median {r['cycle_s_median'] * 1000:,.0f} ms, p95 {r['cycle_s_p95'] * 1000:,.0f} ms, "
+              f"{r['tokens_per_s']:,.0f} tokens/s")
+    return results
@@ -0,0 +1,162 @@
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+from bot.analyzer.parameters import ParameterExtractor
+from bot.analyzer.risk_flags import RiskEngine
+from bot.analyzer.scoring import ScoringEngine
+from bot.benchmarks.fixtures import make_pair, make_security
+from bot.scraper.dex_scraper import DexScraper
+from bot.simulator.backtest import ReplayGoPlus, ReplayMoralis
+from bot.simulator.trader import PaperTrader
+from bot.storage.db import Database
+
+# Hot-path micro benchmarks. Each one is set up once, then fn(n) runs n
+# operations; the runner calibrates n so a repeat takes ~min_time seconds
+# and reports ns/op (median and best of the repeats).
+
+SAMPLE_SIZE = 500 # Distinct synthetic pairs cycled through, so branches vary
+
+BENCHMARKS: List[Tuple[str, Callable[[], Callable[[int], None]]]] = []
+
+def benchmark(name: str):
+    def register(setup):
+        BENCHMARKS.append((name, setup))
+        return setup
+    return register
+
+def _tokens():
+    scraper = DexScraper()
+    return [scraper._normalize_pair(make_pair(i)) for i in range(SAMPLE_SIZE)]
+
+@benchmark("normalize_pair")
+def _normalize_pair():
+    scraper = DexScraper()
+    pairs = [make_pair(i) for i in range(SAMPLE_SIZE)]
+    def run(n):
+        for i in range(n):
+            scraper._normalize_pair(pairs[i % SAMPLE_SIZE])
+    return run
+
+@benchmark("extract_all")
+def _extract_all():
+    tokens = _tokens()
+    def run(n):
+        for i in range(n):
+            ParameterExtractor.extract_all(tokens[i % SAMPLE_SIZE])
+    return run
+
+@benchmark("evaluate_checklist")
+def _evaluate_checklist():
+    engine = ScoringEngine()
+    tokens = _tokens()
+    params = [ParameterExtractor.extract_all(t) for t in tokens]
+    def run(n):
+        for i in range(n):
+            engine._evaluate_checklist(params[i % SAMPLE_SIZE], tokens[i % SAMPLE_SIZE])
+    return run
+
+@benchmark("calculate_score")
+def _calculate_score():
+    engine = ScoringEngine()
+    tokens = _tokens()
+    params = [ParameterExtractor.extract_all(t) for t in tokens]
+    def run(n):
+        for i in range(n):
+            engine._calculate_score(params[i % SAMPLE_SIZE], tokens[i % SAMPLE_SIZE], quiet=True)
+    return run
+
+@benchmark("risk_flags_local")
+def _risk_flags_local():
+    engine = RiskEngine()
+    params = [ParameterExtractor.extract_all(t) for t in _tokens()]
+    def run(n):
+        for i in range(n):
+            engine.check_local_risks(params[i % SAMPLE_SIZE])
+    return run
+
+@benchmark("risk_flags_goplus")
+def _risk_flags_goplus():
+    # Flag derivation on canned GoPlus payloads (no network)
+    engine = RiskEngine()
+    engine.goplus = ReplayGoPlus()
+    engine.moralis = ReplayMoralis()
+    tokens = _tokens()
+    for token in tokens:
+        address = token.base_token_address.lower()
+        engine.goplus.results[address] = make_security(address)
+    loop = asyncio.new_event_loop()
+
+    async def batch(n):
+        for i in range(n):
+            await engine.check_security_risks(tokens[i % SAMPLE_SIZE])
+
+    def run(n):
+        loop.run_until_complete(batch(n))
+    return run
+
+@benchmark("update_positions")
+def _update_positions():
+    # 200 open positions, ticks of all 500 sample pairs, prices inside SL/TP
+    scraper = DexScraper()
+    trader = PaperTrader(db_path=None, settings={"MAX_OPEN_POSITIONS": 10 ** 6})
+    trader.reset_portfolio(initial_balance=10 ** 9)
+    tokens = _tokens()
+    held = tokens[:200]
+    for token in held:
+        trader.enter_trade(token)
+    ticks = []
+    for factor in (1.05, 0.95):
+        tick = {}
+        for token in tokens:
+            moved = scraper._normalize_pair(token.raw_data)
+            moved.price_usd = token.price_usd * factor
+            tick[moved.pair_address] = moved
+        ticks.append(tick)
+    def run(n):
+        for i in range(n):
+            trader.update_positions(ticks[i % 2])
+        trader._journal.clear()
+    return run
+
+@benchmark("db_seen_check")
+def _db_seen_check():
+    # Half hits, half misses against 10k seen pairs
+    path = os.path.join(tempfile.mkdtemp(prefix="bench-db-"), "cache.db")
+    db = Database(path)
+    for i in range(10000):
+        db.mark_seen(f"seen{i}", "solana")
+    keys = [f"seen{i * 7 % 10000}" if i % 2 else f"new{i}" for i in range(1000)]
+    def run(n):
+        for i in range(n):
+            db.is_seen(keys[i % 1000])
+    return run
+
+def measure(run: Callable[[int], None], repeat: int = 5, min_time: float = 0.2) -> Dict[str, float]:
+    # Calibrate: grow n until one batch takes at least min_time
+    n = 1
+    while True:
+        started = time.perf_counter()
+        run(n)
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or n >= 10 ** 7:
+            break
+        n *= 10 if elapsed < min_time / 10 else 2
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run(n)
+        timings.append((time.perf_counter() - started) / n * 1e9)
+    return {"ns_per_op": statistics.median(timings), "best_ns": min(timings), "n": n, "repeat": repeat}
+
+def run_micro(selected: List[str] = None, repeat: int = 5, min_time: float = 0.2) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name, setup in BENCHMARKS:
+        if selected and name not in selected:
+            continue
+        results[name] = measure(setup(), repeat, min_time)
+        print(f"  {name:<22} {results[name]['ns_per_op']:>14,.0f} ns/op")
+    return results
@@ -0,0 +1,103 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+# Allow `python bot/benchmarks/run.py` as well as `python -m bot.benchmarks.run`
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# Every run is saved under results/ and compared against the committed baseline.json
+# (a reference run; its "meta" records commit and machine). Regenerate it on purpose after an
+# intended performance change, or when benchmarking on different hardware:
+#   python -m bot.benchmarks.run --suite all --save-baseline
+# Exit codes: 0 ok, 1 regression, 2 no baseline to compare against.
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+
+# Metric compared against the baseline per suite (lower is better for both)
+PRIMARY_METRIC = {"micro": "ns_per_op", "macro": "cycle_s_median"}
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return ""
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Prints a comparison table; returns the names of benchmarks slower than baseline by > threshold."""
+    regressions = []
+    print(f"\nvs baseline {baseline.get('meta', {}).get('commit', '?')} (threshold {threshold:.0%}):")
+    for suite, metric in PRIMARY_METRIC.items():
+        for name, result in current.get(suite, {}).items():
+            before = baseline.get(suite, {}).get(name, {}).get(metric)
+            if not before:
+                print(f"  {name:<22} (no baseline)")
+                continue
+            change = result[metric] / before - 1
+            mark = ""
+            if change > threshold:
+                mark = "  <-- REGRESSION"
+                regressions.append(name)
+            elif change < -threshold:
+                mark = "  (faster)"
+            print(f"  {name:<22} {before:>14.6g} -> {result[metric]:<14.6g} {change:+7.1%}{mark}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Hot-path micro benchmarks and full-cycle macro benchmarks.")
+    parser.add_argument("--suite", choices=("micro", "macro", "all"), default="micro")
+    parser.add_argument("--only", action="append", default=[], help="Run just these micro benchmarks")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per micro repeat")
+    parser.add_argument("--cycles", type=int, default=5, help="Bot cycles per macro run")
+    parser.add_argument("--sizes", default="30,300", help="Pairs per cycle for the macro runs")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Slowdown that counts as a regression")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {"meta": {
+        "ts": time.time(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+    }}
+    if args.suite in ("micro", "all"):
+        from bot.benchmarks.micro import run_micro
+        print("micro:")
+        results["micro"] = run_micro(args.only, args.repeat, args.min_time)
+    if args.suite in ("macro", "all"):
+        from bot.benchmarks.macro import run_macro
+        print("macro:")
+        results["macro"] = run_macro(args.cycles, [int(s) for s in args.sizes.split(",")])
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    out_path = os.path.join(RESULTS_DIR, time.strftime("%Y%m%d-%H%M%S") + ".json")
+    with open(out_path, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nSaved {out_path}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline updated: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; nothing to compare against. "
+              f"Create one with --save-baseline.", file=sys.stderr)
+        sys.exit(2)
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if compare(results, baseline, args.threshold):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+import argparse
+import asyncio
+import itertools
+import logging
+import random
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional
+from aiohttp import web
+from bot.benchmarks.fixtures import make_owners, make_pair, make_profile, make_security, make_transfers
+
+logger = logging.getLogger("StandIn")
+
+UPSTREAMS = ("dex", "goplus", "moralis", "telegram")
+
+@dataclass
+class FaultProfile:
+    """
+    What one upstream does besides answering correctly.
+    Latency is lognormal around latency_ms (sigma 0 = fixed); then each request
+    independently becomes a 429, a 5xx, or a hang of hang_s (client-side timeout).
+    """
+    latency_ms: float = 0.0
+    latency_sigma: float = 0.0
+    p429: float = 0.0
+    p5xx: float = 0.0
+    ptimeout: float = 0.0
+    hang_s: float = 30.0
+    retry_after: int = 1
+
+    def delay(self, rng: random.Random) -> float:
+        if self.latency_ms <= 0:
+            return 0.0
+        if self.latency_sigma <= 0:
+            return self.latency_ms / 1000
+        return rng.lognormvariate(0, self.latency_sigma) * self.latency_ms / 1000
+
+    @classmethod
+    def parse(cls, spec: str, base: Optional["FaultProfile"] = None) -> "FaultProfile":
+        """'p429=0.05,latency_ms=200' on top of base's values."""
+        values = dict(vars(base)) if base else {}
+        for item in filter(None, spec.split(",")):
+            key, _, raw = item.partition("=")
+            if key.strip() not in cls.__dataclass_fields__:
+                raise KeyError(f"Unknown fault setting: {key}")
+            values[key.strip()] = float(raw)
+        return cls(**values)
+
+def standin_urls(base_url: str) -> Dict[str, str]:
+    """Config overrides for a stand-in at base_url (in-process or started separately)."""
+    return {
+        "DEXSCREENER_BASE_URL": f"{base_url}/dex",
+        "GOPLUS_BASE_URL": f"{base_url}/goplus",
+        "MORALIS_BASE_URL": f"{base_url}/moralis",
+        "TELEGRAM_API_URL": f"{base_url}/telegram",
+    }
+
+class StandInServer:
+    """
+    Local stand-in for DexScreener, GoPlus, Moralis and the Telegram Bot API.
+    Every profile-feed request announces `pairs_per_cycle` new synthetic pairs;
+    detail, security and Telegram calls answer from the same generated data.
+    Point the bot at it through the *_BASE_URL settings (see urls()).
+    faults maps an upstream ("dex", "goplus", "moralis", "telegram") to the
+    FaultProfile injected in front of it. Only the last `retain_cycles` batches
+    are kept, so 100k-pair cycles don't grow memory without bound.
+    """
+    def __init__(self, pairs_per_cycle: int = 30, seed: int = 0,
+                 faults: Optional[Dict[str, FaultProfile]] = None, retain_cycles: int = 3):
+        self.pairs_per_cycle = pairs_per_cycle
+        self.seed = seed
+        self.faults = faults or {}
+        self.cycle = 0
+        self.pairs_by_token: Dict[str, dict] = {}
+        self.pairs_by_address: Dict[str, dict] = {}
+        self._batches: Deque[List[dict]] = deque()
+        self.retain_cycles = retain_cycles
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.responses: Counter = Counter() # (upstream, status or "timeout")
+        self.telegram_sent: List[dict] = []
+        self._message_ids = itertools.count(1)
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url = ""
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._inject_faults])
+        app.router.add_get("/dex/token-profiles/latest/v1", self.profiles)
+        app.router.add_get("/dex/latest/dex/tokens/{address}", self.token_pairs)
+        app.router.add_get("/dex/latest/dex/pairs/{chain}/{addresses}", self.pairs)
+        app.router.add_get("/goplus/token_security/{chain}", self.token_security)
+        app.router.add_get("/moralis/erc20/{address}/owners", self.owners)
+        app.router.add_get("/moralis/erc20/{address}/transfers", self.transfers)
+        app.router.add_post("/telegram/{bot}/{method}", self.telegram)
+        return app
+
+    def urls(self) -> Dict[str, str]:
+        """Config overrides that route the bot here."""
+        return standin_urls(self.base_url)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1] # Actual port when port=0
+        self.base_url = f"http://{host}:{port}"
+        logger.info(f"Stand-in upstreams on {self.base_url}")
+        return self.base_url
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    # --- Faults ---
+
+    @web.middleware
+    async def _inject_faults(self, request, handler):
+        upstream = request.path.split("/", 2)[1]
+        fault = self.faults.get(upstream)
+        if fault is None:
+            response = await handler(request)
+            self.responses[(upstream, response.status)] += 1
+            return response
+
+        delay = fault.delay(self.rng)
+        if delay:
+            await asyncio.sleep(delay)
+        roll = self.rng.random()
+        if roll < fault.ptimeout:
+            self.responses[(upstream, "timeout")] += 1
+            await asyncio.sleep(fault.hang_s) # Outlive the client's timeout
+            return web.Response(status=504)
+        roll -= fault.ptimeout
+        if roll < fault.p429:
+            self.responses[(upstream, 429)] += 1
+            return self._rate_limited(upstream, fault)
+        roll -= fault.p429
+        if roll < fault.p5xx:
+            status = self.rng.choice((500, 502, 503))
+            self.responses[(upstream, status)] += 1
+            return web.json_response({"error": "injected"}, status=status)
+
+        response = await handler(request)
+        self.responses[(upstream, response.status)] += 1
+        return response
+
+    @staticmethod
+    def _rate_limited(upstream: str, fault: FaultProfile) -> web.Response:
+        retry_after = int(fault.retry_after)
+        if upstream == "telegram":
+            return web.json_response({"ok": False, "error_code": 429, "description": "Too Many Requests",
+                                      "parameters": {"retry_after": retry_after}}, status=429)
+        return web.json_response({"error": "rate limited"}, status=429, headers={"Retry-After": str(retry_after)})
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        out: Dict[str, Dict[str, int]] = {}
+        for (upstream, status), count in self.responses.items():
+            out.setdefault(upstream, {})[str(status)] = count
+        return out
+
+    # --- Data ---
+
+    def next_batch(self) -> List[dict]:
+        """Generates the pairs announced by the next feed poll."""
+        start = self.cycle * self.pairs_per_cycle
+        self.cycle += 1
+        batch = [make_pair(i, self.seed) for i in range(start, start + self.pairs_per_cycle)]
+        for pair in batch:
+            self.pairs_by_token[pair["baseToken"]["address"]] = pair
+            self.pairs_by_address[pair["pairAddress"]] = pair
+        self._batches.append(batch)
+        while len(self._batches) > self.retain_cycles:
+            for pair in self._batches.popleft():
+                self.pairs_by_token.pop(pair["baseToken"]["address"], None)
+                self.pairs_by_address.pop(pair["pairAddress"], None)
+        return batch
+
+    # --- Handlers ---
+
+    async def profiles(self, request):
+        self.requests += 1
+        return web.json_response([make_profile(pair) for pair in self.next_batch()])
+
+    async def token_pairs(self, request):
+        self.requests += 1
+        pair = self.pairs_by_token.get(request.match_info["address"])
+        return web.json_response({"schemaVersion": "1.0.0", "pairs": [pair] if pair else None})
+
+    async def pairs(self, request):
+        self.requests += 1
+        found = [self.pairs_by_address[a] for a in request.match_info["addresses"].split(",") if a in self.pairs_by_address]
+        return web.json_response({"schemaVersion": "1.0.0", "pairs": found})
+
+    async def token_security(self, request):
+        self.requests += 1
+        addresses = request.query.get("contract_addresses", "").split(",")
+        return web.json_response({"code": 1, "message": "OK", "result": {
+            a.lower(): make_security(a.lower(), self.seed) for a in addresses if a}})
+
+    async def owners(self, request):
+        self.requests += 1
+        return web.json_response({"result": make_owners(request.match_info["address"], seed=self.seed)})
+
+    async def transfers(self, request):
+        self.requests += 1
+        return web.json_response({"result": make_transfers(request.match_info["address"], seed=self.seed)})
+
+    async def telegram(self, request):
+        self.requests += 1
+        method = request.match_info["method"]
+        payload = await request.json() if request.can_read_body else {}
+        if method == "getUpdates":
+            await asyncio.sleep(min(float(payload.get("timeout", 0) or 0), 1.0))
+            return web.json_response({"ok": True, "result": []})
+        self.telegram_sent.append({"method": method, **payload})
+        if method.startswith("send"):
+            return web.json_response({"ok": True, "result": {
+                "message_id": next(self._message_ids), "chat": {"id": payload.get("chat_id")}}})
+        return web.json_response({"ok": True, "result": True})
+
+def add_fault_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Median injected latency (all upstreams)")
+    parser.add_argument("--latency-sigma", type=float, default=0.0, help="Lognormal sigma (0 = fixed latency)")
+    parser.add_argument("--p429", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--p5xx", type=float, default=0.0, help="Share of requests answered with 500/502/503")
+    parser.add_argument("--ptimeout", type=float, default=0.0, help="Share of requests that hang past the client timeout")
+    parser.add_argument("--hang", type=float, default=30.0, help="Seconds a 'timeout' request hangs")
+    parser.add_argument("--fault", action="append", default=[],
+                        help="Per-upstream override, e.g. --fault goplus:p429=0.2,latency_ms=400")
+
+def faults_from_args(args) -> Dict[str, FaultProfile]:
+    base = FaultProfile(args.latency_ms, args.latency_sigma, args.p429, args.p5xx, args.ptimeout, args.hang)
+    faults = {name: base for name in UPSTREAMS} if base != FaultProfile(hang_s=args.hang) else {}
+    for spec in args.fault:
+        upstream, _, settings = spec.partition(":")
+        if upstream not in UPSTREAMS:
+            raise KeyError(f"Unknown upstream: {upstream} (one of {', '.join(UPSTREAMS)})")
+        faults[upstream] = FaultProfile.parse(settings, faults.get(upstream, base))
+    return faults
+
+async def serve(args):
+    server = StandInServer(args.pairs, args.seed, faults_from_args(args))
+    await server.start(args.host, args.port)
+    for key, url in server.urls().items():
+        print(f"{key}={url}")
+    while True:
+        await asyncio.sleep(10)
+        logger.info(f"cycle {server.cycle}, {server.requests} requests: {server.stats()}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the stand-in upstream server on its own.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--pairs", type=int, default=30, help="New pairs announced per feed poll (10 to 100k)")
+    parser.add_argument("--seed", type=int, default=0)
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
@@ -1,4 +1,5 @@
 import os
+import json
 
 class Config:
     # --- API ---
@@ -12,6 +13,12 @@ class Config:
     # Many bots scrape `https://api.dexscreener.com/token-profiles/latest/v1` or use the `search` endpoint.
     # We will use the standard public API root for now.
     
+    # Upstream roots; override to point the bot at a stand-in server (benchmarks, load tests)
+    DEXSCREENER_BASE_URL = os.getenv("DEXSCREENER_BASE_URL", "https://api.dexscreener.com")
+    GOPLUS_BASE_URL = os.getenv("GOPLUS_BASE_URL", "https://api.gopluslabs.io/api/v1")
+    MORALIS_BASE_URL = os.getenv("MORALIS_BASE_URL", "https://deep-index.moralis.io/api/v2.2")
+    TELEGRAM_API_URL = os.getenv("TELEGRAM_API_URL", "https://api.telegram.org")
+
     # --- SCRAPER ---
     REQUEST_TIMEOUT = 10
     MAX_RETRIES = 3
@@ -32,6 +39,7 @@ class Config:
     SCORE_ALERT_MIN = 90 # Strict: Only >90
     SCORE_ALERT_MAX = 98
     SCORE_HIGH_PRIORITY = 99 # Pretty much perfect only
+    CHECKLIST_MIN_PASSES = 14 # Strict gate: 14/20 checklist items must pass
     
     # --- 20-PARAMETER CONFIG ---
     # Define weights or thresholds here
@@ -48,10 +56,101 @@ class Config:
         "behavioral": 10
     }
 
+    # --- DISCOVERY ---
+    # Seconds between profile-feed polls
+    DISCOVERY_INTERVAL = float(os.getenv("DISCOVERY_INTERVAL", 30)) # Starting point when adaptive
+    # Adaptive polling: faster while new profiles keep arriving, slower when the feed is idle
+    # or DexScreener answers 429, always within the MIN/MAX bounds. false = fixed DISCOVERY_INTERVAL.
+    ADAPTIVE_POLLING = os.getenv("ADAPTIVE_POLLING", "true").lower() == "true"
+    DISCOVERY_MIN_INTERVAL = float(os.getenv("DISCOVERY_MIN_INTERVAL", 5))
+    DISCOVERY_MAX_INTERVAL = float(os.getenv("DISCOVERY_MAX_INTERVAL", 120))
+    DISCOVERY_TARGET_NEW = float(os.getenv("DISCOVERY_TARGET_NEW", 5)) # New profiles wanted per poll
+    DEXSCREENER_RATE_BUDGET = float(os.getenv("DEXSCREENER_RATE_BUDGET", 240)) # Requests/minute we allow ourselves
+    # Pipeline mode: poll -> detail -> enrich -> score -> act as concurrent stages over bounded
+    # queues (backpressure when a stage falls behind). false = the old one-cycle-at-a-time loop.
+    PIPELINE = os.getenv("PIPELINE", "true").lower() == "true"
+    # Workers per stage (act is always 1), e.g. PIPELINE_WORKERS='{"enrich": 16}'
+    PIPELINE_WORKERS = {"detail": 8, "enrich": 8, "score": 1, **json.loads(os.getenv("PIPELINE_WORKERS", "") or "{}")}
+    PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", 200)) # Per stage queue
+    PIPELINE_FLUSH_INTERVAL = 10 # Seconds between checkpoint/archive/state refreshes in pipeline mode
+    # Freshness scheduler: when saturated, unseen tokens are enriched best-first
+    # (young, liquid, good local prescreen) and dropped once an alert would be stale
+    SCHEDULER_WEIGHTS = {"freshness": 0.5, "liquidity": 0.2, "score": 0.3}
+    SCHEDULER_HALF_LIFE = float(os.getenv("SCHEDULER_HALF_LIFE", 30)) # Minutes
+    SCHEDULER_MAX_WAIT = float(os.getenv("SCHEDULER_MAX_WAIT", 300)) # Seconds from feed to enrichment start
+    CYCLE_TIME_BUDGET = float(os.getenv("CYCLE_TIME_BUDGET", 25)) # Seconds of analysis per cycle (PIPELINE=false)
+    # Multi-process mode: this process polls the feed and routes profiles by chain to worker
+    # processes (detail/enrich/score); their results come back to the one portfolio and alert
+    # stream here. "auto" = one worker per GoPlus chain, or groups like "solana;ethereum,bsc;base".
+    # Chains not listed go to an "other" worker. Empty = single process.
+    SHARDS = os.getenv("SHARDS", "")
+    SHARD_INBOX_SIZE = 4 # Polls a worker may fall behind before its new profiles are dropped
+    SHARD_DRAIN_TIMEOUT = 10 # Seconds workers get to finish queued work on shutdown
+    SHARD_CHECK_INTERVAL = 5 # Seconds between worker liveness checks
+
+    # --- PAPER TRADING ---
+    # 5% risk per trade x 4 slots = max 20% of the balance at risk
+    MAX_OPEN_POSITIONS = int(os.getenv("MAX_OPEN_POSITIONS", 4))
+
+    # Seconds between price refreshes of held positions (independent of the discovery cycle)
+    POSITION_REFRESH_INTERVAL = float(os.getenv("POSITION_REFRESH_INTERVAL", 3))
+
+    # Named strategy portfolios sharing one scrape/enrichment feed (JSON in env).
+    # The first one is primary (alerts + cache.db); others get bot/storage/strategy_<name>.db.
+    # Keys: RISK_PER_TRADE, TP_MULTIPLIER, SL_MULTIPLIER, MAX_OPEN_POSITIONS, GAS_FEE,
+    #       SLIPPAGE, MIN_SCORE (entry gate, default SCORE_ALERT_MIN), NOTIFY (send TP/SL messages)
+    # e.g. STRATEGIES='{"main": {}, "wide": {"MIN_SCORE": 80, "SL_MULTIPLIER": 0.3}}'
+    STRATEGIES = json.loads(os.getenv("STRATEGIES", "") or '{"main": {}}')
+
     # --- ALERTS ---
     TELEGRAM_ENABLED = True
     TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "8368684518:AAHHx-XA6oVFRKP2Z-zgs3l55HBkSaS4abA")
     TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "7944897949")
+    # Outbound pacing: Telegram allows ~30 msg/s overall and ~1 msg/s per chat (20/min in groups -> use 3.0)
+    TELEGRAM_GLOBAL_RATE = float(os.getenv("TELEGRAM_GLOBAL_RATE", 25))
+    TELEGRAM_CHAT_INTERVAL = float(os.getenv("TELEGRAM_CHAT_INTERVAL", 1.0))
+    # Long-poll timeout for the command listener (Telegram holds getUpdates open up to this long)
+    TELEGRAM_POLL_TIMEOUT = int(os.getenv("TELEGRAM_POLL_TIMEOUT", 50))
+    # Digest mode: alerts and TP/SL messages within DIGEST_WINDOW seconds go out as one message.
+    # HIGH_PRIORITY alerts still go out immediately.
+    DIGEST_MODE = os.getenv("DIGEST_MODE", "false").lower() == "true"
+    DIGEST_WINDOW = float(os.getenv("DIGEST_WINDOW", 20))
+    # Progressive alerts: tokens passing the local (DexScreener-only) checks get a provisional
+    # alert right away, edited in place once GoPlus/Moralis finish (deleted if it's a honeypot)
+    PROGRESSIVE_ALERTS = os.getenv("PROGRESSIVE_ALERTS", "false").lower() == "true"
+
+    # Notification sinks (comma separated): telegram, desktop, webhook, jsonl.
+    # Each gets its own bounded queue + worker; a slow/broken sink only drops its own events.
+    NOTIFY_SINKS = [s.strip() for s in os.getenv("NOTIFY_SINKS", "telegram,desktop").split(",") if s.strip()]
+    NOTIFY_QUEUE_SIZE = int(os.getenv("NOTIFY_QUEUE_SIZE", 100))
+    NOTIFY_SINK_TIMEOUT = float(os.getenv("NOTIFY_SINK_TIMEOUT", 15)) # Max seconds per delivery
+    NOTIFY_FAILURE_THRESHOLD = 5 # Consecutive failures before a sink is paused
+    NOTIFY_COOLDOWN = 60 # Seconds a failing sink is paused
+    NOTIFY_WEBHOOK_URL = os.getenv("NOTIFY_WEBHOOK_URL", "")
+    NOTIFY_JSONL_PATH = os.getenv("NOTIFY_JSONL_PATH", "bot/storage/notifications.jsonl")
+    
+    # --- LIVE STREAM (/api/stream) ---
+    STREAM_REPLAY_SIZE = int(os.getenv("STREAM_REPLAY_SIZE", 500)) # Events kept for Last-Event-ID resume
+    STREAM_CLIENT_QUEUE = int(os.getenv("STREAM_CLIENT_QUEUE", 256)) # Per-client buffer; overflow drops the client
+    STREAM_KEEPALIVE = 15 # Seconds between keep-alive comments on idle streams
     
     # --- SYSTEM ---
     LOG_LEVEL = "INFO"
+    # Records waiting for the log writer thread; beyond this they're dropped (bot_log_records_dropped_total)
+    LOG_QUEUE_SIZE = 10000
+    # Optional structured copy of the logs, one JSON object per line. Empty = off.
+    LOG_JSONL_PATH = os.getenv("LOG_JSONL_PATH", "")
+    # Enables /admin/* diagnostics (CPU profile, tracemalloc, task dumps) on the keep-alive server.
+    # Empty = disabled.
+    ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+    PROFILE_MAX_SECONDS = 60
+    # Event loop stall detector: samples the loop thread's stack while it's blocked
+    # and keeps a top list of blocking call sites (/admin/stalls, log warnings).
+    LOOP_WATCHDOG = os.getenv("LOOP_WATCHDOG", "false").lower() == "true"
+    LOOP_LAG_THRESHOLD = float(os.getenv("LOOP_LAG_THRESHOLD", 0.1)) # Seconds
+    LOOP_WATCHDOG_INTERVAL = 0.02
+
+    # --- BACKTESTING ---
+    # When set, every cycle's pair data + security results are appended here (JSONL)
+    # so the backtester can replay them later. Empty = recording off.
+    SNAPSHOT_ARCHIVE = os.getenv("SNAPSHOT_ARCHIVE", "")
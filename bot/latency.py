@@ -0,0 +1,127 @@
+import asyncio
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from bot.clock import Clock
+from bot.metrics import REGISTRY
+from bot.models.token import Token
+
+# Signal latency: every token carries a timestamp per pipeline stage
+# (token.stage_times). Each mark is measured three ways:
+#   since_created - from the pair's pairCreatedAt (what a sniper cares about)
+#   since_feed    - from the first time we saw it in the feed (our own pipeline)
+#   since_prev    - from the previous stage (that stage's own cost)
+
+STAGES = ("feed", "detail", "goplus", "moralis", "scored", "alert_sent", "entered")
+BASES = ("since_created", "since_feed", "since_prev")
+
+SIGNAL_LATENCY = REGISTRY.histogram(
+    "bot_signal_latency_seconds", "Signal latency per stage and chain",
+    ["chain", "stage", "basis"],
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600, 7200, 21600, 86400),
+)
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    k = (len(sorted_values) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+class LatencyTracker:
+    """Keeps the last `window` samples per (chain, stage, basis) for percentiles."""
+    def __init__(self, window: int = 500):
+        self.window = window
+        self.samples: Dict[Tuple[str, str, str], Deque[float]] = {}
+
+    def mark(self, token: Token, stage: str, ts: Optional[float] = None):
+        now = Clock.now() if ts is None else ts
+        if token.stage_times is None:
+            token.stage_times = {}
+        times = token.stage_times
+        if stage in times:
+            return # First time through a stage is the one that counts
+        prev = max(times.values()) if times else None
+        times[stage] = now
+        self._observe_mark(token, stage, now, prev)
+
+    def merge(self, token: Token):
+        """Observes marks made in another process (shard workers) as if they were made here."""
+        prev = None
+        for stage, ts in sorted((token.stage_times or {}).items(), key=lambda item: item[1]):
+            self._observe_mark(token, stage, ts, prev)
+            prev = ts
+
+    def _observe_mark(self, token: Token, stage: str, now: float, prev: Optional[float]):
+        chain = token.chain_id
+        times = token.stage_times
+        if token.pair_created_at:
+            self._observe(chain, stage, "since_created", now - token.pair_created_at / 1000)
+        if "feed" in times and stage != "feed":
+            self._observe(chain, stage, "since_feed", now - times["feed"])
+        if prev is not None:
+            self._observe(chain, stage, "since_prev", now - prev)
+
+    def mark_on_delivery(self, future: asyncio.Future, token: Token, stage: str = "alert_sent"):
+        """Marks `stage` when an outbox send resolves successfully."""
+        def done(f):
+            if not f.cancelled() and f.result():
+                self.mark(token, stage)
+        future.add_done_callback(done)
+
+    def _observe(self, chain: str, stage: str, basis: str, seconds: float):
+        seconds = max(0.0, seconds)
+        key = (chain, stage, basis)
+        bucket = self.samples.get(key)
+        if bucket is None:
+            bucket = self.samples[key] = deque(maxlen=self.window)
+        bucket.append(seconds)
+        SIGNAL_LATENCY.labels(chain, stage, basis).observe(seconds)
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, Dict[str, float]]]]:
+        """{chain: {stage: {basis: {count, p50, p90, p99}}}}, plus chain "all"."""
+        merged: Dict[Tuple[str, str, str], List[float]] = {}
+        for (chain, stage, basis), values in self.samples.items():
+            merged.setdefault((chain, stage, basis), []).extend(values)
+            merged.setdefault(("all", stage, basis), []).extend(values)
+
+        out: Dict[str, Dict[str, Dict[str, Dict[str, float]]]] = {}
+        for (chain, stage, basis), values in merged.items():
+            values.sort()
+            out.setdefault(chain, {}).setdefault(stage, {})[basis] = {
+                "count": len(values),
+                "p50": percentile(values, 50),
+                "p90": percentile(values, 90),
+                "p99": percentile(values, 99),
+            }
+        return out
+
+    def get_report_text(self) -> str:
+        """Short block for the hourly report: time from pair creation / first sighting to alert and entry."""
+        stats = self.summary()
+        if not stats:
+            return ""
+        msg = "⏱️ **Signal Latency** (p50 / p90)\n"
+        for chain in sorted(stats, key=lambda c: (c != "all", c)):
+            parts = []
+            for stage in ("alert_sent", "entered"):
+                created = stats[chain].get(stage, {}).get("since_created")
+                feed = stats[chain].get(stage, {}).get("since_feed")
+                if created:
+                    parts.append(f"{stage}: {_fmt(created['p50'])}/{_fmt(created['p90'])} from launch")
+                if feed:
+                    parts.append(f"{_fmt(feed['p50'])}/{_fmt(feed['p90'])} from feed")
+            if parts:
+                msg += f"`{chain}` " + " | ".join(parts) + "\n"
+        return msg
+
+def _fmt(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.1f}m"
+    return f"{seconds / 3600:.1f}h"
+
+LATENCY = LatencyTracker()
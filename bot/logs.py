@@ -0,0 +1,136 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+from collections import Counter
+from typing import Optional
+from bot.config import Config
+from bot.metrics import REGISTRY
+from bot.models.token import AnalysisResult
+
+# All log output (and the colored console blocks) goes through one bounded
+# queue; a QueueListener thread does the actual stdout/file writes. A slow
+# container log driver then only slows that thread, never the event loop,
+# and once the queue is full new records are dropped (and counted).
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Rendered verbatim (no timestamp prefix) - the per-token result blocks
+CONSOLE = logging.getLogger("Console")
+
+LOG_DROPPED = REGISTRY.counter(
+    "bot_log_records_dropped_total", "Log records dropped because the log queue was full")
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops on a full queue instead of blocking or erroring."""
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_DROPPED.inc()
+
+class _Listener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel) # Wait for room; the writer is draining
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; anything passed as extra={"data": {...}} is merged in."""
+    def format(self, record) -> str:
+        entry = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        data = getattr(record, "data", None)
+        if isinstance(data, dict):
+            entry.update(data)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+def _only_console(record) -> bool:
+    return record.name == CONSOLE.name
+
+def _not_console(record) -> bool:
+    return record.name != CONSOLE.name
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+def setup_logging(level: Optional[str] = None, jsonl_path: Optional[str] = None):
+    """Routes the root logger through the queue. Safe to call more than once."""
+    global _listener
+    if _listener is not None:
+        return
+    level = level or Config.LOG_LEVEL
+    jsonl_path = Config.LOG_JSONL_PATH if jsonl_path is None else jsonl_path
+
+    text = logging.StreamHandler(sys.stdout)
+    text.setFormatter(logging.Formatter(LOG_FORMAT))
+    text.addFilter(_not_console)
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    console.addFilter(_only_console)
+
+    handlers = [text, console]
+    if jsonl_path:
+        structured = logging.FileHandler(jsonl_path, encoding="utf-8")
+        structured.setFormatter(JsonFormatter())
+        structured.addFilter(_not_console) # Colored blocks are for humans only
+        handlers.append(structured)
+
+    log_queue = queue.Queue(maxsize=Config.LOG_QUEUE_SIZE)
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(DroppingQueueHandler(log_queue))
+    root.setLevel(getattr(logging, level))
+
+    _listener = _Listener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+def stop_logging():
+    """Flushes whatever is still queued."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+class RejectSummary:
+    """
+    Per-cycle reject counts instead of a line per token:
+    "312 rejected this cycle, top reasons: checklist 9/20 (140), LP_NOT_LOCKED (61), ..."
+    Each token is still logged at DEBUG by the scorer.
+    """
+    def __init__(self, top: int = 5):
+        self.top = top
+        self.reasons: Counter = Counter()
+        self.count = 0
+
+    @staticmethod
+    def reason(result: AnalysisResult) -> str:
+        from bot.analyzer.scoring import HARD_REJECT_FLAGS
+        hard = [flag for flag in result.risk_flags if flag in HARD_REJECT_FLAGS]
+        if hard:
+            return hard[0]
+        passes = result.details.get("checklist_passes")
+        if passes is not None and passes < Config.CHECKLIST_MIN_PASSES:
+            return f"checklist {passes}/20"
+        return "score below threshold"
+
+    def add(self, result: AnalysisResult):
+        self.count += 1
+        self.reasons[self.reason(result)] += 1
+
+    def flush(self, log: logging.Logger):
+        if not self.count:
+            return
+        top = ", ".join(f"{reason} ({n})" for reason, n in self.reasons.most_common(self.top))
+        log.info(f"{self.count} rejected this cycle, top reasons: {top}",
+                 extra={"data": {"event": "rejects", "count": self.count, "reasons": dict(self.reasons)}})
+        self.reasons.clear()
+        self.count = 0
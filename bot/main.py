@@ -1,7 +1,9 @@
 import asyncio
+import html
 import logging
 import sys
 import os
+import signal
 import time
 import colorama
 from colorama import Fore, Style
@@ -13,21 +15,33 @@ from bot.config import Config
 from bot.scraper.dex_scraper import DexScraper
 from bot.analyzer.scoring import ScoringEngine
 from bot.models.token import AnalysisResult
-from bot.alerts.desktop import DesktopNotifier
 from bot.alerts.telegram import TelegramAlert
+from bot.alerts.cleanup import run_reset_cleanup
+from bot.alerts.digest import DigestBuffer
+from bot.alerts.commands import CommandDispatcher, TelegramCommandListener
+from bot.alerts.outbox import TelegramOutbox, PRIORITY_TRADE, PRIORITY_COMMAND, PRIORITY_ALERT, PRIORITY_REPORT
+from bot.alerts.bus import NotificationBus, Notification
 from bot.storage.db import Database
+from bot.metrics import STAGE_SECONDS, TOKENS_TOTAL, SEEN_LOOKUPS, QUEUE_DEPTH, OPEN_POSITIONS, EQUITY, provider_health
+from bot.latency import LATENCY
+from bot.watchdog import WATCHDOG
+from bot.state import STATE, ResultLog
+from bot.stream import HUB
+from bot.pipeline import Pipeline
+from bot.shards import ShardSupervisor
+from bot.scraper.cadence import AdaptiveCadence
+from bot.scheduler import SCHEDULER_SKIPPED, FreshnessScheduler
+from bot.logs import CONSOLE, RejectSummary, setup_logging, stop_logging
 
-# Setup logging
-logging.basicConfig(
-    level=getattr(logging, Config.LOG_LEVEL),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger("Main")
-
-# Initialize Colorama
+# Initialize Colorama (before logging so the log writer gets the wrapped stdout)
 colorama.init(autoreset=True)
 
-from bot.simulator.trader import PaperTrader
+# Setup logging (queued; a background thread does the writes)
+setup_logging()
+logger = logging.getLogger("Main")
+
+from bot.simulator.portfolios import StrategyBook
+from bot.simulator.recorder import SnapshotRecorder
 from bot.server import start_server
 
 class Bot:
@@ -35,10 +49,40 @@ class Bot:
         self.scraper = DexScraper()
         self.scorer = ScoringEngine()
         self.db = Database()
-        self.trader = PaperTrader() # Initialize Trader
+        # All outbound Telegram traffic goes through here; sent ids land in message_log
+        self.outbox = TelegramOutbox(on_sent=self.db.log_message)
+        # Optional burst coalescing for alerts and TP/SL messages
+        self.digest = DigestBuffer(self.outbox) if Config.DIGEST_MODE else None
+        # Alerts and TP/SL messages fan out to the sinks in NOTIFY_SINKS
+        self.bus = NotificationBus.from_config(outbox=self.outbox, digest=self.digest)
+        self.strategies = StrategyBook(Config.STRATEGIES) # One portfolio per strategy
+        self.trader = self.strategies.primary # Primary strategy drives alerts
+        # Optional archive of every cycle for the backtester
+        self.recorder = SnapshotRecorder(Config.SNAPSHOT_ARCHIVE) if Config.SNAPSHOT_ARCHIVE else None
         self.running = True
+        self._stopping = asyncio.Event() # Set by stop() (signals, /commands)
         self.last_report_time = 0
-        self.tele_offset = 0
+        # Commands are long-polled by their own task and handled concurrently with scanning
+        self.commands = CommandDispatcher()
+        self.commands.register("balance", self._cmd_balance)
+        self.commands.register("strategies", self._cmd_strategies)
+        self.commands.register("reset", self._cmd_reset)
+        self.listener = TelegramCommandListener(self.commands)
+        self._background = set() # Long-running command jobs (keeps a reference until done)
+        self.scheduler = FreshnessScheduler(self.scorer) # Best-first enrichment when saturated
+        self.cadence = AdaptiveCadence() # Poll interval from feed activity, rate budget and 429s
+        # Discovery as concurrent stages over bounded queues (PIPELINE=false -> one cycle at a time)
+        self.pipeline = Pipeline(self) if Config.PIPELINE and not Config.SHARDS else None
+        # Or across worker processes by chain (SHARDS), still trading/alerting from here
+        self.shards = ShardSupervisor(self) if Config.SHARDS else None
+        self._register_gauges()
+        self.results = ResultLog() # Recent results for the /api views
+        self.rejects = RejectSummary() # Per-cycle reject reasons (logged instead of one line per token)
+        self.started_at = time.time()
+        self.last_cycle_at = None
+        # Live trade entries/exits for /api/stream
+        self.strategies.set_trade_listener(self._on_trade)
+        self._last_equity = {}
 
     async def start(self):
         logger.info("🔥 Meme Coin Analysis Bot Started")
@@ -51,95 +95,320 @@ class Bot:
         # We do NOT reset on startup anymore. Persistence is required for 24/7.
         # User can use /reset command to wipe.
         
-        await TelegramAlert.send_message("🔥 **Bot Started!**\n\nResuming session...\nStrict Mode: **ON**")
+        if Config.LOOP_WATCHDOG:
+            WATCHDOG.start()
+        self.outbox.start()
+        self.bus.start()
+        self.outbox.send_message("🔥 **Bot Started!**\n\nResuming session...\nStrict Mode: **ON**", PRIORITY_REPORT, log=False)
         
+        self._publish_state()
+
+        # Held positions get their own fast loop so exits never wait on discovery
+        refresher = asyncio.create_task(self._supervise("Position refresh", self._position_refresh_loop))
+        listener = asyncio.create_task(self._supervise("Command listener", self.listener.run))
+
+        # Ctrl-C / SIGTERM ask for a clean stop instead of cancelling this task,
+        # so the teardown below (drain, final checkpoint) always runs
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError):
+                pass # Windows: Ctrl-C still cancels; the finally block covers that too
+
+        try:
+            if self.shards:
+                self.shards.start()
+                await self._stopping.wait()
+            elif self.pipeline:
+                # Stages run on their own; this task just waits for stop()
+                self.pipeline.start()
+                await self._stopping.wait()
+            else:
+                await self._discovery_loop()
+        finally:
+            self.running = False
+            # Persist first in case the drain below gets interrupted
+            self.strategies.checkpoint()
+            if self.shards:
+                await self.shards.stop()
+            if self.pipeline:
+                self.pipeline.stop()
+            refresher.cancel()
+            listener.cancel()
+            await self.bus.stop()
+            if self.digest:
+                self.digest.flush()
+            await self.outbox.stop() # Sends what's still queued (bounded), incl. the digest above
+            # Final checkpoint so nothing from the last cycle is lost
+            self.strategies.checkpoint()
+            if Config.LOOP_WATCHDOG:
+                WATCHDOG.stop()
+                logger.info("Blocking call sites:\n" + WATCHDOG.report(10))
+
+    async def _discovery_loop(self):
+        """PIPELINE=false: one cycle at a time."""
         while self.running:
             try:
-                # 0. Check Telegram Commands
-                updates, self.tele_offset = await TelegramAlert.get_updates(self.tele_offset)
-                for update in updates:
-                     msg = update.get("message", {}).get("text", "")
-                     
-                     if "/balance" in msg:
-                         report = self.trader.get_summary_text()
-                         mid = await TelegramAlert.send_message(report)
-                         if mid: self.db.log_message(Config.TELEGRAM_CHAT_ID, mid)
-                         logger.info("Sent balance report by command.")
-                         
-                     elif "/reset" in msg:
-                         # 1. Reset Sim Data
-                         self.trader.reset_portfolio(initial_balance=200.0)
-                         self.db.reset_data()
-                         
-                         # 2. Clear Chat History (Of bot messages)
-                         msg_ids = self.db.get_and_clear_message_ids()
-                         for cid, mid in msg_ids:
-                             await TelegramAlert.delete_message(cid, mid)
-                             await asyncio.sleep(0.05) # Rate limit safety
-                             
-                         # 3. Send confirmation
-                         mid = await TelegramAlert.send_message("♻️ **Bot Reset!**\n\nHistory wiped.\nBalance: $200.00.")
-                         if mid: self.db.log_message(Config.TELEGRAM_CHAT_ID, mid)
-                         logger.info("Bot execution state reset by command.")
-
-                # 1. Scrape
-                tokens = await self.scraper.run_cycle()
-                
-                # --- FRESH PRICE UPDATE FOR HELD TOKENS ---
-                # Fetch latest data for tokens we actively hold to ensure balance updates
-                active_pairs = self.trader.get_active_pairs() # List of (chain_id, pair_address)
-                if active_pairs:
-                    held_tokens = await self.scraper.fetch_specific_pairs(active_pairs)
-                    if held_tokens:
-                        # Append to tokens list so they get into token_map
-                        # Duplicates don't matter as dict overwrite handles it
-                        tokens.extend(held_tokens)
-                        logger.info(f"Refreshed prices for {len(held_tokens)} active positions.")
-
-                # Update positions first with latest prices
-                # We need a map of address -> Token to update prices. 
-                # Since scrape returns list, let's map it.
-                token_map = {t.pair_address: t for t in tokens}
-                notifications = self.trader.update_positions(token_map)
-                
-                # Send Trade Updates (TP/SL)
-                for notif in notifications:
-                    mid = await TelegramAlert.send_message(notif)
-                    if mid: self.db.log_message(Config.TELEGRAM_CHAT_ID, mid)
-                
-                if tokens:
-                    logger.info(f"Analyzing {len(tokens)} tokens...")
-                
-                for token in tokens:
-                    # 2. Check Cache
-                    if self.db.is_seen(token.pair_address):
-                        continue
-                    
-                    # 3. Analyze
-                    result = await self.scorer.analyze_token(token)
-                    
-                    # 4. Filter & Output & Trade
-                    await self._process_result(result)
-                    
-                    # 5. Mark seen
-                    self.db.mark_seen(token.pair_address, token.chain_id)
-                
-                # Check for Hourly Report
-                if time.time() - self.last_report_time > 3600:
-                    await self._send_report()
-                    self.last_report_time = time.time()
-                
+                tokens = await self.run_cycle()
+
                 # Wait before next cycle
-                logger.info("Cycle complete. Waiting...")
-                await asyncio.sleep(30) 
-                
-            except KeyboardInterrupt:
-                self.stop()
+                interval = self.cadence.record([t.base_token_address for t in tokens])
+                logger.info(f"Cycle complete. Waiting {interval:.0f}s...")
+                await self._sleep(interval)
             except Exception as e:
                 logger.error(f"Cycle error: {e}")
-                await asyncio.sleep(30)
+                await self._sleep(self.cadence.interval)
+
+    async def _sleep(self, seconds: float):
+        """Waits between cycles, returning early on stop()."""
+        try:
+            await asyncio.wait_for(self._stopping.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def run_cycle(self):
+        """One discovery pass: scrape, analyze unseen pairs, alert/trade, persist. Returns the scraped tokens."""
+        cycle_started = time.perf_counter()
+
+        # 1. Scrape
+        with STAGE_SECONDS.labels("scrape").time():
+            tokens = await self.scraper.run_cycle()
+
+        # Held pairs that show up in discovery are a free price update
+        # (the dedicated refresh loop covers the rest)
+        self._apply_prices({t.pair_address: t for t in tokens})
+
+        if tokens:
+            logger.info(f"Analyzing {len(tokens)} tokens...")
+
+        # 2. Check Cache
+        unseen = []
+        for token in tokens:
+            if self.db.is_seen(token.pair_address):
+                SEEN_LOOKUPS.labels("hit").inc()
+                continue
+            SEEN_LOOKUPS.labels("miss").inc()
+            unseen.append(token)
+
+        # Freshest/most promising first; whatever doesn't fit the cycle's time budget
+        # stays unseen for the next cycle
+        queue = self.scheduler.order(unseen)
+        for i, (token, early) in enumerate(queue):
+            if time.perf_counter() - cycle_started + self.scheduler.enrich_seconds > Config.CYCLE_TIME_BUDGET:
+                SCHEDULER_SKIPPED.labels("deferred").inc(len(queue) - i)
+                logger.info(f"Cycle time budget used up, deferring {len(queue) - i} tokens")
+                break
+            if self.scheduler.expired(token):
+                continue
+
+            # 3. Analyze (optionally alerting early on local checks)
+            provisional = self._send_provisional(token, early) if Config.PROGRESSIVE_ALERTS else None
+            started = time.perf_counter()
+            params, risks = await self.scorer.enrich(token)
+            self.scheduler.observe(time.perf_counter() - started)
+            result = self.scorer.score(token, params, risks)
+
+            # 4. Filter & Output & Trade
+            await self._process_result(result, provisional)
+
+            # 5. Mark seen
+            self.db.mark_seen(token.pair_address, token.chain_id)
+
+        # Archive this cycle (after analysis so security data is attached)
+        if self.recorder:
+            self.recorder.add(tokens)
+
+        await self.housekeeping()
+        STAGE_SECONDS.labels("cycle").observe(time.perf_counter() - cycle_started)
+        return tokens
+
+    async def housekeeping(self):
+        """End-of-cycle work (the pipeline runs it on a timer): reject summary, archive, report, checkpoint, /api state."""
+        self.rejects.flush(logger)
+        if self.recorder:
+            self.recorder.flush()
+
+        # Check for Hourly Report
+        if time.time() - self.last_report_time > 3600:
+            await self._send_report()
+            self.last_report_time = time.time()
+
+        # Persist this cycle's trades + balance in one transaction
+        self.strategies.checkpoint()
+        self.last_cycle_at = time.time()
+        self._publish_state()
+
+    def _register_gauges(self):
+        """Queue depths and portfolio gauges, computed only when /metrics is scraped."""
+        QUEUE_DEPTH.labels("telegram_outbox").set_function(self.outbox.depth)
+        if self.digest:
+            QUEUE_DEPTH.labels("digest").set_function(self.digest.pending)
+        for worker in self.bus.workers:
+            QUEUE_DEPTH.labels(f"sink_{worker.sink.name}").set_function(worker.queue.qsize)
+        for name, trader in self.strategies.traders.items():
+            OPEN_POSITIONS.labels(name).set_function(trader.get_open_count)
+            EQUITY.labels(name).set_function(trader.get_equity)
+
+    def _on_trade(self, name: str, event: str, details: dict):
+        HUB.publish("trade", {"strategy": name, "event": event, **details})
+
+    def _publish_equity(self):
+        """Equity tick on /api/stream, only when it moved."""
+        equity = {name: round(trader.get_equity(), 4) for name, trader in self.strategies.traders.items()}
+        if equity != self._last_equity:
+            self._last_equity = equity
+            HUB.publish("equity", equity)
+
+    def _publish_state(self):
+        """Refreshes the /api snapshots (once per cycle; requests never read live state)."""
+        portfolio, positions = {}, []
+        for name, trader in self.strategies.traders.items():
+            portfolio[name] = {
+                **trader.get_portfolio(),
+                "equity": trader.get_equity(),
+                "open_positions": trader.get_open_count(),
+                "max_open_positions": trader.MAX_OPEN_POSITIONS,
+                "stats": trader.get_detailed_stats(),
+                "primary": name == self.strategies.primary_name,
+            }
+            for pair, trade in trader.open_positions.items():
+                price = trade["current_price"] if trade["current_price"] > 0 else trade["entry_price"]
+                positions.append({
+                    "strategy": name,
+                    "pair_address": pair,
+                    **{k: v for k, v in trade.items() if k not in ("log", "token_address")},
+                    "value_usd": trade["current_quantity"] * price,
+                    "unrealized_pnl": trade["current_quantity"] * price - trade["cost_basis"],
+                })
+
+        STATE.publish("portfolio", portfolio)
+        STATE.publish("positions", positions)
+        STATE.publish("results", self.results.recent_list())
+        STATE.publish("watchlist", self.results.watchlist_list())
+        STATE.publish("latency", LATENCY.summary())
+        STATE.publish("health", {
+            "uptime_s": time.time() - self.started_at,
+            "last_cycle_at": self.last_cycle_at,
+            "providers": provider_health(),
+            "queues": {"telegram_outbox": self.outbox.depth(), **{
+                f"sink_{name}": stats["queued"] for name, stats in self.bus.stats().items()}},
+            "sinks": self.bus.stats(),
+        })
+
+    async def _supervise(self, name: str, loop_fn):
+        """Keeps a background loop alive, restarting it with backoff if it crashes."""
+        delay = 1
+        while self.running:
+            try:
+                await loop_fn()
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"{name} crashed: {e}. Restarting in {delay}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60)
+
+    async def _position_refresh_loop(self):
+        """
+        Fast cadence price refresh for held pairs (all strategies).
+        Exit latency is bounded by POSITION_REFRESH_INTERVAL, not by cycle length.
+        """
+        while self.running:
+            started = time.monotonic()
+            active_pairs = self.strategies.get_active_pairs() # List of (chain_id, pair_address)
+            if active_pairs:
+                with STAGE_SECONDS.labels("refresh").time():
+                    held_tokens = await self.scraper.fetch_specific_pairs(active_pairs)
+                if held_tokens:
+                    self._apply_prices({t.pair_address: t for t in held_tokens})
+                    logger.debug(f"Refreshed prices for {len(held_tokens)} active positions.")
+                    if self.recorder:
+                        self.recorder.add(held_tokens)
+                        self.recorder.flush()
+                self.strategies.checkpoint()
+
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(max(0.0, Config.POSITION_REFRESH_INTERVAL - elapsed))
+
+    def _apply_prices(self, token_map: dict):
+        """Runs TP/SL for every strategy on fresh prices and sends the resulting notifications."""
+        if not token_map:
+            return
+        notifications = self.strategies.update_positions(token_map)
+        self._publish_equity()
+        
+        # Send Trade Updates (TP/SL)
+        for name, notif in notifications:
+            if not self.strategies.notifies(name):
+                continue
+            text = self.strategies.format_notification(name, notif)
+            self.bus.publish(Notification("trade", text=text, priority=PRIORITY_TRADE, strategy=name))
+
+    def _send_provisional(self, token, early: AnalysisResult = None):
+        """
+        Sends an early alert from the local-only prescreen (early, if already computed).
+        Returns the outbox future (resolves to the sent message) or None if the token doesn't qualify.
+        """
+        early = early or self.scorer.prescreen(token)
+        if early.action not in ("HIGH_PRIORITY", "ALERT"):
+            return None
+        if self.trader.get_open_count() >= self.trader.MAX_OPEN_POSITIONS:
+            return None
+        # Alert priority: a speculative alert must never delay a TP/SL exit notice
+        sent = self.outbox.send_alert(early, PRIORITY_ALERT, provisional=True)
+        LATENCY.mark_on_delivery(sent, token)
+        return sent
+
+    async def _settle_provisional(self, provisional, result: AnalysisResult, tradeable: bool = True):
+        """
+        Updates a provisional alert in place with the full result, or retracts it.
+        tradeable=False: the token passed, but every position slot filled up while it was being enriched.
+        """
+        sent = await provisional
+        passed = result.action in ("HIGH_PRIORITY", "ALERT")
+        if not sent:
+            # Provisional never made it out; fall back to a normal alert
+            if passed and tradeable:
+                LATENCY.mark_on_delivery(self.outbox.send_alert(result), result.token)
+            return
 
-    async def _process_result(self, result: AnalysisResult):
+        token = result.token
+        if passed and not tradeable:
+            text = (
+                f"⏸️ <b>NOT TRADED: {html.escape(token.base_token_symbol)}</b>\n"
+                f"Passed security checks, but all {self.trader.MAX_OPEN_POSITIONS} position slots are taken.\n"
+                f"<code>{token.base_token_address}</code>"
+            )
+            logger.info(f"Provisional alert for {token.base_token_symbol} not traded (max open positions)")
+        elif passed:
+            _, payload = TelegramAlert.build_alert(result)
+            text = payload.get("caption") or payload.get("text")
+        elif "SCAM_HONEYPOT" in result.risk_flags:
+            self.outbox.delete_message(sent["chat"]["id"], sent["message_id"], PRIORITY_ALERT)
+            logger.info(f"Retracted provisional alert for {token.base_token_symbol} (honeypot)")
+            return
+        else:
+            flags = ", ".join(result.risk_flags) or "score below threshold"
+            text = (
+                f"❌ <b>RETRACTED: {html.escape(token.base_token_symbol)}</b>\n"
+                f"Failed security checks: {html.escape(flags)}\n"
+                f"<code>{token.base_token_address}</code>"
+            )
+            logger.info(f"Retracted provisional alert for {token.base_token_symbol} ({flags})")
+
+        method, payload = TelegramAlert.build_edit(sent, text)
+        self.outbox.post(method, payload, PRIORITY_ALERT, log=False)
+
+    def _spawn(self, coro):
+        """Runs a background job, keeping a reference until it's done."""
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+    async def _process_result(self, result: AnalysisResult, provisional=None):
         token = result.token
         
         # Decide color based on action
@@ -153,41 +422,87 @@ class Bot:
         elif result.action == "REJECT":
             color = Fore.RED
 
-        # Console Output
+        # Console Output (rendered by the log writer thread, not here)
+        if result.action == "REJECT":
+            self.rejects.add(result)
         if result.action != "REJECT" or Config.LOG_LEVEL == "DEBUG":
-            print(f"\n{color}{'='*50}")
-            print(f"{Style.BRIGHT}Token: {token.base_token_name} ({token.base_token_symbol})")
-            print(f"{color}Score: {result.score:.0f}/100 [{result.action}]")
-            print(f"{Fore.WHITE}Chain: {token.chain_id} | Pair Age: {result.details.get('token_age_minutes',0):.1f}m")
-            print(f"CA: {token.base_token_address}")
+            lines = [
+                f"\n{color}{'='*50}",
+                f"{Style.BRIGHT}Token: {token.base_token_name} ({token.base_token_symbol})",
+                f"{color}Score: {result.score:.0f}/100 [{result.action}]",
+                f"{Fore.WHITE}Chain: {token.chain_id} | Pair Age: {result.details.get('token_age_minutes',0):.1f}m",
+                f"CA: {token.base_token_address}",
+            ]
             if token.websites:
-                print(f"Web: {token.websites[0].get('url', 'N/A')}")
+                lines.append(f"Web: {token.websites[0].get('url', 'N/A')}")
             if result.predicted_fdv > 0:
-                print(f"{Fore.GREEN}Potential MC: ${result.predicted_fdv:,.0f} ({(result.predicted_fdv/token.fdv):.1f}x)")
-            print(f"Liq: ${token.liquidity_usd:,.0f} | MC: ${token.fdv:,.0f}")
-            print(f"Risks: {result.risk_flags}")
-            print(f"{color}{'='*50}\n")
+                lines.append(f"{Fore.GREEN}Potential MC: ${result.predicted_fdv:,.0f} ({(result.predicted_fdv/token.fdv):.1f}x)")
+            lines.append(f"Liq: ${token.liquidity_usd:,.0f} | MC: ${token.fdv:,.0f}")
+            lines.append(f"Risks: {result.risk_flags}")
+            lines.append(f"{color}{'='*50}{Style.RESET_ALL}\n")
+            CONSOLE.info("\n".join(lines))
         
-        # Alerts & Trading
+        TOKENS_TOTAL.labels(result.action).inc()
+        self.results.add(result)
+        HUB.publish("result", ResultLog.describe(result))
+
+        # Shadow strategies trade silently on their own gates
+        with STAGE_SECONDS.labels("trade").time():
+            self.strategies.shadow_trade(result)
+
+        # Check Trade Limit BEFORE alerting (again for provisional alerts:
+        # slots may have filled up while this token was being enriched)
+        open_count = self.trader.get_open_count()
+        max_open = self.trader.MAX_OPEN_POSITIONS
+        tradeable = open_count < max_open
+
+        # An early alert already went out: confirm or retract it
+        if provisional is not None:
+            self._spawn(self._settle_provisional(provisional, result, tradeable))
+
+        # Alerts & Trading (primary strategy)
         if result.action in ["HIGH_PRIORITY", "ALERT"]:
-            # Check Trade Limit BEFORE alerting
-            open_count = self.trader.get_open_count()
-            if open_count >= 4:
+            if not tradeable:
                 # Limit reached: Do not alert, do not enter trade
                 # Maybe log it as "Missed Signal"
-                logger.info(f"Buffered Max Signals ({open_count}/4). Suppressing alert for {token.base_token_symbol}.")
-                print(f"{Fore.YELLOW}🛑 MAX SIGNALS REACHED ({open_count}/4). SUPPRESSING ALERT FOR {token.base_token_symbol} 🛑")
-                # Optional: Send a "Missed" notification if desired, but user said "only 4 signals at most".
+                logger.info(f"Buffered Max Signals ({open_count}/{max_open}). Suppressing alert for {token.base_token_symbol}.")
+                CONSOLE.info(f"{Fore.YELLOW}🛑 MAX SIGNALS REACHED ({open_count}/{max_open}). SUPPRESSING ALERT FOR {token.base_token_symbol} 🛑{Style.RESET_ALL}")
+                # Optional: Send a "Missed" notification if desired, but user said "only N signals at most".
                 # So we stay silent.
                 return 
 
-            # Send Alert
-            mid = await TelegramAlert.send_alert(result)
-            if mid: self.db.log_message(Config.TELEGRAM_CHAT_ID, mid)
-            DesktopNotifier.send_notification(result)
+            # Send Alert (a provisional Telegram alert gets edited in place by _settle_provisional)
+            skip = frozenset({"telegram"}) if provisional is not None else frozenset()
+            with STAGE_SECONDS.labels("alert").time():
+                self.bus.publish(Notification("alert", result=result, priority=PRIORITY_ALERT,
+                                              strategy=self.strategies.primary_name, skip=skip))
             
             # Enter Paper Trade
-            self.trader.enter_trade(token)
+            with STAGE_SECONDS.labels("trade").time():
+                entered = self.trader.enter_trade(token)
+            if entered:
+                LATENCY.mark(token, "entered")
+
+    # --- Telegram Commands ---
+
+    async def _cmd_balance(self, args, update):
+        # "/balance <strategy>" shows a shadow portfolio
+        trader = self.strategies.traders.get(args[0], self.trader) if args else self.trader
+        self.outbox.send_message(trader.get_summary_text(), PRIORITY_COMMAND)
+        logger.info("Sent balance report by command.")
+
+    async def _cmd_strategies(self, args, update):
+        self.outbox.send_message(self.strategies.get_comparison_text(), PRIORITY_COMMAND)
+
+    async def _cmd_reset(self, args, update):
+        # 1. Reset Sim Data
+        self.strategies.reset_all(initial_balance=200.0)
+        self.db.reset_data()
+
+        # 2. Clear Chat History (Of bot messages) in the background; scanning keeps going
+        msg_ids = self.db.get_and_clear_message_ids()
+        self._spawn(run_reset_cleanup(self.outbox, msg_ids))
+        logger.info("Bot execution state reset by command.")
 
     async def _send_report(self):
         """Send hourly portfolio report"""
@@ -199,11 +514,16 @@ class Bot:
             f"Fees Paid: `${port['fees_paid']:.2f}`\n"
             f"Strategy: Risk 5% | Sell Half @ 2x"
         )
-        # Using a dummy method for now, or assume TelegramAlert has send_message
-        await TelegramAlert.send_message(msg)
+        if len(self.strategies.traders) > 1:
+            msg += "\n\n" + self.strategies.get_comparison_text()
+        latency = LATENCY.get_report_text()
+        if latency:
+            msg += "\n\n" + latency
+        self.outbox.send_message(msg, PRIORITY_REPORT, log=False)
 
     def stop(self):
         self.running = False
+        self._stopping.set()
         logger.info("Stopping bot...")
 
 if __name__ == "__main__":
@@ -216,3 +536,5 @@ if __name__ == "__main__":
         asyncio.run(bot.start())
     except KeyboardInterrupt:
         pass
+    finally:
+        stop_logging()
@@ -0,0 +1,224 @@
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Prometheus text exposition (format 0.0.4) without the client library.
+# Hot path cost is a dict lookup + an add; label children are cached, and
+# gauges backed by callbacks are only evaluated when /metrics is scraped.
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if value != value:
+        return "NaN"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        if not self.label_names:
+            self._children[()] = self._new_child()
+
+    def labels(self, *values):
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = self._new_child()
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for key, child in list(self._children.items()):
+            lines.extend(self._render(key, child))
+        return lines
+
+    def _render(self, key, child) -> List[str]:
+        return [f"{self.name}{_format_labels(self.label_names, key)} {_format_value(child.get())}"]
+
+class _Value:
+    __slots__ = ("value", "fn")
+
+    def __init__(self):
+        self.value = 0.0
+        self.fn: Optional[Callable[[], float]] = None
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+    def set_function(self, fn: Callable[[], float]):
+        """Gauge computed at scrape time (queue depth, equity...) - free on the hot path."""
+        self.fn = fn
+
+    def get(self) -> float:
+        if self.fn is not None:
+            try:
+                return float(self.fn())
+            except Exception:
+                return float("nan")
+        return self.value
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1.0):
+        self._children[()].inc(amount)
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float):
+        self._children[()].set(value)
+
+    def set_function(self, fn: Callable[[], float]):
+        self._children[()].set_function(fn)
+
+class _HistogramValue:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1) # Last slot = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    @contextmanager
+    def time(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = (), buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, help_text, labels)
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float):
+        self._children[()].observe(value)
+
+    def time(self):
+        return self._children[()].time()
+
+    def _render(self, key, child) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), child.counts):
+            cumulative += count
+            le = f'le="{_format_value(bound)}"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.label_names, key, le)} {cumulative}")
+        labels = _format_labels(self.label_names, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+        lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        # Re-registering returns the existing metric (module reloads, several Bot instances)
+        return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help_text: str, labels: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, help_text, labels))
+
+    def gauge(self, name: str, help_text: str, labels: Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name, help_text, labels))
+
+    def histogram(self, name: str, help_text: str, labels: Iterable[str] = (), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, help_text, labels, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+REGISTRY = Registry()
+
+# --- Bot metrics ---
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "bot_stage_seconds", "Time spent per pipeline stage", ["stage"])
+TOKENS_TOTAL = REGISTRY.counter(
+    "bot_tokens_analyzed_total", "Tokens analyzed, by resulting action", ["action"])
+SEEN_LOOKUPS = REGISTRY.counter(
+    "bot_seen_cache_lookups_total", "Seen-pair cache lookups", ["result"])
+UPSTREAM_REQUESTS = REGISTRY.counter(
+    "bot_upstream_requests_total", "Upstream API requests by provider and status", ["provider", "status"])
+UPSTREAM_SECONDS = REGISTRY.histogram(
+    "bot_upstream_request_seconds", "Upstream API request latency", ["provider"])
+QUEUE_DEPTH = REGISTRY.gauge(
+    "bot_queue_depth", "Items waiting in internal queues", ["queue"])
+OPEN_POSITIONS = REGISTRY.gauge(
+    "bot_open_positions", "Open paper positions", ["strategy"])
+EQUITY = REGISTRY.gauge(
+    "bot_equity_usd", "Paper portfolio equity (cash + holdings)", ["strategy"])
+
+# Wall-clock time of the last 2xx per provider (for /api/health)
+LAST_SUCCESS: Dict[str, float] = {}
+
+def observe_request(provider: str, status, started: float):
+    """Records one upstream call. started = time.perf_counter() before the request."""
+    UPSTREAM_REQUESTS.labels(provider, status).inc()
+    UPSTREAM_SECONDS.labels(provider).observe(time.perf_counter() - started)
+    if isinstance(status, int) and 200 <= status < 300:
+        LAST_SUCCESS[provider] = time.time()
+
+def provider_health() -> Dict[str, Dict[str, Any]]:
+    """Per-provider request totals, error rate, mean latency and last success."""
+    health: Dict[str, Dict[str, Any]] = {}
+    for (provider, status), child in list(UPSTREAM_REQUESTS._children.items()):
+        entry = health.setdefault(provider, {"requests": 0, "errors": 0, "by_status": {}})
+        count = int(child.get())
+        entry["requests"] += count
+        entry["by_status"][status] = count
+        if not status.startswith("2"):
+            entry["errors"] += count
+    for provider, entry in health.items():
+        latency = UPSTREAM_SECONDS.labels(provider)
+        entry["error_rate"] = entry["errors"] / entry["requests"] if entry["requests"] else 0.0
+        entry["avg_latency_s"] = latency.sum / latency.count if latency.count else None
+        last = LAST_SUCCESS.get(provider)
+        entry["last_success_age_s"] = time.time() - last if last else None
+    return health
@@ -37,6 +37,9 @@ class Token:
     security_data: Dict[str, Any] = None
     security_flags: List[str] = None
 
+    # Latency: Clock.now() per pipeline stage reached (see bot/latency.py)
+    stage_times: Dict[str, float] = None
+
 @dataclass
 class AnalysisResult:
     """
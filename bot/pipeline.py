@@ -0,0 +1,162 @@
+import asyncio
+import itertools
+import logging
+import time
+from typing import Dict, List, Optional, Set
+from bot.clock import Clock
+from bot.config import Config
+from bot.metrics import QUEUE_DEPTH, SEEN_LOOKUPS, STAGE_SECONDS
+
+logger = logging.getLogger("Pipeline")
+
+STAGES = ("detail", "enrich", "score", "act")
+
+class Pipeline:
+    """
+    Discovery as independent stages connected by bounded queues:
+
+        poll -> [profiles] -> detail xN -> [enrich] -> enrich xN -> [score] -> score xN -> [act] -> act x1
+
+    - poll:   fetches the profile feed; the interval (from poll start) adapts to the feed (see AdaptiveCadence)
+    - detail: pair details -> Token, price update for held pairs, seen check
+    - enrich: GoPlus/Moralis risk checks (the slow, I/O bound stage); its queue is
+              ordered by FreshnessScheduler priority and stale tokens are dropped
+    - score:  scoring/classification (CPU only)
+    - act:    console/alerts/trades and mark seen; one worker so trading state stays serial
+    A full queue blocks the stage feeding it (backpressure), so a slow stage
+    slows intake instead of piling up work, and throughput is set by the
+    slowest stage's worker count rather than the sum of all stage latencies.
+    Periodic jobs (reject summary, checkpoint, archive, hourly report, /api state)
+    run on their own timer instead of at the end of a cycle.
+    """
+    def __init__(self, bot, workers: Optional[Dict[str, int]] = None, queue_size: Optional[int] = None):
+        self.bot = bot
+        self.workers = {**Config.PIPELINE_WORKERS, **(workers or {})}
+        self.workers["act"] = 1 # Trades and alerts must not interleave
+        size = queue_size or Config.PIPELINE_QUEUE_SIZE
+        self.queues: Dict[str, asyncio.Queue] = {
+            stage: (asyncio.PriorityQueue if stage == "enrich" else asyncio.Queue)(maxsize=size)
+            for stage in STAGES}
+        self.scheduler = bot.scheduler
+        self._seq = itertools.count() # Tie-break so equal priorities stay FIFO
+        # Unseen pairs somewhere between detail and act; a re-announced profile
+        # must not be analyzed twice before act marks it seen
+        self.in_flight: Set[str] = set()
+        self.tasks: List[asyncio.Task] = []
+        self.cadence = bot.cadence
+        for stage, queue in self.queues.items():
+            QUEUE_DEPTH.labels(f"pipeline_{stage}").set_function(queue.qsize)
+
+    def start(self) -> List[asyncio.Task]:
+        supervise = self.bot._supervise
+        self.tasks.append(asyncio.create_task(supervise("Pipeline poll", self._poll_loop)))
+        for stage, handler in (("detail", self._detail), ("enrich", self._enrich),
+                               ("score", self._score), ("act", self._act)):
+            for i in range(max(1, int(self.workers.get(stage, 1)))):
+                worker = self._worker_loop(stage, handler)
+                self.tasks.append(asyncio.create_task(supervise(f"Pipeline {stage} #{i}", worker)))
+        self.tasks.append(asyncio.create_task(supervise("Pipeline housekeeping", self._housekeeping_loop)))
+        logger.info("Pipeline started: " + ", ".join(f"{s} x{self.workers.get(s, 1)}" for s in STAGES))
+        return self.tasks
+
+    def stop(self):
+        for task in self.tasks:
+            task.cancel()
+        self.tasks = []
+
+    def depth(self) -> int:
+        return sum(queue.qsize() for queue in self.queues.values())
+
+    # --- Stages ---
+
+    async def _poll_loop(self):
+        while self.bot.running:
+            started = time.monotonic()
+            with STAGE_SECONDS.labels("scrape").time():
+                profiles = await self.bot.scraper.fetch_profiles()
+            feed_ts = Clock.now()
+            for profile in profiles:
+                await self.queues["detail"].put((profile, feed_ts)) # Blocks while detail is saturated
+            if profiles:
+                logger.info(f"Queued {len(profiles)} profiles ({self.depth()} items in pipeline)")
+            interval = self.cadence.record([p.get("tokenAddress") for p in profiles])
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    def _worker_loop(self, stage: str, handler):
+        queue = self.queues[stage]
+
+        async def run():
+            while True:
+                item = await queue.get()
+                try:
+                    await handler(item)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"{stage} failed: {e}")
+                    self._release(item)
+                finally:
+                    queue.task_done()
+        return run
+
+    async def _detail(self, item):
+        profile, feed_ts = item
+        token = await self.bot.scraper.fetch_token(profile, feed_ts)
+        if token is None:
+            return
+
+        # Held pairs that show up in discovery are a free price update
+        self.bot._apply_prices({token.pair_address: token})
+
+        if token.pair_address in self.in_flight or self.bot.db.is_seen(token.pair_address):
+            SEEN_LOOKUPS.labels("hit").inc()
+            if self.bot.recorder:
+                self.bot.recorder.add([token])
+            return
+        SEEN_LOOKUPS.labels("miss").inc()
+        self.in_flight.add(token.pair_address)
+        early = self.bot.scorer.prescreen(token) # Once, for both the priority and a provisional alert
+        await self.queues["enrich"].put((-self.scheduler.priority(token, early), next(self._seq), token, early))
+
+    async def _enrich(self, item):
+        _, _, token, early = item
+        if self.scheduler.expired(token):
+            self.in_flight.discard(token.pair_address) # Stays unseen; a re-announcement retries it
+            return
+        provisional = self.bot._send_provisional(token, early) if Config.PROGRESSIVE_ALERTS else None
+        started = time.perf_counter()
+        params, risks = await self.bot.scorer.enrich(token)
+        self.scheduler.observe(time.perf_counter() - started)
+        await self.queues["score"].put((token, params, risks, provisional))
+
+    async def _score(self, item):
+        token, params, risks, provisional = item
+        result = self.bot.scorer.score(token, params, risks)
+        await self.queues["act"].put((result, provisional))
+
+    async def _act(self, item):
+        result, provisional = item
+        token = result.token
+        try:
+            await self.bot._process_result(result, provisional)
+            self.bot.db.mark_seen(token.pair_address, token.chain_id)
+            if self.bot.recorder:
+                self.bot.recorder.add([token]) # After analysis so security data is attached
+        finally:
+            self.in_flight.discard(token.pair_address)
+
+    def _release(self, item):
+        """A failed item leaves the pipeline; let a later poll retry its pair."""
+        for part in (item if isinstance(item, tuple) else (item,)):
+            # The Token (or, for act, an AnalysisResult) sits somewhere in the item tuple
+            pair = getattr(getattr(part, "token", part), "pair_address", None)
+            if pair:
+                self.in_flight.discard(pair)
+                return
+
+    # --- Periodic work ---
+
+    async def _housekeeping_loop(self):
+        while self.bot.running:
+            await asyncio.sleep(Config.PIPELINE_FLUSH_INTERVAL)
+            await self.bot.housekeeping()
@@ -0,0 +1,172 @@
+import asyncio
+import hmac
+import io
+import logging
+import math
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Optional
+from aiohttp import web
+from bot.config import Config
+from bot.watchdog import WATCHDOG
+
+logger = logging.getLogger("Profiling")
+
+# On-demand diagnostics for the live process (admin endpoints on the keep-alive server).
+# Nothing here runs until an endpoint is hit, so idle cost is zero.
+
+class SamplingProfiler:
+    """
+    Samples one thread's Python stack from a helper thread via sys._current_frames().
+    Output is collapsed stacks ("outer;inner;leaf count" per line), which
+    flamegraph.pl and speedscope load directly.
+    """
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+
+    def run(self, seconds: float) -> str:
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[self._collapse(frame)] += 1
+                self.samples += 1
+            time.sleep(self.interval)
+        return self.render()
+
+    @staticmethod
+    def _collapse(frame) -> str:
+        parts = []
+        while frame is not None:
+            code = frame.f_code
+            parts.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+            frame = frame.f_back
+        return ";".join(reversed(parts))
+
+    def render(self) -> str:
+        lines = [f"{stack} {count}" for stack, count in self.stacks.most_common()]
+        return "\n".join(lines) + "\n"
+
+class MemoryTracker:
+    """tracemalloc start/snapshot/stop; each snapshot is diffed against the previous one."""
+    def __init__(self):
+        self.previous: Optional[tracemalloc.Snapshot] = None
+
+    def start(self, frames: int = 10) -> str:
+        if tracemalloc.is_tracing():
+            return "tracemalloc already running\n"
+        tracemalloc.start(frames)
+        self.previous = tracemalloc.take_snapshot()
+        return f"tracemalloc started ({frames} frames)\n"
+
+    def snapshot(self, limit: int = 50) -> str:
+        if not tracemalloc.is_tracing():
+            return "tracemalloc not running; start it first\n"
+        snap = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        current, peak = tracemalloc.get_traced_memory()
+        out = io.StringIO()
+        out.write(f"traced: {current / 1e6:.2f} MB (peak {peak / 1e6:.2f} MB)\n\n")
+        if self.previous is not None:
+            out.write(f"== Top {limit} growth since previous snapshot ==\n")
+            for stat in snap.compare_to(self.previous, "traceback")[:limit]:
+                out.write(f"{stat}\n")
+                for line in stat.traceback.format()[-6:]:
+                    out.write(f"    {line}\n")
+            out.write("\n")
+        out.write(f"== Top {limit} allocations ==\n")
+        for stat in snap.statistics("lineno")[:limit]:
+            out.write(f"{stat}\n")
+        self.previous = snap
+        return out.getvalue()
+
+    def stop(self) -> str:
+        if not tracemalloc.is_tracing():
+            return "tracemalloc not running\n"
+        tracemalloc.stop()
+        self.previous = None
+        return "tracemalloc stopped\n"
+
+def dump_tasks() -> str:
+    """Stack of every pending asyncio task (what each coroutine is awaiting right now)."""
+    out = io.StringIO()
+    tasks = asyncio.all_tasks()
+    out.write(f"{len(tasks)} tasks\n\n")
+    for task in sorted(tasks, key=lambda t: t.get_name()):
+        out.write(f"== {task.get_name()} {task.get_coro()!r}\n")
+        task.print_stack(file=out)
+        out.write("\n")
+    return out.getvalue()
+
+MEMORY = MemoryTracker()
+_profile_lock = asyncio.Lock()
+
+def _authorized(request) -> bool:
+    token = request.headers.get("X-Admin-Token") or request.query.get("token")
+    if not Config.ADMIN_TOKEN or not token:
+        return False
+    return hmac.compare_digest(token.encode(), Config.ADMIN_TOKEN.encode()) # Constant time
+
+def _number(request, name: str, default, cast=int):
+    """Positive query parameter; anything else is a 400 instead of a traceback."""
+    try:
+        value = cast(request.query.get(name, default))
+    except ValueError:
+        raise web.HTTPBadRequest(text=f"{name} must be a number\n")
+    if not math.isfinite(value) or value <= 0:
+        raise web.HTTPBadRequest(text=f"{name} must be positive\n")
+    return value
+
+def _download(text: str, filename: str) -> web.Response:
+    return web.Response(text=text, content_type="text/plain", headers={
+        "Content-Disposition": f'attachment; filename="{filename}"',
+    })
+
+def _stamp() -> str:
+    return time.strftime("%Y%m%d-%H%M%S")
+
+async def admin_handler(request):
+    """
+    /admin/profile?seconds=N     -> collapsed-stack CPU profile of the event loop thread
+    /admin/memory/start|snapshot|stop -> tracemalloc control; snapshot diffs against the last one
+    /admin/tasks                 -> asyncio task stacks
+    /admin/stalls                -> top blocking call sites (needs LOOP_WATCHDOG)
+    Requires ADMIN_TOKEN (X-Admin-Token header or ?token=); disabled when it's unset.
+    """
+    if not _authorized(request):
+        raise web.HTTPNotFound() # Don't advertise the endpoints
+
+    action = request.match_info["action"]
+    if action == "profile":
+        seconds = min(_number(request, "seconds", 10, float), Config.PROFILE_MAX_SECONDS)
+        if _profile_lock.locked():
+            return web.Response(status=409, text="profile already running\n")
+        async with _profile_lock:
+            # The handler runs on the loop thread; sample it from a helper thread
+            profiler = SamplingProfiler(threading.get_ident())
+            logger.info(f"CPU profile started for {seconds:.0f}s")
+            text = await asyncio.to_thread(profiler.run, seconds)
+        logger.info(f"CPU profile done: {profiler.samples} samples")
+        return _download(text, f"cpu-{_stamp()}.folded")
+    if action == "memory/start":
+        return web.Response(text=MEMORY.start(min(_number(request, "frames", 10), 100)))
+    if action == "memory/snapshot":
+        text = await asyncio.to_thread(MEMORY.snapshot, _number(request, "limit", 50))
+        return _download(text, f"memory-{_stamp()}.txt")
+    if action == "memory/stop":
+        return web.Response(text=MEMORY.stop())
+    if action == "tasks":
+        return _download(dump_tasks(), f"tasks-{_stamp()}.txt")
+    if action == "stalls":
+        if not Config.LOOP_WATCHDOG:
+            return web.Response(status=409, text="loop watchdog is off (LOOP_WATCHDOG=true)\n")
+        return web.Response(text=WATCHDOG.report(_number(request, "limit", 20)))
+    raise web.HTTPNotFound()
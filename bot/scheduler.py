@@ -0,0 +1,67 @@
+import logging
+import math
+from typing import List, Optional, Tuple
+from bot.clock import Clock
+from bot.config import Config
+from bot.metrics import REGISTRY
+from bot.models.token import AnalysisResult, Token
+
+logger = logging.getLogger("Scheduler")
+
+SCHEDULER_SKIPPED = REGISTRY.counter(
+    "bot_scheduler_skipped_total", "Unseen tokens not enriched, by reason", ["reason"])
+
+class FreshnessScheduler:
+    """
+    Decides which unseen tokens get enriched first when there's more work than time.
+
+    priority = weighted mix (Config.SCHEDULER_WEIGHTS) of
+      freshness - halves every SCHEDULER_HALF_LIFE minutes since pairCreatedAt
+      liquidity - log scale, $100k+ counts as full
+      score     - the local-only prescreen score (no API calls)
+
+    A token is worth enriching until its deadline: SCHEDULER_MAX_WAIT seconds after
+    it showed up in the feed (a later alert is stale news) or MAX_AGE_HOURS after
+    pair creation, whichever comes first. Work that can't finish before then,
+    going by a running average of enrichment time, is dropped; it stays unseen,
+    so a re-announcement gets a fresh chance.
+    """
+    def __init__(self, scorer):
+        self.scorer = scorer
+        self.enrich_seconds = 1.0 # Running average of one enrichment
+
+    def priority(self, token: Token, early: Optional[AnalysisResult] = None) -> float:
+        """early = the token's prescreen result, if the caller already has it."""
+        weights = Config.SCHEDULER_WEIGHTS
+        age_min = max(0.0, Clock.now() - token.pair_created_at / 1000) / 60 if token.pair_created_at else math.inf
+        freshness = 0.5 ** (age_min / Config.SCHEDULER_HALF_LIFE)
+        liquidity = min(1.0, math.log10(1 + max(0.0, token.liquidity_usd or 0.0)) / 5)
+        score = (early or self.scorer.prescreen(token)).score / 100
+        return (weights.get("freshness", 0) * freshness + weights.get("liquidity", 0) * liquidity
+                + weights.get("score", 0) * score)
+
+    def order(self, tokens: List[Token]) -> List[Tuple[Token, AnalysisResult]]:
+        """Freshest and most promising first, each with its prescreen result (reused for provisional alerts)."""
+        ranked = []
+        for token in tokens:
+            early = self.scorer.prescreen(token)
+            ranked.append((self.priority(token, early), token, early))
+        ranked.sort(key=lambda item: item[0], reverse=True)
+        return [(token, early) for _, token, early in ranked]
+
+    def deadline(self, token: Token) -> float:
+        feed_ts = (token.stage_times or {}).get("feed", Clock.now())
+        deadline = feed_ts + Config.SCHEDULER_MAX_WAIT
+        if token.pair_created_at:
+            deadline = min(deadline, token.pair_created_at / 1000 + Config.MAX_AGE_HOURS * 3600)
+        return deadline
+
+    def expired(self, token: Token) -> bool:
+        """Would enriching it now finish past its deadline?"""
+        if Clock.now() + self.enrich_seconds <= self.deadline(token):
+            return False
+        SCHEDULER_SKIPPED.labels("expired").inc()
+        return True
+
+    def observe(self, seconds: float):
+        self.enrich_seconds += 0.2 * (seconds - self.enrich_seconds)
@@ -0,0 +1,86 @@
+import logging
+from collections import OrderedDict, deque
+from typing import Deque, List
+from bot.config import Config
+from bot.metrics import REGISTRY, UPSTREAM_REQUESTS
+
+logger = logging.getLogger("Cadence")
+
+POLL_INTERVAL = REGISTRY.gauge(
+    "bot_discovery_interval_seconds", "Current discovery poll interval")
+
+class AdaptiveCadence:
+    """
+    Picks the next discovery poll interval from what the feed has been doing:
+    - change rate: aims for ~DISCOVERY_TARGET_NEW new profiles per poll, so launch
+      waves get polled fast and an idle feed backs off (each step at most 2x either way)
+    - rate budget: each poll costs 1 feed request + 1 detail request per profile;
+      the interval never projects above DEXSCREENER_RATE_BUDGET requests/minute
+    - 429s: any DexScreener 429 since the last poll doubles the interval, and the
+      floor stays raised for the next few polls
+    Always within [DISCOVERY_MIN_INTERVAL, DISCOVERY_MAX_INTERVAL].
+    """
+    def __init__(self, window: int = 5, memory: int = 5000):
+        self.interval = Config.DISCOVERY_INTERVAL
+        self.new_counts: Deque[int] = deque(maxlen=window)
+        self.request_counts: Deque[int] = deque(maxlen=window) # Feed + detail requests per poll
+        self.recent: "OrderedDict[str, None]" = OrderedDict() # Token addresses already announced
+        self.memory = memory
+        self.cooldown_polls = 0
+        self._last_429 = self._count_429()
+        POLL_INTERVAL.set(self.interval)
+
+    @staticmethod
+    def _count_429() -> float:
+        return UPSTREAM_REQUESTS.labels("dexscreener", 429).get()
+
+    def count_new(self, addresses: List[str]) -> int:
+        """How many of this poll's token addresses weren't announced in recent polls (the feed repeats its latest entries)."""
+        new = 0
+        for address in addresses:
+            if address in self.recent:
+                self.recent.move_to_end(address)
+                continue
+            self.recent[address] = None
+            new += 1
+        while len(self.recent) > self.memory:
+            self.recent.popitem(last=False)
+        return new
+
+    def record(self, addresses: List[str]) -> float:
+        """Feeds one poll's token addresses in; returns the seconds to wait before the next poll."""
+        warmup = not self.recent # Everything is "new" on the first poll
+        new_count = self.count_new(addresses)
+        self.request_counts.append(1 + len(addresses))
+        if not warmup:
+            self.new_counts.append(new_count)
+        if not Config.ADAPTIVE_POLLING or not self.new_counts:
+            self.interval = Config.DISCOVERY_INTERVAL
+            return self.interval
+
+        # Change rate: scale so the expected new profiles per poll approach the target.
+        # The latest poll counts in full when it's busier than the window average,
+        # so a launch wave speeds polling up at once while an idle feed backs off gradually.
+        avg_new = max(self.new_counts[-1], sum(self.new_counts) / len(self.new_counts))
+        factor = Config.DISCOVERY_TARGET_NEW / max(avg_new, 0.5)
+        interval = self.interval * min(2.0, max(0.5, factor))
+
+        # Rate budget: requests/minute at this interval = 60 / interval * requests per poll
+        avg_requests = sum(self.request_counts) / len(self.request_counts)
+        budget_floor = 60 * avg_requests / Config.DEXSCREENER_RATE_BUDGET
+        interval = max(interval, budget_floor)
+
+        # Rate limited since the last poll: back off and stay slower for a while
+        count_429 = self._count_429()
+        if count_429 > self._last_429:
+            interval = max(interval, self.interval * 2)
+            self.cooldown_polls = len(self.new_counts) or 1
+            logger.warning(f"DexScreener 429s, slowing discovery to {interval:.1f}s")
+        elif self.cooldown_polls > 0:
+            self.cooldown_polls -= 1
+            interval = max(interval, self.interval)
+        self._last_429 = count_429
+
+        self.interval = min(Config.DISCOVERY_MAX_INTERVAL, max(Config.DISCOVERY_MIN_INTERVAL, interval))
+        POLL_INTERVAL.set(self.interval)
+        return self.interval
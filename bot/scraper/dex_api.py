@@ -1,15 +1,18 @@
 import aiohttp
 import asyncio
 import logging
+import time
 from typing import List, Optional, Dict, Any
 from bot.config import Config
 from bot.scraper.anti_block import AntiBlock
+from bot.metrics import observe_request
 
 logger = logging.getLogger(__name__)
 
 class DexAPI:
     def __init__(self):
         self.anti_block = AntiBlock()
+        self.base_url = Config.DEXSCREENER_BASE_URL
 
     async def fetch_latest_pairs(self) -> List[Dict[str, Any]]:
         """
@@ -19,7 +22,7 @@ class DexAPI:
         # "https://api.dexscreener.com/token-profiles/latest/v1" is often used for new tokens events
         # Alternatively, we can use https://api.dexscreener.com/latest/dex/search/?q=* (but that's search)
         # Let's try the token-profiles one as it's the standard feed for many bots.
-        url = "https://api.dexscreener.com/token-profiles/latest/v1"
+        url = f"{self.base_url}/token-profiles/latest/v1"
         return await self._make_request(url)
 
     async def get_token_pairs(self, chain_id: str, pair_addresses: List[str]) -> List[Dict[str, Any]]:
@@ -30,17 +33,22 @@ class DexAPI:
         if not pair_addresses:
             return []
         
-        # Max 30 pairs per request usually, let's chunk if valid
-        pairs_str = ",".join(pair_addresses[:30]) 
-        url = f"https://api.dexscreener.com/latest/dex/pairs/{chain_id}/{pairs_str}"
-        data = await self._make_request(url)
-        return data.get("pairs", []) if data else []
+        # Max 30 pairs per request, so chunk and fetch the chunks concurrently
+        chunks = [pair_addresses[i:i + 30] for i in range(0, len(pair_addresses), 30)]
+        urls = [f"{self.base_url}/latest/dex/pairs/{chain_id}/{','.join(chunk)}" for chunk in chunks]
+        results = await asyncio.gather(*(self._make_request(url) for url in urls))
+
+        pairs = []
+        for data in results:
+            if data:
+                pairs.extend(data.get("pairs") or [])
+        return pairs
         
     async def get_pairs_by_token_address(self, token_address: str) -> List[Dict[str, Any]]:
         """
         Fetches pairs for a specific token address.
         """
-        url = f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
+        url = f"{self.base_url}/latest/dex/tokens/{token_address}"
         data = await self._make_request(url)
         return data.get("pairs", []) if data else []
 
@@ -51,9 +59,11 @@ class DexAPI:
         headers = self.anti_block.get_headers()
         
         for attempt in range(Config.MAX_RETRIES):
+            started = time.perf_counter()
             try:
                 async with aiohttp.ClientSession() as session:
                     async with session.get(url, headers=headers, timeout=Config.REQUEST_TIMEOUT) as response:
+                        observe_request("dexscreener", response.status, started)
                         if response.status == 200:
                             return await response.json()
                         elif response.status == 429:
@@ -64,6 +74,7 @@ class DexAPI:
                             await self.anti_block.backoff(attempt)
                             
             except Exception as e:
+                observe_request("dexscreener", "error", started)
                 logger.error(f"Error fetching {url}: {e}")
                 await self.anti_block.backoff(attempt)
         
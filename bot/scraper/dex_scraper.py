@@ -1,8 +1,9 @@
 import asyncio
 import logging
-import time
 from typing import List, Optional, Tuple
+from bot.clock import Clock
 from bot.scraper.dex_api import DexAPI
+from bot.latency import LATENCY
 from bot.models.token import Token
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,7 @@ class DexScraper:
         
         # 1. Fetch Latest Profiles
         profiles = await self.api.fetch_latest_pairs()
+        feed_ts = Clock.now()
         if not profiles:
             logger.warning("No new profiles found.")
             return []
@@ -38,7 +40,7 @@ class DexScraper:
                 continue
             
             # Pass profile data (like icon) to be merged later
-            tasks.append(self._fetch_and_normalize(token_address, profile))
+            tasks.append(self._fetch_and_normalize(token_address, profile, feed_ts))
             
         # Execute Concurrently
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -51,7 +53,16 @@ class DexScraper:
             
         return tokens
 
-    async def _fetch_and_normalize(self, token_address: str, profile: dict) -> Optional[Token]:
+    async def fetch_profiles(self) -> List[dict]:
+        """Step 1 on its own: the latest profiles that name a token address."""
+        profiles = await self.api.fetch_latest_pairs()
+        return [p for p in profiles or [] if p.get("tokenAddress")]
+
+    async def fetch_token(self, profile: dict, feed_ts: Optional[float] = None) -> Optional[Token]:
+        """Steps 2-3 for one profile: pair details -> Token (None if unavailable)."""
+        return await self._fetch_and_normalize(profile["tokenAddress"], profile, feed_ts)
+
+    async def _fetch_and_normalize(self, token_address: str, profile: dict, feed_ts: Optional[float] = None) -> Optional[Token]:
         # Helper to fetch pairs and normalize specific token
         try:
             pairs_data = await self.api.get_pairs_by_token_address(token_address)
@@ -67,7 +78,11 @@ class DexScraper:
                 best_pair["info"] = best_pair.get("info", {})
                 best_pair["info"]["icon"] = profile["imageUrl"]
 
-            return self._normalize_pair(best_pair)
+            token = self._normalize_pair(best_pair)
+            if token:
+                LATENCY.mark(token, "feed", feed_ts)
+                LATENCY.mark(token, "detail")
+            return token
         except Exception as e:
             return None
 
@@ -80,7 +95,7 @@ class DexScraper:
             quote = data.get("quoteToken", {})
             
             # timestamps in API are often ms
-            created_at = data.get("pairCreatedAt", int(time.time() * 1000))
+            created_at = data.get("pairCreatedAt", int(Clock.now_ms()))
             
             token = Token(
                 chain_id=data.get("chainId", "unknown"),
@@ -1,15 +1,39 @@
 from aiohttp import web
 import os
 import logging
+from bot.metrics import REGISTRY
+from bot.state import STATE
+from bot.stream import stream_handler
+from bot.profiling import admin_handler
 
 logger = logging.getLogger("KeepAlive")
 
 async def root_handler(request):
     return web.Response(text="🤖 Bot is Active & Running 24/7!")
 
+async def metrics_handler(request):
+    # Prometheus text format
+    return web.Response(body=REGISTRY.render().encode(),
+                        headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"})
+
+async def api_handler(request):
+    # Pre-serialized snapshots; ETag lets pollers get a cheap 304 between cycles
+    doc = STATE.get(request.match_info["name"])
+    if doc is None:
+        return web.json_response({"error": "not found", "available": STATE.names()}, status=404)
+    etag, body = doc
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag in request.headers.get("If-None-Match", ""):
+        return web.Response(status=304, headers=headers)
+    return web.Response(body=body, content_type="application/json", headers=headers)
+
 async def start_server():
     app = web.Application()
     app.router.add_get('/', root_handler)
+    app.router.add_get('/metrics', metrics_handler)
+    app.router.add_get('/api/stream', stream_handler) # Before /api/{name}, which would match it
+    app.router.add_get('/api/{name}', api_handler)
+    app.router.add_get('/admin/{action:.+}', admin_handler)
     
     # Render provides PORT environment variable
     port = int(os.environ.get("PORT", 8080))
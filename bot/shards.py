@@ -0,0 +1,241 @@
+import asyncio
+import logging
+import multiprocessing
+import queue
+import signal
+import time
+from typing import Dict, List, Optional
+from bot.analyzer.goplus import GoPlusClient
+from bot.analyzer.scoring import ScoringEngine
+from bot.clock import Clock
+from bot.config import Config
+from bot.latency import LATENCY
+from bot.logs import setup_logging, stop_logging
+from bot.metrics import REGISTRY, STAGE_SECONDS
+from bot.pipeline import Pipeline
+from bot.scheduler import FreshnessScheduler
+from bot.scraper.dex_scraper import DexScraper
+from bot.storage.db import Database
+
+logger = logging.getLogger("Shards")
+
+SHARD_DROPPED = REGISTRY.counter(
+    "bot_shard_dropped_profiles_total", "Profiles not routed because the shard's inbox was full", ["shard"])
+SHARD_RESTARTS = REGISTRY.counter(
+    "bot_shard_restarts_total", "Shard worker processes restarted after exiting", ["shard"])
+
+def parse_shards(spec: str) -> Dict[str, List[str]]:
+    """
+    'auto' -> one shard per GoPlusClient.CHAIN_MAP chain; otherwise groups like
+    'solana;ethereum,bsc;base'. An "other" shard ("*") takes every chain not listed.
+    """
+    if spec.strip().lower() == "auto":
+        groups = [[chain] for chain in GoPlusClient.CHAIN_MAP]
+    else:
+        groups = [[c.strip().lower() for c in group.split(",") if c.strip()] for group in spec.split(";")]
+    shards = {"+".join(group): group for group in groups if group}
+    if not any("*" in chains for chains in shards.values()):
+        shards["other"] = ["*"]
+    return shards
+
+# --- Worker process ---
+
+class ShardPipeline(Pipeline):
+    """Pipeline fed with the supervisor's routed profiles instead of polling the feed itself."""
+    def __init__(self, bot, inbox):
+        super().__init__(bot)
+        self.inbox = inbox
+
+    async def _poll_loop(self):
+        loop = asyncio.get_running_loop()
+        while self.bot.running:
+            batch = await loop.run_in_executor(None, self.inbox.get)
+            if batch is None: # Supervisor is shutting down
+                self.bot.running = False
+                return
+            profiles, feed_ts = batch
+            for profile in profiles:
+                await self.queues["detail"].put((profile, feed_ts))
+
+class ShardBot:
+    """
+    The analysis half of Bot, running in a shard worker process. Seen pairs go to the
+    shared SQLite file (WAL); results go back to the supervisor, which owns the portfolio,
+    alerts, recorder and the held-pair refresh loop.
+    """
+    def __init__(self, name: str, inbox, results):
+        self.name = name
+        self.results = results
+        self.scraper = DexScraper()
+        self.scorer = ScoringEngine()
+        self.db = Database()
+        self.scheduler = FreshnessScheduler(self.scorer)
+        self.cadence = None # The supervisor polls the feed
+        self.recorder = None # Archived by the supervisor
+        self.running = True
+        self.pipeline = ShardPipeline(self, inbox)
+
+    async def run(self):
+        self.pipeline.start()
+        while self.running:
+            await asyncio.sleep(0.5)
+        # Inbox closed: let queued work finish before exiting
+        deadline = time.monotonic() + Config.SHARD_DRAIN_TIMEOUT
+        while (self.pipeline.depth() or self.pipeline.in_flight) and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        self.pipeline.stop()
+
+    async def _supervise(self, name: str, loop_fn):
+        delay = 1
+        while self.running:
+            try:
+                await loop_fn()
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[{self.name}] {name} crashed: {e}. Restarting in {delay}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60)
+
+    def _apply_prices(self, token_map: dict):
+        pass # Held pairs live in the supervisor; its refresh loop prices them
+
+    def _send_provisional(self, token, early=None):
+        return None # Provisional alerts need the supervisor's outbox future
+
+    async def _process_result(self, result, provisional=None):
+        self.results.put((self.name, result))
+
+    async def housekeeping(self):
+        pass # Reject summary, checkpoint and /api state happen in the supervisor
+
+def run_shard(name: str, inbox, results):
+    """Worker process entry point."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN) # Shutdown comes from the supervisor
+    setup_logging()
+    logger.info(f"Shard {name} started")
+    try:
+        asyncio.run(ShardBot(name, inbox, results).run())
+    finally:
+        logger.info(f"Shard {name} stopped")
+        stop_logging()
+
+# --- Supervisor ---
+
+class ShardSupervisor:
+    """
+    Multi-process discovery (SHARDS). This process polls the feed once (one cadence,
+    one DexScreener rate budget) and routes each profile by chainId to the worker owning
+    that chain. Workers run detail -> enrich -> score in their own process and event loop,
+    so chains scale across cores and a slow chain only backs up its own worker: when a
+    worker's inbox is full its new profiles are dropped instead of stalling the poll.
+    Results come back over one queue and go through Bot._process_result here, so there
+    is still one portfolio and one alert stream. Workers that exit are restarted.
+    """
+    def __init__(self, bot, shards: Optional[Dict[str, List[str]]] = None):
+        self.bot = bot
+        self.shards = shards or parse_shards(Config.SHARDS)
+        self.ctx = multiprocessing.get_context("spawn") # Nothing inherited from this event loop
+        self.results = self.ctx.Queue()
+        self.inboxes = {name: self.ctx.Queue(maxsize=Config.SHARD_INBOX_SIZE) for name in self.shards}
+        self.routes = {chain: name for name, chains in self.shards.items() for chain in chains}
+        self.processes: Dict[str, multiprocessing.Process] = {}
+        self.tasks: List[asyncio.Task] = []
+
+    def start(self) -> List[asyncio.Task]:
+        self.bot.db.enable_wal()
+        for name in self.shards:
+            self._spawn_worker(name)
+        supervise = self.bot._supervise
+        for name, loop_fn in (("Shard poll", self._poll_loop), ("Shard results", self._results_loop),
+                              ("Shard monitor", self._monitor_loop), ("Shard housekeeping", self._housekeeping_loop)):
+            self.tasks.append(asyncio.create_task(supervise(name, loop_fn)))
+        logger.info("Shards started: " + ", ".join(f"{n} ({','.join(c)})" for n, c in self.shards.items()))
+        return self.tasks
+
+    async def stop(self):
+        """Closes the inboxes, collects what the workers still finish, then stops them."""
+        for inbox in self.inboxes.values():
+            try:
+                inbox.put_nowait(None)
+            except queue.Full:
+                pass # Terminated below
+        deadline = time.monotonic() + Config.SHARD_DRAIN_TIMEOUT + 5
+        while any(p.is_alive() for p in self.processes.values()) and time.monotonic() < deadline:
+            await self._drain_results()
+            await asyncio.sleep(0.1)
+        await self._drain_results()
+        for name, process in self.processes.items():
+            if process.is_alive():
+                logger.warning(f"Shard {name} did not stop in time, terminating")
+                process.terminate()
+            process.join(1)
+        for task in self.tasks:
+            task.cancel()
+        self.tasks = []
+
+    def _spawn_worker(self, name: str):
+        process = self.ctx.Process(target=run_shard, args=(name, self.inboxes[name], self.results),
+                                   name=f"shard-{name}", daemon=True)
+        process.start()
+        self.processes[name] = process
+
+    def route(self, profile: dict) -> Optional[str]:
+        return self.routes.get(str(profile.get("chainId", "")).lower(), self.routes.get("*"))
+
+    async def _poll_loop(self):
+        while self.bot.running:
+            started = time.monotonic()
+            with STAGE_SECONDS.labels("scrape").time():
+                profiles = await self.bot.scraper.fetch_profiles()
+            feed_ts = Clock.now()
+            batches: Dict[str, List[dict]] = {}
+            for profile in profiles:
+                batches.setdefault(self.route(profile), []).append(profile)
+            for name, batch in batches.items():
+                try:
+                    self.inboxes[name].put_nowait((batch, feed_ts))
+                except queue.Full:
+                    # That worker is behind; the others don't wait on it
+                    SHARD_DROPPED.labels(name).inc(len(batch))
+                    logger.warning(f"Shard {name} is behind, dropped {len(batch)} profiles")
+            interval = self.bot.cadence.record([p.get("tokenAddress") for p in profiles])
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    async def _results_loop(self):
+        loop = asyncio.get_running_loop()
+        while self.bot.running:
+            try:
+                _, result = await loop.run_in_executor(None, self.results.get, True, 1.0)
+            except queue.Empty:
+                continue
+            await self._handle(result)
+
+    async def _drain_results(self):
+        while True:
+            try:
+                _, result = self.results.get_nowait()
+            except queue.Empty:
+                return
+            await self._handle(result)
+
+    async def _handle(self, result):
+        LATENCY.merge(result.token) # Stages up to "scored" were marked in the worker
+        await self.bot._process_result(result)
+        if self.bot.recorder:
+            self.bot.recorder.add([result.token])
+
+    async def _monitor_loop(self):
+        while self.bot.running:
+            await asyncio.sleep(Config.SHARD_CHECK_INTERVAL)
+            for name, process in list(self.processes.items()):
+                if self.bot.running and not process.is_alive():
+                    logger.error(f"Shard {name} exited ({process.exitcode}), restarting")
+                    SHARD_RESTARTS.labels(name).inc()
+                    self._spawn_worker(name)
+
+    async def _housekeeping_loop(self):
+        while self.bot.running:
+            await asyncio.sleep(Config.PIPELINE_FLUSH_INTERVAL)
+            await self.bot.housekeeping()
@@ -0,0 +1,187 @@
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import os
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, List, Optional
+
+# Allow `python bot/simulator/backtest.py` as well as `python -m bot.simulator.backtest`
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from bot.clock import Clock, VirtualClock
+from bot.config import Config
+from bot.analyzer.scoring import ScoringEngine
+from bot.scraper.dex_scraper import DexScraper
+from bot.simulator.recorder import load_snapshots
+from bot.simulator.trader import TRADER_SETTINGS, PaperTrader
+
+logger = logging.getLogger("Backtest")
+
+class ReplayGoPlus:
+    """Stand-in for GoPlusClient that answers from archived security results."""
+    def __init__(self):
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    async def check_token_security(self, address: str, chain_id: str) -> Dict[str, Any]:
+        return self.results.get(address.lower(), {})
+
+class ReplayMoralis:
+    """Stand-in for MoralisClient; only the 'whale data available' signal is archived."""
+    def __init__(self):
+        self.whales = set()
+
+    async def get_whale_activity(self, address: str, chain: str) -> List[Dict]:
+        return [{"replayed": True}] if address.lower() in self.whales else []
+
+class InMemoryDatabase:
+    """Stand-in for Database's seen-pair cache."""
+    def __init__(self):
+        self.seen = set()
+
+    def is_seen(self, pair_address: str) -> bool:
+        return pair_address in self.seen
+
+    def mark_seen(self, pair_address: str, chain_id: str):
+        self.seen.add(pair_address)
+
+def parse_settings(pairs: Iterable[str]) -> Dict[str, Any]:
+    """
+    Parses KEY=VALUE strings (values as JSON where possible).
+    Nested weights use a dot: WEIGHTS.liquidity_safety=25
+    """
+    settings = {}
+    for pair in pairs:
+        key, _, raw = pair.partition("=")
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            value = raw
+        settings[key.strip()] = value
+    return settings
+
+@contextmanager
+def config_overrides(settings: Dict[str, Any]):
+    """Temporarily applies Config overrides, restoring the originals afterwards."""
+    saved = {}
+    weight_overrides = {}
+    try:
+        for key, value in settings.items():
+            if key.startswith("WEIGHTS."):
+                weight_overrides[key.split(".", 1)[1]] = value
+                continue
+            if not hasattr(Config, key):
+                raise KeyError(f"Unknown setting: {key}")
+            saved[key] = getattr(Config, key)
+            setattr(Config, key, value)
+        if weight_overrides:
+            saved.setdefault("WEIGHTS", Config.WEIGHTS)
+            Config.WEIGHTS = {**Config.WEIGHTS, **weight_overrides}
+        yield
+    finally:
+        for key, value in saved.items():
+            setattr(Config, key, value)
+
+class Backtester:
+    """
+    Replays archived snapshots through the real ScoringEngine and PaperTrader.
+    Network clients are swapped for replay stand-ins, the trader runs without
+    persistence and the clock is virtual, so a day of data replays in seconds.
+    """
+    def __init__(self, snapshots: Iterable[Dict[str, Any]], settings: Optional[Dict[str, Any]] = None,
+                 initial_balance: float = 200.0):
+        self.snapshots = snapshots
+        self.settings = dict(settings or {})
+        self.initial_balance = initial_balance
+
+    def _split_settings(self):
+        trader_settings = {k: v for k, v in self.settings.items() if k in TRADER_SETTINGS}
+        config_settings = {k: v for k, v in self.settings.items() if k not in TRADER_SETTINGS}
+        # Keep the per-token DEBUG prints out of the replay unless explicitly asked for
+        config_settings.setdefault("LOG_LEVEL", "WARNING")
+        return trader_settings, config_settings
+
+    async def run(self) -> Dict[str, Any]:
+        trader_settings, config_settings = self._split_settings()
+        clock = VirtualClock()
+
+        with config_overrides(config_settings), Clock.use(clock):
+            trader = PaperTrader(db_path=None, settings=trader_settings)
+            trader.reset_portfolio(initial_balance=self.initial_balance)
+            return await self._replay(clock, trader)
+
+    async def _replay(self, clock: VirtualClock, trader: PaperTrader) -> Dict[str, Any]:
+        scraper = DexScraper()
+        scorer = ScoringEngine()
+        goplus = ReplayGoPlus()
+        moralis = ReplayMoralis()
+        scorer.risk_engine.goplus = goplus
+        scorer.risk_engine.moralis = moralis
+        seen = InMemoryDatabase()
+
+        snapshot_count = 0
+        analyzed = 0
+        signals = 0
+        peak_equity = self.initial_balance
+        max_drawdown = 0.0
+
+        for snapshot in self.snapshots:
+            clock.advance_to(snapshot.get("ts", 0))
+            snapshot_count += 1
+
+            tokens = []
+            for entry in snapshot.get("tokens", []):
+                token = scraper._normalize_pair(entry.get("pair") or {})
+                if not token:
+                    continue
+                if entry.get("security"):
+                    goplus.results[token.base_token_address.lower()] = entry["security"]
+                if "WHALE_DATA_AVAILABLE" in (entry.get("flags") or []):
+                    moralis.whales.add(token.base_token_address.lower())
+                tokens.append(token)
+
+            token_map = {t.pair_address: t for t in tokens}
+            trader.update_positions(token_map)
+
+            for token in tokens:
+                if seen.is_seen(token.pair_address):
+                    continue
+                result = await scorer.analyze_token(token)
+                analyzed += 1
+                if result.action in ["HIGH_PRIORITY", "ALERT"]:
+                    signals += 1
+                    trader.enter_trade(token)
+                seen.mark_seen(token.pair_address, token.chain_id)
+
+            equity = trader.get_equity()
+            peak_equity = max(peak_equity, equity)
+            if peak_equity > 0:
+                max_drawdown = max(max_drawdown, (peak_equity - equity) / peak_equity * 100)
+
+        stats = trader.get_detailed_stats()
+        stats.update({
+            "final_equity": trader.get_equity(),
+            "max_drawdown_pct": max_drawdown,
+            "snapshots": snapshot_count,
+            "tokens_analyzed": analyzed,
+            "signals": signals,
+            "settings": self.settings
+        })
+        return stats
+
+def run_backtest(snapshots: Iterable[Dict[str, Any]], settings: Optional[Dict[str, Any]] = None,
+                 initial_balance: float = 200.0) -> Dict[str, Any]:
+    return asyncio.run(Backtester(snapshots, settings, initial_balance).run())
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay archived snapshots through the scoring and trading code.")
+    parser.add_argument("archive", help="Snapshot archive written with SNAPSHOT_ARCHIVE (JSONL)")
+    parser.add_argument("--set", dest="settings", action="append", default=[],
+                        help="Override a setting, e.g. --set SCORE_ALERT_MIN=85 --set TP_MULTIPLIER=3")
+    parser.add_argument("--balance", type=float, default=200.0, help="Starting paper balance")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    stats = run_backtest(load_snapshots(args.archive), parse_settings(args.settings), args.balance)
+    print(json.dumps(stats, indent=2))
@@ -0,0 +1,106 @@
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+from bot.config import Config
+from bot.analyzer.scoring import HARD_REJECT_FLAGS
+from bot.models.token import AnalysisResult, Token
+from bot.simulator.trader import TRADER_SETTINGS, PaperTrader
+from bot.storage.db import Database
+
+logger = logging.getLogger("Strategies")
+
+class StrategyBook:
+    """
+    N named paper portfolios fed by the same AnalysisResult stream and price refresh.
+    Each strategy owns an isolated PaperTrader (own SQLite file, own trigger index);
+    the first strategy is the primary one that drives Telegram alerts and keeps
+    using the bot's main database.
+    """
+    def __init__(self, strategies: Optional[Dict[str, Dict[str, Any]]] = None,
+                 primary_db_path: str = "bot/storage/cache.db"):
+        strategies = strategies or {"main": {}}
+        self.settings: Dict[str, Dict[str, Any]] = {}
+        self.traders: Dict[str, PaperTrader] = {}
+
+        for i, (name, settings) in enumerate(strategies.items()):
+            if i == 0:
+                db_path = primary_db_path
+            else:
+                db_path = f"bot/storage/strategy_{name}.db"
+                Database(db_path) # Ensure schema for the strategy's own file
+            trader_settings = {k: v for k, v in settings.items() if k in TRADER_SETTINGS}
+            self.traders[name] = PaperTrader(db_path=db_path, settings=trader_settings)
+            self.settings[name] = dict(settings)
+
+        self.primary_name = next(iter(self.traders))
+        if len(self.traders) > 1:
+            logger.info(f"Running {len(self.traders)} strategies: {', '.join(self.traders)}")
+
+    @property
+    def primary(self) -> PaperTrader:
+        return self.traders[self.primary_name]
+
+    def set_trade_listener(self, listener):
+        """listener(strategy name, "entry"/"exit", details) for every trader."""
+        for name, trader in self.traders.items():
+            trader.on_trade = lambda event, details, name=name: listener(name, event, details)
+
+    def notifies(self, name: str) -> bool:
+        """Primary notifies by default; shadow strategies only if NOTIFY is set."""
+        return bool(self.settings[name].get("NOTIFY", name == self.primary_name))
+
+    def accepts(self, name: str, result: AnalysisResult) -> bool:
+        """Per-strategy score gate. Hard risk rejects apply to every strategy."""
+        min_score = self.settings[name].get("MIN_SCORE", Config.SCORE_ALERT_MIN)
+        if HARD_REJECT_FLAGS.intersection(result.risk_flags):
+            return False
+        return result.score >= min_score
+
+    def shadow_trade(self, result: AnalysisResult) -> List[str]:
+        """Lets every non-primary strategy act on a result. Returns the names that entered."""
+        entered = []
+        for name, trader in self.traders.items():
+            if name == self.primary_name or not self.accepts(name, result):
+                continue
+            if trader.enter_trade(result.token):
+                entered.append(name)
+        return entered
+
+    def get_active_pairs(self) -> List[tuple]:
+        """Union of held pairs, so one price refresh serves every strategy."""
+        pairs = set()
+        for trader in self.traders.values():
+            pairs.update(trader.get_active_pairs())
+        return list(pairs)
+
+    def update_positions(self, token_map: Dict[str, Token]) -> List[Tuple[str, str]]:
+        """Returns (strategy name, notification) pairs."""
+        out = []
+        for name, trader in self.traders.items():
+            for notif in trader.update_positions(token_map):
+                out.append((name, notif))
+        return out
+
+    def format_notification(self, name: str, text: str) -> str:
+        return text if name == self.primary_name else f"[{name}] {text}"
+
+    def checkpoint(self):
+        for trader in self.traders.values():
+            trader.checkpoint()
+
+    def reset_all(self, initial_balance: float = 200.0):
+        for trader in self.traders.values():
+            trader.reset_portfolio(initial_balance=initial_balance)
+
+    def get_comparison_text(self) -> str:
+        """One line per strategy: equity, realized PnL, record and open slots."""
+        msg = "🧪 **STRATEGIES**\n\n"
+        for name, trader in self.traders.items():
+            stats = trader.get_detailed_stats()
+            star = "⭐ " if name == self.primary_name else ""
+            msg += (
+                f"{star}**{name}**: `${trader.get_equity():.2f}` equity | "
+                f"PnL `${trader.portfolio['realized_pnl']:+.2f}` | "
+                f"{stats['wins']}W/{stats['losses']}L | "
+                f"{trader.get_open_count()}/{trader.MAX_OPEN_POSITIONS} open\n"
+            )
+        return msg
@@ -0,0 +1,66 @@
+import json
+import logging
+import os
+from typing import Dict, Any, Iterable, Iterator, List
+from bot.clock import Clock
+from bot.models.token import Token
+
+logger = logging.getLogger("Recorder")
+
+class SnapshotRecorder:
+    """
+    Archives what the bot saw each cycle so it can be replayed by the backtester.
+    One JSON line per cycle:
+        {"ts": <epoch seconds>, "tokens": [{"pair": <raw DexScreener pair>,
+                                            "security": <GoPlus result or null>,
+                                            "flags": [...]}, ...]}
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        archive_dir = os.path.dirname(path)
+        if archive_dir:
+            os.makedirs(archive_dir, exist_ok=True)
+
+    def add(self, tokens: Iterable[Token]):
+        for token in tokens:
+            if not token.raw_data:
+                continue
+            entry = {
+                "pair": token.raw_data,
+                "security": token.security_data,
+                "flags": token.security_flags or []
+            }
+            # Held-position refreshes carry no security data; keep what discovery found
+            prev = self._pending.get(token.pair_address)
+            if prev and entry["security"] is None:
+                entry["security"] = prev["security"]
+                entry["flags"] = prev["flags"]
+            self._pending[token.pair_address] = entry
+
+    def flush(self, ts: float = None):
+        if not self._pending:
+            return
+        line = {"ts": ts if ts is not None else Clock.now(), "tokens": list(self._pending.values())}
+        self._pending = {}
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(line, separators=(",", ":")) + "\n")
+        except Exception as e:
+            logger.error(f"Failed to archive snapshot: {e}")
+
+def iter_snapshots(lines: Iterable) -> Iterator[Dict[str, Any]]:
+    """Decodes archived snapshot lines (str or bytes), skipping blanks and corrupt lines."""
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            logger.warning("Skipping corrupt snapshot line")
+
+def load_snapshots(path: str) -> List[Dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as f:
+        snapshots = list(iter_snapshots(f))
+    snapshots.sort(key=lambda s: s.get("ts", 0))
+    return snapshots
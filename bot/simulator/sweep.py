@@ -0,0 +1,193 @@
+import argparse
+import itertools
+import json
+import logging
+import mmap
+import os
+import random
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional
+
+# Allow `python bot/simulator/sweep.py` as well as `python -m bot.simulator.sweep`
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from bot.simulator.backtest import run_backtest, parse_settings
+from bot.simulator.recorder import iter_snapshots
+
+logger = logging.getLogger("Sweep")
+
+# The recorder writes "ts" first, so it can be read without decoding the whole line
+_TS_PREFIX = re.compile(rb'\s*\{\s*"ts"\s*:\s*(-?[0-9.eE+-]+)')
+
+class MappedArchive:
+    """
+    Read-only memory map of a snapshot archive.
+    Every worker maps the same file, so the pages are shared through the OS page
+    cache instead of being copied into each process. Snapshots are decoded lazily
+    per replay; only the line offsets are kept in memory.
+    Lines are replayed in "ts" order like load_snapshots(): an archive written out of
+    order (e.g. by concurrent recorders) is re-sorted when indexed, since the virtual
+    clock must only move forward.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = None
+        self._spans = []
+        if os.fstat(self._file.fileno()).st_size > 0:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._index()
+
+    def _index(self):
+        start = 0
+        size = len(self._map)
+        while start < size:
+            end = self._map.find(b"\n", start)
+            if end == -1:
+                end = size
+            if end > start:
+                self._spans.append((start, end))
+            start = end + 1
+        stamps = [self._ts(start, end) for start, end in self._spans]
+        if any(later < earlier for earlier, later in zip(stamps, stamps[1:])):
+            logger.warning(f"{self.path}: snapshots out of time order, sorting by ts")
+            order = sorted(range(len(stamps)), key=stamps.__getitem__) # Stable, like load_snapshots
+            self._spans = [self._spans[i] for i in order]
+
+    def _ts(self, start: int, end: int) -> float:
+        match = _TS_PREFIX.match(self._map, start, end)
+        if match:
+            try:
+                return float(match.group(1))
+            except ValueError:
+                pass
+        try:
+            return float(json.loads(self._map[start:end]).get("ts", 0))
+        except (ValueError, TypeError, AttributeError):
+            return 0.0 # Corrupt or blank: skipped on replay anyway
+
+    def __len__(self):
+        return len(self._spans)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter_snapshots(self._map[start:end] for start, end in self._spans)
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+# --- Parameter spaces ---
+
+def grid_space(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Every combination of the given values."""
+    keys = list(grid)
+    return [dict(zip(keys, combo)) for combo in itertools.product(*(grid[k] for k in keys))]
+
+def random_space(space: Dict[str, Any], samples: int, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Random samples. A list value is sampled with random.choice,
+    a (low, high) tuple uniformly (integers stay integers).
+    """
+    rng = random.Random(seed)
+    out = []
+    for _ in range(samples):
+        settings = {}
+        for key, values in space.items():
+            if isinstance(values, tuple):
+                low, high = values
+                if isinstance(low, int) and isinstance(high, int):
+                    settings[key] = rng.randint(low, high)
+                else:
+                    settings[key] = rng.uniform(low, high)
+            else:
+                settings[key] = rng.choice(values)
+        out.append(settings)
+    return out
+
+def rank_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Best profit factor first, lower max drawdown breaks ties. Failed runs go last."""
+    def key(r):
+        if "error" in r:
+            return (1, 0.0, 0.0)
+        return (0, -r.get("profit_factor", 0.0), r.get("max_drawdown_pct", 0.0))
+    return sorted(results, key=key)
+
+# --- Worker side ---
+
+_ARCHIVE: Optional[MappedArchive] = None
+_BALANCE = 200.0
+
+def _init_worker(path: str, initial_balance: float):
+    global _ARCHIVE, _BALANCE
+    # Workers only need warnings; per-trade INFO logs would swamp the terminal
+    logging.basicConfig(level=logging.WARNING)
+    _ARCHIVE = MappedArchive(path)
+    _BALANCE = initial_balance
+
+def _run_one(settings: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        return run_backtest(_ARCHIVE, settings, _BALANCE)
+    except Exception as e:
+        return {"settings": settings, "error": str(e)}
+
+def run_sweep(archive_path: str, candidates: List[Dict[str, Any]], workers: Optional[int] = None,
+              initial_balance: float = 200.0) -> List[Dict[str, Any]]:
+    """Runs one backtest per candidate across a process pool and returns them ranked."""
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(candidates) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(archive_path, initial_balance)) as pool:
+        results = list(pool.map(_run_one, candidates, chunksize=chunksize))
+    return rank_results(results)
+
+def _parse_space(specs: List[str]) -> Dict[str, Any]:
+    """KEY=v1,v2,v3 -> list of values; KEY=low:high -> uniform range (random mode)."""
+    space = {}
+    for key, raw in parse_settings(specs).items():
+        raw = str(raw)
+        if ":" in raw and "," not in raw:
+            low, high = (json.loads(x) for x in raw.split(":", 1))
+            space[key] = (low, high)
+        else:
+            space[key] = [parse_settings([f"v={v}"])["v"] for v in raw.split(",")]
+    return space
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel parameter sweep over archived snapshots.")
+    parser.add_argument("archive", help="Snapshot archive written with SNAPSHOT_ARCHIVE (JSONL)")
+    parser.add_argument("--param", dest="params", action="append", default=[],
+                        help="KEY=v1,v2,... (or KEY=low:high with --random), e.g. --param TP_MULTIPLIER=1.5,2,3")
+    parser.add_argument("--random", type=int, default=0, help="Draw N random samples instead of the full grid")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None, help="Defaults to all CPU cores")
+    parser.add_argument("--balance", type=float, default=200.0)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--out", help="Write the full ranked results as JSON")
+    args = parser.parse_args()
+
+    space = _parse_space(args.params)
+    if args.random:
+        candidates = random_space(space, args.random, args.seed)
+    else:
+        if any(isinstance(v, tuple) for v in space.values()):
+            parser.error("low:high ranges need --random")
+        candidates = grid_space(space)
+
+    started = time.time()
+    ranked = run_sweep(args.archive, candidates, args.workers, args.balance)
+    print(f"{len(candidates)} runs in {time.time() - started:.1f}s\n")
+
+    for r in ranked[:args.top]:
+        if "error" in r:
+            print(f"ERROR {r['settings']}: {r['error']}")
+            continue
+        print(f"PF {r['profit_factor']:6.2f} | DD {r['max_drawdown_pct']:5.1f}% | "
+              f"PnL ${r.get('total_pnl', 0.0):+8.2f} | {r['wins']}W/{r['losses']}L | {r['settings']}")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(ranked, f, indent=2)
@@ -1,245 +1,365 @@
 import logging
 import json
-import time
 import sqlite3
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import Callable, List, Dict, Any, Optional
+from bot.clock import Clock
 from bot.models.token import Token
 from bot.config import Config
+from bot.simulator.triggers import TriggerIndex
 
 logger = logging.getLogger("PaperTrader")
 
+# Strategy constants that live on the PaperTrader instance rather than on Config
+# (the keys `settings` may override; backtests and strategies split their settings on these)
+TRADER_SETTINGS = ("RISK_PER_TRADE", "GAS_FEE", "SLIPPAGE", "TP_MULTIPLIER", "SL_MULTIPLIER", "MAX_OPEN_POSITIONS")
+
 class PaperTrader:
-    def __init__(self, db_path="bot/storage/cache.db"):
+    """
+    Paper trading portfolio.
+    Portfolio and trades live in memory and are authoritative during the run.
+    Every change is journaled and written to SQLite by checkpoint() in a single
+    transaction (once per cycle), and reloaded from SQLite on startup.
+    db_path=None keeps everything in memory (backtests).
+    settings overrides the strategy constants below (e.g. {"TP_MULTIPLIER": 3.0}).
+    """
+    def __init__(self, db_path: Optional[str] = "bot/storage/cache.db", settings: Optional[Dict[str, Any]] = None):
         self.db_path = db_path
         # Strategy Constants
         self.RISK_PER_TRADE = 0.05 # 5%
         self.GAS_FEE = 0.05       # $0.05 per trade
         self.SLIPPAGE = 0.01      # 1% slippage on sells
+        self.TP_MULTIPLIER = 2.0  # Exit when price doubles from last TP
+        self.SL_MULTIPLIER = 0.5  # Exit when price halves from entry
+        self.MAX_OPEN_POSITIONS = Config.MAX_OPEN_POSITIONS
+        for key, value in (settings or {}).items():
+            setattr(self, key, value)
+
+        # In-memory state
+        self.portfolio = {"balance": 200.0, "realized_pnl": 0.0, "fees_paid": 0.0}
+        self.trades: Dict[str, Dict[str, Any]] = {}          # every trade, keyed by pair address
+        self.open_positions: Dict[str, Dict[str, Any]] = {}  # subset of trades with status OPEN
+        self.triggers = TriggerIndex()                       # SL/TP levels of open positions
+        self._journal: List[tuple] = []                      # changes since the last checkpoint
+        self.on_trade: Optional[Callable[[str, Dict[str, Any]], None]] = None # ("entry"/"exit", details) hook
+
+        self._load_state()
 
     def _get_conn(self):
         return sqlite3.connect(self.db_path)
 
-    def get_portfolio(self):
+    # --- Persistence ---
+
+    def _load_state(self):
+        """Recovers portfolio and trades from the last checkpoint."""
+        if not self.db_path:
+            return
         conn = self._get_conn()
         c = conn.cursor()
-        c.execute("SELECT balance, realized_pnl, fees_paid FROM portfolio WHERE id=1")
-        row = c.fetchone()
-        conn.close()
-        if row:
-            return {"balance": row[0], "realized_pnl": row[1], "fees_paid": row[2]}
-        return {"balance": 200.0, "realized_pnl": 0.0, "fees_paid": 0.0}
+        try:
+            c.execute("SELECT balance, realized_pnl, fees_paid FROM portfolio WHERE id=1")
+            row = c.fetchone()
+            if row:
+                self.portfolio = {"balance": row[0], "realized_pnl": row[1], "fees_paid": row[2]}
+
+            c.execute("""
+                SELECT token_address, symbol, chain_id, entry_price, current_quantity, cost_basis,
+                       last_tp_price, current_price, status, log, entry_time
+                FROM trades
+            """)
+            for row in c.fetchall():
+                try:
+                    log = json.loads(row[9]) if row[9] else []
+                except ValueError:
+                    log = []
+                trade = {
+                    "token_address": row[0],
+                    "symbol": row[1],
+                    "chain_id": row[2],
+                    "entry_price": row[3] or 0.0,
+                    "current_quantity": row[4] or 0.0,
+                    "cost_basis": row[5] or 0.0,
+                    "last_tp_price": row[6] or row[3] or 0.0,
+                    "current_price": row[7] or 0.0,
+                    "status": row[8],
+                    "log": log,
+                    "entry_time": row[10]
+                }
+                self.trades[trade["token_address"]] = trade
+                if trade["status"] == "OPEN":
+                    self.open_positions[trade["token_address"]] = trade
+                    self._arm(trade)
+            logger.info(f"Recovered portfolio: ${self.portfolio['balance']:.2f} cash, {len(self.open_positions)} open positions")
+        except Exception as e:
+            logger.error(f"Failed to recover trader state: {e}")
+        finally:
+            conn.close()
+
+    def checkpoint(self) -> bool:
+        """
+        Writes all journaled changes in one transaction so balance and trades
+        always land together. On failure the journal is kept for the next attempt.
+        """
+        if not self._journal:
+            return True
+        if not self.db_path:
+            self._journal = []
+            return True
+
+        reset = any(entry[0] == "reset" for entry in self._journal)
+        dirty = {entry[1] for entry in self._journal if entry[0] == "trade"}
 
-    def _update_portfolio(self, balance_change=0.0, pnl_change=0.0, fee=0.0):
         conn = self._get_conn()
-        c = conn.cursor()
-        c.execute("""
-            UPDATE portfolio 
-            SET balance = balance + ?, 
-                realized_pnl = realized_pnl + ?,
-                fees_paid = fees_paid + ?,
-                last_updated = CURRENT_TIMESTAMP
-            WHERE id=1
-        """, (balance_change, pnl_change, fee))
-        conn.commit()
-        conn.close()
+        try:
+            with conn:
+                c = conn.cursor()
+                if reset:
+                    c.execute("DELETE FROM trades")
+                for addr in dirty:
+                    trade = self.trades.get(addr)
+                    if not trade:
+                        continue
+                    c.execute("""
+                        INSERT OR REPLACE INTO trades (
+                            token_address, symbol, chain_id, entry_price, current_quantity,
+                            cost_basis, last_tp_price, current_price, status, log, entry_time
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (
+                        addr, trade["symbol"], trade["chain_id"], trade["entry_price"],
+                        trade["current_quantity"], trade["cost_basis"], trade["last_tp_price"],
+                        trade["current_price"], trade["status"], json.dumps(trade["log"]), trade["entry_time"]
+                    ))
+                c.execute("""
+                    INSERT OR REPLACE INTO portfolio (id, balance, realized_pnl, fees_paid, last_updated)
+                    VALUES (1, ?, ?, ?, CURRENT_TIMESTAMP)
+                """, (self.portfolio["balance"], self.portfolio["realized_pnl"], self.portfolio["fees_paid"]))
+            self._journal = []
+            return True
+        except Exception as e:
+            logger.error(f"Checkpoint failed, will retry next cycle: {e}")
+            return False
+        finally:
+            conn.close()
+
+    # --- Triggers ---
+
+    def _arm(self, trade: Dict[str, Any]):
+        """(Re)registers a position's stop and take-profit levels."""
+        addr = trade["token_address"]
+        self.triggers.add(
+            addr, addr,
+            stop=trade["entry_price"] * self.SL_MULTIPLIER,
+            take_profit=trade["last_tp_price"] * self.TP_MULTIPLIER
+        )
+
+    # --- Portfolio ---
+
+    def get_portfolio(self):
+        return dict(self.portfolio)
+
+    def _update_portfolio(self, balance_change=0.0, pnl_change=0.0, fee=0.0):
+        self.portfolio["balance"] += balance_change
+        self.portfolio["realized_pnl"] += pnl_change
+        self.portfolio["fees_paid"] += fee
+        self._journal.append(("portfolio",))
 
     def enter_trade(self, token: Token) -> bool:
         """
         Enters a trade if balance allows.
         Risk 5% of CURRENT balance.
         """
-        # Check if already open
-        conn = self._get_conn()
-        c = conn.cursor()
-        c.execute("SELECT 1 FROM trades WHERE token_address = ? AND status='OPEN'", (token.pair_address,))
-        if c.fetchone():
-            conn.close()
+        # Check if already open, or traded before: trades are keyed by pair, so a
+        # re-entry would overwrite the closed trade and its realized history
+        if token.pair_address in self.trades:
             return False
 
         # Enforce Max Concurrent Trades (Risk Management)
-        # User wants Max 20% risk with 5% per trade => 4 Trades Max.
-        c.execute("SELECT COUNT(*) FROM trades WHERE status='OPEN'")
-        open_count = c.fetchone()[0]
-        if open_count >= 4:
-            logger.info(f"Buffered Max Trades ({open_count}/4). Skipping {token.base_token_symbol}.")
-            conn.close()
+        # Default: Max 20% risk with 5% per trade => 4 Trades Max.
+        open_count = len(self.open_positions)
+        if open_count >= self.MAX_OPEN_POSITIONS:
+            logger.info(f"Buffered Max Trades ({open_count}/{self.MAX_OPEN_POSITIONS}). Skipping {token.base_token_symbol}.")
             return False
-            
-    def get_active_pairs(self) -> List[tuple]:
-        """Returns list of (chain_id, token_address) for all open trades."""
-        conn = self._get_conn()
-        c = conn.cursor()
-        try:
-            # chain_id column name check? In enter_trade we used 'chain_id'
-            c.execute("SELECT chain_id, token_address FROM trades WHERE status='OPEN'")
-            return c.fetchall()
-        except:
-             return []
-        finally:
-             conn.close()
 
-    def get_open_count(self) -> int:
-        """Returns number of currently open trades"""
-        conn = self._get_conn()
-        c = conn.cursor()
-        c.execute("SELECT COUNT(*) FROM trades WHERE status='OPEN'")
-        count = c.fetchone()[0]
-        conn.close()
-        return count
+        balance = self.portfolio["balance"]
 
-        port = self.get_portfolio()
-        balance = port["balance"]
-        
         # Calculate Risk Amount
         position_size = balance * self.RISK_PER_TRADE
         if position_size < 1.0 or balance < (position_size + self.GAS_FEE):
             logger.warning(f"Insufficient funds for trade: ${balance}")
-            conn.close()
             return False
 
         # Calculate Quantity
         price = token.price_usd
-        if price <= 0: 
-            conn.close()
+        if price <= 0:
             return False
-            
+
         quantity = position_size / price
-        
+
         # Execute Buy
         # Deduct Balance (Cost + Gas)
         cost = position_size
         self._update_portfolio(balance_change=-(cost + self.GAS_FEE), fee=self.GAS_FEE)
-        
+
         # Log Trade
         log_entry = {
             "action": "BUY",
             "price": price,
             "quantity": quantity,
             "cost": cost,
-            "time": time.time()
+            "time": Clock.now()
         }
-        
-        c.execute("""
-            INSERT INTO trades (
-                token_address, symbol, chain_id, entry_price, current_quantity, 
-                cost_basis, last_tp_price, status, log, entry_time
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """, (
-            token.pair_address, token.base_token_symbol, token.chain_id, 
-            price, quantity, cost, price, "OPEN", json.dumps([log_entry])
-        ))
-        conn.commit()
-        conn.close()
-        
+
+        trade = {
+            "token_address": token.pair_address,
+            "symbol": token.base_token_symbol,
+            "chain_id": token.chain_id,
+            "entry_price": price,
+            "current_quantity": quantity,
+            "cost_basis": cost,
+            "last_tp_price": price,
+            "current_price": price,
+            "status": "OPEN",
+            "log": [log_entry],
+            "entry_time": datetime.utcfromtimestamp(Clock.now()).strftime("%Y-%m-%d %H:%M:%S")
+        }
+        self.trades[token.pair_address] = trade
+        self.open_positions[token.pair_address] = trade
+        self._arm(trade)
+        self._journal.append(("trade", token.pair_address))
+        self._emit("entry", trade, price=price, quantity=quantity, cost=cost)
+
         logger.info(f"Entered Trade: {token.base_token_symbol} | Size: ${position_size:.2f} | Qty: {quantity}")
         return True
 
+    def get_active_pairs(self) -> List[tuple]:
+        """Returns list of (chain_id, token_address) for all open trades."""
+        return [(t["chain_id"], addr) for addr, t in self.open_positions.items()]
+
+    def get_open_count(self) -> int:
+        """Returns number of currently open trades"""
+        return len(self.open_positions)
+
+    def get_equity(self) -> float:
+        """Cash plus open positions marked at their last seen price."""
+        holdings = sum(
+            t["current_quantity"] * (t["current_price"] if t["current_price"] > 0 else t["entry_price"])
+            for t in self.open_positions.values()
+        )
+        return self.portfolio["balance"] + holdings
+
     def update_positions(self, token_map: Dict[str, Token]) -> List[str]:
         """
         Updates OPEN positions based on latest prices.
+        Only pairs present in both the tick and the trigger index are touched,
+        and each one bisects straight to the SL/TP levels it crossed.
         Returns a list of notification strings to send to Telegram.
         """
         notifications = []
-        conn = self._get_conn()
-        c = conn.cursor()
-        c.execute("SELECT token_address, entry_price, current_quantity, last_tp_price, log, cost_basis, symbol FROM trades WHERE status='OPEN'")
-        rows = c.fetchall()
-        
-        for row in rows:
-            addr, entry, qty, last_tp, log_json, cost_basis, symbol = row
-            
-            if addr not in token_map:
-                continue 
-                
-            current_token = token_map[addr]
-            current_price = current_token.price_usd
-            
-            # --- 1. STOP LOSS (50% Drop) ---
-            # "If down to 50% of original value, exit and save other 50%"
-            if current_price <= (entry * 0.5):
-                self._close_position(addr, current_price, qty, "STOP_LOSS_50", log_json, cost_basis)
-                
-                loss_amt = cost_basis - (qty * current_price)
-                saved_amt = (qty * current_price)
-                msg = (
-                    f"🛑 **STOP LOSS HIT: {symbol}**\n"
-                    f"📉 Dropped 50% below entry.\n"
-                    f"💸 Exited at loss of **${loss_amt:.2f}**\n"
-                    f"🛡️ Saved remaining **${saved_amt:.2f}**"
-                )
-                notifications.append(msg)
-                logger.info(f"SL Triggered for {symbol}: Loss ${loss_amt:.2f}")
+
+        # Walk whichever side is smaller
+        if len(token_map) < len(self.open_positions):
+            ticked = [addr for addr in token_map if self.triggers.has_pair(addr)]
+        else:
+            ticked = [addr for addr in self.triggers.pairs() if addr in token_map]
+
+        for addr in ticked:
+            current_price = token_map[addr].price_usd
+            if current_price <= 0:
                 continue
+            stops_hit, tps_hit = self.triggers.crossed(addr, current_price)
+
+            for key in stops_hit:
+                notifications.append(self._stop_out(key, current_price))
+            for key in tps_hit:
+                if key in self.open_positions:
+                    notifications.append(self._take_profit(key, current_price))
 
-            # --- 2. TAKE PROFIT (Double MC) ---
-            # "Every time market cap doubles... one is out" -> Full Exit to free slot
-            if current_price >= (last_tp * 2.0):
-                # Sell 100% (Full Exit) to free up one of the 4 slots
-                self._close_position(addr, current_price, qty, "TAKE_PROFIT_2X", log_json, cost_basis)
-                
-                sell_val = (qty * current_price) * (1 - self.SLIPPAGE)
-                price_gain = (current_price - entry) / entry * 100
-                pnl = sell_val - cost_basis
-                
-                # Get updated balance for notification
-                port = self.get_portfolio() 
-                
-                msg = (
-                    f"✅ **TAKE PROFIT HIT: {symbol}**\n"
-                    f"🚀 Market Cap Doubled! ({price_gain:.0f}%)\n"
-                    f"💰 **Position Closed** for **${sell_val:.2f}**\n"
-                    f"🤑 Profit: **${pnl:.2f}**\n"
-                    f"♻️ **Slot Freed Up!** (Active: {len(token_map)-1 if len(token_map)>0 else 0}/4)\n"
-                    f"🏦 New Balance: **${port['balance']:.2f}**"
-                )
-                notifications.append(msg)
-                logger.info(f"TP Triggered for {symbol}: Sold All ${sell_val:.2f} (PnL: ${pnl:.2f})")
-            else:
+            trade = self.open_positions.get(addr)
+            if trade and current_price != trade["current_price"]:
                 # Just update current price if no action taken
-                c.execute("UPDATE trades SET current_price = ? WHERE token_address = ?", (current_price, addr))
-                conn.commit()
+                trade["current_price"] = current_price
+                self._journal.append(("trade", addr))
 
-        conn.close()
         return notifications
 
-    def _close_position(self, addr, price, qty, reason, log_json, cost_basis):
-        conn = self._get_conn()
-        c = conn.cursor()
-        
+    def _stop_out(self, addr: str, current_price: float) -> str:
+        # --- 1. STOP LOSS (50% Drop) ---
+        # "If down to 50% of original value, exit and save other 50%"
+        trade = self.open_positions[addr]
+        qty, cost_basis, symbol = trade["current_quantity"], trade["cost_basis"], trade["symbol"]
+        self._close_position(addr, current_price, qty, "STOP_LOSS_50", cost_basis)
+
+        loss_amt = cost_basis - (qty * current_price)
+        saved_amt = (qty * current_price)
+        logger.info(f"SL Triggered for {symbol}: Loss ${loss_amt:.2f}")
+        return (
+            f"🛑 **STOP LOSS HIT: {symbol}**\n"
+            f"📉 Dropped {(1 - self.SL_MULTIPLIER) * 100:.0f}% below entry.\n"
+            f"💸 Exited at loss of **${loss_amt:.2f}**\n"
+            f"🛡️ Saved remaining **${saved_amt:.2f}**"
+        )
+
+    def _take_profit(self, addr: str, current_price: float) -> str:
+        # --- 2. TAKE PROFIT (Double MC) ---
+        # "Every time market cap doubles... one is out" -> Full Exit to free slot
+        trade = self.open_positions[addr]
+        entry, qty, cost_basis, symbol = trade["entry_price"], trade["current_quantity"], trade["cost_basis"], trade["symbol"]
+        self._close_position(addr, current_price, qty, "TAKE_PROFIT_2X", cost_basis)
+
+        sell_val = (qty * current_price) * (1 - self.SLIPPAGE)
+        price_gain = (current_price - entry) / entry * 100
+        pnl = sell_val - cost_basis
+        logger.info(f"TP Triggered for {symbol}: Sold All ${sell_val:.2f} (PnL: ${pnl:.2f})")
+        return (
+            f"✅ **TAKE PROFIT HIT: {symbol}**\n"
+            f"🚀 Market Cap Doubled! ({price_gain:.0f}%)\n"
+            f"💰 **Position Closed** for **${sell_val:.2f}**\n"
+            f"🤑 Profit: **${pnl:.2f}**\n"
+            f"♻️ **Slot Freed Up!** (Active: {len(self.open_positions)}/{self.MAX_OPEN_POSITIONS})\n"
+            f"🏦 New Balance: **${self.portfolio['balance']:.2f}**"
+        )
+
+    def _close_position(self, addr, price, qty, reason, cost_basis):
+        trade = self.open_positions.pop(addr)
+        self.triggers.remove(addr)
+
         sell_val = (qty * price) * (1 - self.SLIPPAGE)
         pnl = sell_val - cost_basis
-        
+
         self._update_portfolio(balance_change=(sell_val - self.GAS_FEE), pnl_change=pnl, fee=self.GAS_FEE)
-        
-        new_log = json.loads(log_json)
-        new_log.append({
+
+        trade["log"].append({
             "action": reason,
             "price": price,
             "quantity": qty,
             "value": sell_val,
             "pnl": pnl,
-            "time": time.time()
+            "time": Clock.now()
         })
-        
-        c.execute("""
-            UPDATE trades 
-            SET current_quantity = 0, cost_basis = 0, status = ?, log = ? 
-            WHERE token_address = ?
-        """, (reason, json.dumps(new_log), addr))
-        conn.commit()
-        conn.close()
+        trade.update(current_quantity=0, cost_basis=0, current_price=price, status=reason)
+        self._journal.append(("trade", addr))
+        self._emit("exit", trade, price=price, quantity=qty, value=sell_val, pnl=pnl, reason=reason)
+
+    def _emit(self, event: str, trade: Dict[str, Any], **details):
+        if self.on_trade is None:
+            return
+        try:
+            self.on_trade(event, {
+                "pair_address": trade["token_address"],
+                "symbol": trade["symbol"],
+                "chain_id": trade["chain_id"],
+                "entry_price": trade["entry_price"],
+                "balance": self.portfolio["balance"],
+                **details,
+            })
+        except Exception as e:
+            logger.error(f"Trade hook failed: {e}")
 
     def get_detailed_stats(self) -> Dict[str, Any]:
         """
         Calculates detailed performance metrics from trade history.
         """
-        conn = self._get_conn()
-        c = conn.cursor()
-        c.execute("SELECT log FROM trades")
-        rows = c.fetchall()
-        conn.close()
-
-        total_trades = len(rows)
+        total_trades = len(self.trades)
         if total_trades == 0:
             return {
                 "total_trades": 0,
@@ -256,17 +376,16 @@ class PaperTrader:
         total_win_pnl = 0.0
         total_loss_pnl = 0.0
 
-        for row in rows:
+        for trade in self.trades.values():
             try:
-                log_entries = json.loads(row[0])
                 trade_pnl = 0.0
                 has_sells = False
-                
-                for entry in log_entries:
+
+                for entry in trade["log"]:
                     if "pnl" in entry:
                         trade_pnl += float(entry["pnl"])
                         has_sells = True
-                
+
                 # Only count as Win/Loss if we have actually sold something or realized PnL
                 # If completely OPEN with no TPs, it's unrealized.
                 # But user wants "Avg Win Rate", usually checking Closed or Partial.
@@ -284,7 +403,7 @@ class PaperTrader:
 
             except Exception:
                 continue
-                
+
         # Calculate Derived Stats
         counted_trades = wins + losses
         win_rate = (wins / counted_trades * 100) if counted_trades > 0 else 0.0
@@ -309,55 +428,42 @@ class PaperTrader:
         """
         port = self.get_portfolio()
         stats = self.get_detailed_stats()
-        
-        conn = self._get_conn()
-        c = conn.cursor()
-        
+
         # Open Positions
-        try:
-             # Try selecting current_price, fall back if column missing (migration issue)
-             c.execute("SELECT symbol, current_quantity, entry_price, current_price, log FROM trades WHERE status='OPEN'")
-        except:
-             # Fallback if migration didn't run properly on existing db
-            c.execute("SELECT symbol, current_quantity, entry_price, entry_price, log FROM trades WHERE status='OPEN'")
-
-        open_rows = c.fetchall()
-        
+        open_rows = list(self.open_positions.values())
+
         # Closed History (Last 5)
-        c.execute("SELECT symbol, log FROM trades WHERE status != 'OPEN' ORDER BY entry_time DESC LIMIT 5")
-        history_rows = c.fetchall()
-        
-        conn.close()
-        
+        closed = [t for t in self.trades.values() if t["status"] != "OPEN"]
+        history_rows = sorted(closed, key=lambda t: t["entry_time"] or "", reverse=True)[:5]
+
         # 1. Calculate Live Equity
         cash_balance = port['balance']
         holdings_value = 0.0
-        
+
         active_bets_msg = ""
         open_count = len(open_rows)
-        
+
         if not open_rows:
             active_bets_msg += "<i>No active bets. Searching for gems...</i> 🕵️‍♂️"
         else:
-            for row in open_rows:
-                sym, qty, entry, curr_price, log = row
+            for trade in open_rows:
+                sym, qty, entry, curr_price = trade["symbol"], trade["current_quantity"], trade["entry_price"], trade["current_price"]
                 curr_price = curr_price if curr_price > 0 else entry # Fallback
                 val = qty * curr_price
                 holdings_value += val
-                
+
                 # Trade specific PnL (Unrealized)
                 upnl = val - (qty * entry) # Rough estimate
                 upnl_pct = ((curr_price - entry) / entry) * 100
                 emoji = "🟢" if upnl >= 0 else "🔴"
-                
+
                 active_bets_msg += f"{emoji} **{sym}**\n"
                 active_bets_msg += f"   Entry: ${entry:.6f} | Curr: ${curr_price:.6f}\n"
                 active_bets_msg += f"   Value: `${val:.2f}` ({upnl_pct:+.1f}%)\n"
-                
+
                 # Locked In profit logic
                 try:
-                    logs = json.loads(log)
-                    realized_on_this = sum([float(x.get('pnl',0)) for x in logs])
+                    realized_on_this = sum([float(x.get('pnl',0)) for x in trade["log"]])
                     if realized_on_this > 0:
                         active_bets_msg += f"   💰 Locked In: `${realized_on_this:.2f}`\n"
                 except: pass
@@ -369,14 +475,14 @@ class PaperTrader:
         pnl_emoji = "🚀" if total_pnl >= 0 else "🔻"
 
         msg = f"🎰 **DEGEN CASINO DASHBOARD** 🎰\n\n"
-        
+
         # 1. Live Balance
         msg += f"🏦 **LIVE EQUITY**: `${total_equity:.2f}`\n"
         msg += f"💵 **Cash**: `${cash_balance:.2f}`\n"
         msg += f"💎 **Holdings**: `${holdings_value:.2f}`\n"
         msg += f"{pnl_emoji} **Total Profit**: `${total_pnl:+.2f}`\n"
         msg += "━━━━━━━━━━━━━━━━━━━\n"
-        
+
         # 2. Scoreboard
         msg += f"📊 **STATS**\n"
         msg += f"🏆 {stats['wins']} W  |  💀 {stats['losses']} L  | 🎯 {stats['win_rate']:.0f}%\n"
@@ -385,18 +491,15 @@ class PaperTrader:
         # 3. Active Bets
         msg += f"🎲 **ACTIVE BETS ({open_count})**\n\n"
         msg += active_bets_msg
-        
+
         # 4. Recent History (Closed)
         if history_rows:
             msg += "📜 **RECENT HISTORY**\n"
-            for row in history_rows:
-                sym, log = row
+            for trade in history_rows:
                 try:
-                    logs = json.loads(log)
-                    final_pnl = sum([float(x.get('pnl',0)) for x in logs])
-                    # status = logs[-1].get("action", "CLOSED")
+                    final_pnl = sum([float(x.get('pnl',0)) for x in trade["log"]])
                     icon = "✅" if final_pnl > 0 else "❌"
-                    msg += f"{icon} **{sym}**: `${final_pnl:+.2f}`\n"
+                    msg += f"{icon} **{trade['symbol']}**: `${final_pnl:+.2f}`\n"
                 except: pass
 
         return msg
@@ -405,18 +508,10 @@ class PaperTrader:
         """
         Resets the portfolio balance and clears all trade history.
         """
-        conn = self._get_conn()
-        c = conn.cursor()
-        try:
-            # Clear Trades
-            c.execute("DELETE FROM trades")
-            
-            # Reset Portfolio
-            c.execute("UPDATE portfolio SET balance = ?, realized_pnl = 0.0, fees_paid = 0.0 WHERE id=1", (initial_balance,))
-            
-            conn.commit()
+        self.trades = {}
+        self.open_positions = {}
+        self.triggers.clear()
+        self.portfolio = {"balance": initial_balance, "realized_pnl": 0.0, "fees_paid": 0.0}
+        self._journal = [("reset",), ("portfolio",)]
+        if self.checkpoint():
             logger.info(f"Portfolio reset to ${initial_balance}")
-        except Exception as e:
-            logger.error(f"Failed to reset portfolio: {e}")
-        finally:
-            conn.close()
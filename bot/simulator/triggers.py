@@ -0,0 +1,86 @@
+from bisect import bisect_left, bisect_right
+from typing import Dict, Hashable, List, Tuple
+
+class _Levels:
+    """Price levels for one pair, kept sorted with their owning keys alongside."""
+    __slots__ = ("prices", "keys")
+
+    def __init__(self):
+        self.prices: List[float] = []
+        self.keys: List[Hashable] = []
+
+    def add(self, price: float, key: Hashable):
+        i = bisect_right(self.prices, price)
+        self.prices.insert(i, price)
+        self.keys.insert(i, key)
+
+    def remove(self, price: float, key: Hashable):
+        i = bisect_left(self.prices, price)
+        while i < len(self.prices) and self.prices[i] == price:
+            if self.keys[i] == key:
+                del self.prices[i]
+                del self.keys[i]
+                return
+            i += 1
+
+class TriggerIndex:
+    """
+    Stop-loss and take-profit levels kept sorted per pair.
+    A price tick bisects straight to the levels it crossed, so the cost of a
+    tick depends on how many triggers fire, not on how many positions are open.
+    Keys are opaque (a pair address, or (portfolio, pair) when shared).
+    """
+    def __init__(self):
+        self._stops: Dict[str, _Levels] = {}
+        self._take_profits: Dict[str, _Levels] = {}
+        self._entries: Dict[Hashable, Tuple[str, float, float]] = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def has_pair(self, pair: str) -> bool:
+        return pair in self._stops
+
+    def pairs(self):
+        return self._stops.keys()
+
+    def add(self, pair: str, key: Hashable, stop: float, take_profit: float):
+        if key in self._entries:
+            self.remove(key)
+        self._stops.setdefault(pair, _Levels()).add(stop, key)
+        self._take_profits.setdefault(pair, _Levels()).add(take_profit, key)
+        self._entries[key] = (pair, stop, take_profit)
+
+    def remove(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if not entry:
+            return
+        pair, stop, take_profit = entry
+        stops = self._stops[pair]
+        stops.remove(stop, key)
+        self._take_profits[pair].remove(take_profit, key)
+        if not stops.prices:
+            del self._stops[pair]
+            del self._take_profits[pair]
+
+    def crossed(self, pair: str, price: float) -> Tuple[List[Hashable], List[Hashable]]:
+        """
+        Returns (stop keys hit, take-profit keys hit) for a new price.
+        Stops fire at price <= level, take-profits at price >= level.
+        Nothing is removed; the caller removes what it actually closes.
+        """
+        stops = self._stops.get(pair)
+        if not stops:
+            return [], []
+        hit_stops = stops.keys[bisect_left(stops.prices, price):]
+        tps = self._take_profits[pair]
+        hit_tps = tps.keys[:bisect_right(tps.prices, price)]
+        return hit_stops, hit_tps
+
+    def clear(self):
+        self._stops.clear()
+        self._take_profits.clear()
+        self._entries.clear()
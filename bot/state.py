@@ -0,0 +1,85 @@
+import hashlib
+import json
+import math
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from bot.models.token import AnalysisResult
+
+# Read-only snapshots served by the keep-alive server's /api routes.
+# The bot publishes each document once per cycle; requests only read the
+# pre-serialized bytes, so dashboards polling every second never touch
+# SQLite or the trader's live dicts.
+
+def _json_safe(value):
+    """inf/nan aren't valid JSON (profit_factor can be inf) -> null."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    return value
+
+class StateSnapshots:
+    def __init__(self):
+        self._docs: Dict[str, Tuple[str, bytes]] = {}
+
+    def publish(self, name: str, data: Any):
+        body = json.dumps(_json_safe(data), default=str, separators=(",", ":")).encode()
+        etag = '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+        self._docs[name] = (etag, body)
+
+    def get(self, name: str) -> Optional[Tuple[str, bytes]]:
+        """Returns (etag, body) or None if never published."""
+        return self._docs.get(name)
+
+    def names(self) -> List[str]:
+        return sorted(self._docs)
+
+STATE = StateSnapshots()
+
+class ResultLog:
+    """Recent analysis results, kept small and in memory for the /api/results and /api/watchlist views."""
+    def __init__(self, maxlen: int = 200, watchlist_len: int = 100):
+        self.recent: Deque[Dict[str, Any]] = deque(maxlen=maxlen)
+        self.watchlist: Dict[str, Dict[str, Any]] = {}
+        self.watchlist_len = watchlist_len
+
+    @staticmethod
+    def describe(result: AnalysisResult) -> Dict[str, Any]:
+        token = result.token
+        return {
+            "ts": time.time(),
+            "chain_id": token.chain_id,
+            "pair_address": token.pair_address,
+            "token_address": token.base_token_address,
+            "symbol": token.base_token_symbol,
+            "name": token.base_token_name,
+            "score": result.score,
+            "action": result.action,
+            "risk_level": result.risk_level,
+            "risk_flags": list(result.risk_flags),
+            "price_usd": token.price_usd,
+            "liquidity_usd": token.liquidity_usd,
+            "fdv": token.fdv,
+            "volume_h1": token.volume_h1,
+            "predicted_fdv": result.predicted_fdv,
+            "breakdown": dict(result.details),
+            "url": token.url,
+        }
+
+    def add(self, result: AnalysisResult):
+        entry = self.describe(result)
+        self.recent.append(entry)
+        if result.action == "WATCHLIST":
+            self.watchlist[result.token.pair_address] = entry
+            # Oldest first (insertion order); trim to the newest entries
+            while len(self.watchlist) > self.watchlist_len:
+                self.watchlist.pop(next(iter(self.watchlist)))
+
+    def recent_list(self) -> List[Dict[str, Any]]:
+        return list(reversed(self.recent)) # Newest first
+
+    def watchlist_list(self) -> List[Dict[str, Any]]:
+        return list(reversed(self.watchlist.values()))
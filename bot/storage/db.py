@@ -10,10 +10,15 @@ class Database:
         self.db_path = db_path
         self._init_db()
 
+    def _get_conn(self):
+        return sqlite3.connect(self.db_path, timeout=10) # Waits out other processes' write locks
+
     def _init_db(self):
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._get_conn()
             cursor = conn.cursor()
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS seen_pairs (
@@ -70,9 +75,22 @@ class Database:
         except Exception as e:
             logger.error(f"Database init failed: {e}")
 
+    def enable_wal(self):
+        """
+        Switches the file to WAL so several processes (SHARDS) can read and write it at once.
+        Persistent: stored in the database file itself.
+        """
+        try:
+            conn = self._get_conn()
+            mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            conn.close()
+            logger.info(f"Database journal mode: {mode}")
+        except Exception as e:
+            logger.error(f"Failed to enable WAL: {e}")
+
     def is_seen(self, pair_address: str) -> bool:
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._get_conn()
             cursor = conn.cursor()
             cursor.execute("SELECT 1 FROM seen_pairs WHERE pair_address = ?", (pair_address,))
             exists = cursor.fetchone() is not None
@@ -83,7 +101,7 @@ class Database:
 
     def mark_seen(self, pair_address: str, chain_id: str):
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._get_conn()
             cursor = conn.cursor()
             cursor.execute(
                 "INSERT OR IGNORE INTO seen_pairs (pair_address, chain_id, seen_at) VALUES (?, ?, ?)",
@@ -99,7 +117,7 @@ class Database:
         Also clears message log? No, we need IDs to delete first.
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._get_conn()
             cursor = conn.cursor()
             cursor.execute("DELETE FROM seen_pairs")
             conn.commit()
@@ -110,7 +128,7 @@ class Database:
 
     def log_message(self, chat_id, message_id):
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._get_conn()
             cursor = conn.cursor()
             cursor.execute("INSERT INTO message_log (message_id, chat_id, timestamp) VALUES (?, ?, ?)", 
                            (message_id, chat_id, datetime.now()))
@@ -122,7 +140,7 @@ class Database:
     def get_and_clear_message_ids(self):
         ids = []
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._get_conn()
             cursor = conn.cursor()
             cursor.execute("SELECT chat_id, message_id FROM message_log")
             ids = cursor.fetchall()
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Optional, Set, Tuple
+from aiohttp import web
+from bot.config import Config
+from bot.state import _json_safe
+
+logger = logging.getLogger("Stream")
+
+class StreamClient:
+    """One SSE subscriber: a bounded queue of pre-encoded frames."""
+    def __init__(self, maxsize: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.dropped = False
+
+class EventHub:
+    """
+    Fan-out for /api/stream (server-sent events).
+    - Each event is encoded once and shared by every client.
+    - Clients get a bounded queue; one that falls behind is dropped rather than
+      buffered without limit (it can reconnect and resume).
+    - The last STREAM_REPLAY_SIZE events are kept so a reconnecting client
+      (Last-Event-ID) catches up on what it missed.
+    """
+    def __init__(self, replay_size: Optional[int] = None, client_queue: Optional[int] = None):
+        self.replay: Deque[Tuple[int, bytes]] = deque(maxlen=replay_size or Config.STREAM_REPLAY_SIZE)
+        self.client_queue = client_queue or Config.STREAM_CLIENT_QUEUE
+        self.clients: Set[StreamClient] = set()
+        self.last_id = 0
+
+    def publish(self, event: str, data: Any):
+        self.last_id += 1
+        payload = json.dumps(_json_safe(data), default=str, separators=(",", ":"))
+        frame = f"id: {self.last_id}\nevent: {event}\ndata: {payload}\n\n".encode()
+        self.replay.append((self.last_id, frame))
+
+        for client in list(self.clients):
+            try:
+                client.queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                self._drop(client)
+
+    def subscribe(self, last_event_id: Optional[int] = None) -> StreamClient:
+        client = StreamClient(self.client_queue)
+        if last_event_id is not None:
+            oldest = self.replay[0][0] if self.replay else self.last_id + 1
+            missed = [frame for event_id, frame in self.replay if event_id > last_event_id]
+            if last_event_id + 1 < oldest or last_event_id > self.last_id or len(missed) >= self.client_queue:
+                # Can't replay everything it missed (or its id is from before a restart,
+                # when ids began again at 1): tell the client to refetch the /api snapshots
+                client.queue.put_nowait(self._frame("reset", {"last_id": self.last_id}))
+            else:
+                for frame in missed:
+                    client.queue.put_nowait(frame)
+        self.clients.add(client)
+        return client
+
+    def unsubscribe(self, client: StreamClient):
+        self.clients.discard(client)
+
+    def _drop(self, client: StreamClient):
+        client.dropped = True
+        self.clients.discard(client)
+        logger.warning("Dropped slow stream client")
+
+    @staticmethod
+    def _frame(event: str, data: Any) -> bytes:
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+HUB = EventHub()
+
+async def stream_handler(request):
+    """GET /api/stream - SSE. Resume with the Last-Event-ID header or ?last_event_id=."""
+    last_id = request.headers.get("Last-Event-ID") or request.query.get("last_event_id")
+    try:
+        last_id = int(last_id) if last_id else None
+    except ValueError:
+        last_id = None
+
+    response = web.StreamResponse(headers={
+        "Content-Type": "text/event-stream",
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no", # Don't let proxies buffer the stream
+    })
+    await response.prepare(request)
+
+    client = HUB.subscribe(last_id)
+    try:
+        await response.write(b"retry: 3000\n\n")
+        while not client.dropped:
+            try:
+                frame = await asyncio.wait_for(client.queue.get(), Config.STREAM_KEEPALIVE)
+            except asyncio.TimeoutError:
+                frame = f": keepalive {int(time.time())}\n\n".encode()
+            await response.write(frame)
+    except ConnectionResetError:
+        pass # Client went away
+    finally:
+        HUB.unsubscribe(client)
+    return response
@@ -0,0 +1,173 @@
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+from bot.config import Config
+from bot.metrics import REGISTRY
+
+logger = logging.getLogger("Watchdog")
+
+LOOP_LAG = REGISTRY.histogram(
+    "bot_event_loop_lag_seconds", "Event loop heartbeat delay beyond its interval",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0))
+LOOP_STALLS = REGISTRY.counter(
+    "bot_event_loop_stalls_total", "Times the event loop was blocked past LOOP_LAG_THRESHOLD")
+
+# Frames from our own code are what we can fix; everything else is library/stdlib
+_BOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class CallSite:
+    """Aggregated blocking time for one call site."""
+    __slots__ = ("site", "samples", "blocked_s", "stalls", "stack", "last_seen")
+
+    def __init__(self, site: str, stack: List[str]):
+        self.site = site
+        self.samples = 0
+        self.blocked_s = 0.0
+        self.stalls = 0
+        self.stack = stack # Most recent full stack, for context
+        self.last_seen = 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "site": self.site, "samples": self.samples, "blocked_s": round(self.blocked_s, 3),
+            "stalls": self.stalls, "last_seen": self.last_seen, "stack": self.stack,
+        }
+
+class LoopWatchdog:
+    """
+    Opt-in event loop stall detector (LOOP_WATCHDOG=true).
+    A coroutine on the loop bumps a heartbeat every `interval`; a daemon thread
+    checks it. While the heartbeat is older than `threshold` the loop is stuck
+    in synchronous code, so the thread samples the loop thread's stack (every
+    `interval`) and charges the time to the blocking call site: the innermost
+    frame in bot/ code, plus the leaf frame it was stuck in.
+    """
+    def __init__(self, threshold: Optional[float] = None, interval: Optional[float] = None):
+        self.threshold = Config.LOOP_LAG_THRESHOLD if threshold is None else threshold
+        self.interval = Config.LOOP_WATCHDOG_INTERVAL if interval is None else interval
+        self.sites: Dict[str, CallSite] = {}
+        self.max_lag = 0.0
+        self._beat = time.monotonic()
+        self._loop_thread: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._monitor, name="loop-watchdog", daemon=True)
+        self._thread.start()
+        logger.info(f"Loop watchdog on (threshold {self.threshold * 1000:.0f}ms)")
+
+    def stop(self):
+        self._stop.set()
+        if self._task:
+            self._task.cancel()
+        if self._thread:
+            self._thread.join(timeout=1)
+
+    async def _heartbeat(self):
+        while True:
+            before = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - before - self.interval)
+            LOOP_LAG.observe(lag)
+            self.max_lag = max(self.max_lag, lag)
+            self._beat = now
+
+    def _monitor(self):
+        stalled_since = None
+        current_sites = set()
+        while not self._stop.wait(self.interval):
+            behind = time.monotonic() - self._beat
+            if behind < self.threshold:
+                if stalled_since is not None:
+                    self._end_stall(time.monotonic() - stalled_since, current_sites)
+                    stalled_since, current_sites = None, set()
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            if stalled_since is None:
+                stalled_since = self._beat
+                LOOP_STALLS.inc()
+                # Charge the time already spent before we noticed
+                site = self._record(frame, behind)
+            else:
+                site = self._record(frame, self.interval)
+            current_sites.add(site)
+
+    def _record(self, frame, seconds: float) -> str:
+        stack = self._stack(frame)
+        site = self._site(frame)
+        with self._lock:
+            entry = self.sites.get(site)
+            if entry is None:
+                entry = self.sites[site] = CallSite(site, stack)
+            entry.samples += 1
+            entry.blocked_s += seconds
+            entry.stack = stack
+            entry.last_seen = time.time()
+        return site
+
+    def _end_stall(self, duration: float, sites: set):
+        with self._lock:
+            for site in sites:
+                self.sites[site].stalls += 1
+        logger.warning(f"Event loop blocked {duration * 1000:.0f}ms in {', '.join(sorted(sites))}")
+
+    @staticmethod
+    def _site(frame) -> str:
+        """'<our innermost frame> -> <leaf frame>' (just one when they're the same)."""
+        leaf = frame
+        ours = None
+        while frame is not None:
+            if frame.f_code.co_filename.startswith(_BOT_DIR) and not frame.f_code.co_filename.endswith("watchdog.py"):
+                ours = frame
+                break
+            frame = frame.f_back
+        leaf_text = LoopWatchdog._describe(leaf)
+        if ours is None or ours is leaf:
+            return leaf_text
+        return f"{LoopWatchdog._describe(ours)} -> {leaf_text}"
+
+    @staticmethod
+    def _describe(frame) -> str:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_BOT_DIR):
+            filename = os.path.relpath(filename, os.path.dirname(_BOT_DIR))
+        return f"{frame.f_code.co_name} ({filename}:{frame.f_lineno})"
+
+    @staticmethod
+    def _stack(frame, limit: int = 15) -> List[str]:
+        lines = []
+        while frame is not None and len(lines) < limit:
+            lines.append(LoopWatchdog._describe(frame))
+            frame = frame.f_back
+        return lines
+
+    def top(self, limit: int = 20) -> List[Dict]:
+        """Worst offenders first, by total time blocked."""
+        with self._lock:
+            entries = sorted(self.sites.values(), key=lambda e: e.blocked_s, reverse=True)
+            return [e.to_dict() for e in entries[:limit]]
+
+    def report(self, limit: int = 20) -> str:
+        lines = [f"max lag {self.max_lag * 1000:.0f}ms, threshold {self.threshold * 1000:.0f}ms", ""]
+        for entry in self.top(limit):
+            lines.append(f"{entry['blocked_s'] * 1000:8.0f}ms  {entry['stalls']:4d} stalls  {entry['site']}")
+            lines.extend(f"            {line}" for line in entry["stack"][:8])
+            lines.append("")
+        return "\n".join(lines) + "\n"
+
+WATCHDOG = LoopWatchdog()
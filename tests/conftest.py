@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Tests import the bot the same way `python -m bot.main` does, from the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,54 @@
+import itertools
+import pytest
+from bot.config import Config
+from bot.metrics import UPSTREAM_REQUESTS
+from bot.scraper.cadence import AdaptiveCadence
+
+@pytest.fixture(autouse=True)
+def settings(monkeypatch):
+    for key, value in (("ADAPTIVE_POLLING", True), ("DISCOVERY_INTERVAL", 30.0), ("DISCOVERY_MIN_INTERVAL", 5.0),
+                       ("DISCOVERY_MAX_INTERVAL", 120.0), ("DISCOVERY_TARGET_NEW", 5.0),
+                       ("DEXSCREENER_RATE_BUDGET", 10000.0)):
+        monkeypatch.setattr(Config, key, value)
+
+_addresses = itertools.count()
+
+def fresh(n: int):
+    return [f"token{next(_addresses)}" for _ in range(n)]
+
+def test_first_poll_keeps_starting_interval():
+    assert AdaptiveCadence().record(fresh(50)) == 30.0
+
+def test_quiet_feed_backs_off_up_to_max():
+    cadence = AdaptiveCadence()
+    seen = fresh(3)
+    intervals = [cadence.record(seen) for _ in range(5)]
+    assert intervals == [30.0, 60.0, 120.0, 120.0, 120.0]
+
+def test_busy_feed_speeds_up_down_to_min():
+    cadence = AdaptiveCadence()
+    intervals = [cadence.record(fresh(20)) for _ in range(5)]
+    assert intervals == [30.0, 15.0, 7.5, 5.0, 5.0]
+
+def test_rate_budget_sets_a_floor(monkeypatch):
+    monkeypatch.setattr(Config, "DEXSCREENER_RATE_BUDGET", 60.0)
+    cadence = AdaptiveCadence()
+    for _ in range(4):
+        interval = cadence.record(fresh(30))
+    assert interval == pytest.approx(31.0) # 1 feed + 30 detail requests per poll at 60/min
+
+def test_429_doubles_and_holds_the_interval():
+    cadence = AdaptiveCadence()
+    cadence.record(fresh(10))
+    assert cadence.record(fresh(10)) == 15.0
+    UPSTREAM_REQUESTS.labels("dexscreener", 429).inc()
+    assert cadence.record(fresh(10)) == 30.0
+    # Cooling down: the busy feed can't pull it back under 30s yet
+    assert cadence.record(fresh(10)) == 30.0
+    assert cadence.record(fresh(10)) == 30.0
+    assert cadence.record(fresh(10)) == 15.0
+
+def test_fixed_interval_when_disabled(monkeypatch):
+    monkeypatch.setattr(Config, "ADAPTIVE_POLLING", False)
+    cadence = AdaptiveCadence()
+    assert [cadence.record(fresh(20)) for _ in range(3)] == [30.0, 30.0, 30.0]
@@ -0,0 +1,138 @@
+import asyncio
+import time
+import pytest
+from bot.alerts.outbox import (PRIORITY_ALERT, PRIORITY_COMMAND, PRIORITY_REPORT, PRIORITY_TRADE,
+                               TelegramOutbox)
+from aiohttp import web
+from bot.benchmarks.standin import FaultProfile, StandInServer
+from bot.config import Config
+from bot.metrics import UPSTREAM_REQUESTS
+
+@pytest.fixture(autouse=True)
+def settings(monkeypatch):
+    monkeypatch.setattr(Config, "TELEGRAM_ENABLED", True)
+    monkeypatch.setattr(Config, "TELEGRAM_GLOBAL_RATE", 1000.0)
+    monkeypatch.setattr(Config, "TELEGRAM_CHAT_INTERVAL", 0.0)
+
+class FlakyStandIn(StandInServer):
+    """Answers the first `failures` Telegram calls with `response()` instead of the API."""
+    def __init__(self, failures: int, response):
+        super().__init__()
+        self.failures = failures
+        self.response = response
+
+    async def telegram(self, request):
+        if self.failures > 0:
+            self.failures -= 1
+            return self.response()
+        return await super().telegram(request)
+
+def run_with_standin(scenario, server=None):
+    """Runs scenario(server, outbox) against a local stand-in Telegram API."""
+    async def main():
+        server = standin or StandInServer()
+        await server.start()
+        Config.TELEGRAM_API_URL = server.urls()["TELEGRAM_API_URL"]
+        outbox = TelegramOutbox()
+        try:
+            return await scenario(server, outbox)
+        finally:
+            await outbox.stop(timeout=1.0)
+            await server.stop()
+
+    standin = server
+    url = Config.TELEGRAM_API_URL
+    try:
+        return asyncio.run(main())
+    finally:
+        Config.TELEGRAM_API_URL = url
+
+def sent_texts(server):
+    return [message["text"] for message in server.telegram_sent]
+
+def test_higher_priority_goes_first():
+    async def scenario(server, outbox):
+        futures = [outbox.send_message("alert 1", PRIORITY_ALERT), outbox.send_message("report", PRIORITY_REPORT),
+                   outbox.send_message("alert 2", PRIORITY_ALERT), outbox.send_message("command", PRIORITY_COMMAND),
+                   outbox.send_message("exit", PRIORITY_TRADE)]
+        outbox.start()
+        results = await asyncio.gather(*futures)
+        assert all(result and result["message_id"] for result in results)
+        return sent_texts(server)
+
+    assert run_with_standin(scenario) == ["exit", "command", "alert 1", "alert 2", "report"]
+
+def test_chat_messages_are_paced(monkeypatch):
+    monkeypatch.setattr(Config, "TELEGRAM_CHAT_INTERVAL", 0.2)
+
+    async def scenario(server, outbox):
+        outbox.start()
+        started = time.monotonic()
+        await asyncio.gather(*(outbox.send_message(f"m{i}") for i in range(3)))
+        return time.monotonic() - started
+
+    assert run_with_standin(scenario) >= 0.4
+
+def test_429_pauses_and_keeps_the_message():
+    async def scenario(server, outbox):
+        server.faults["telegram"] = FaultProfile(p429=1.0, retry_after=1)
+        outbox.start()
+        started = time.monotonic()
+        future = outbox.send_message("after the pause")
+        while not server.responses[("telegram", 429)]:
+            await asyncio.sleep(0.01)
+        server.faults.clear()
+        result = await future
+        return result, time.monotonic() - started, sent_texts(server)
+
+    result, elapsed, sent = run_with_standin(scenario)
+    assert result and result["message_id"]
+    assert elapsed >= 1.0
+    assert sent == ["after the pause"]
+
+def test_stop_drains_then_drops_the_rest(monkeypatch):
+    monkeypatch.setattr(Config, "TELEGRAM_CHAT_INTERVAL", 0.5)
+
+    async def scenario(server, outbox):
+        outbox.start()
+        futures = [outbox.send_message(f"m{i}") for i in range(4)]
+        await outbox.stop(timeout=0.2)
+        return [future.result() for future in futures]
+
+    results = run_with_standin(scenario)
+    assert results[0] and results[0]["message_id"]
+    assert results[-1] is None
+
+def test_disabled_resolves_immediately(monkeypatch):
+    monkeypatch.setattr(Config, "TELEGRAM_ENABLED", False)
+
+    async def scenario(server, outbox):
+        return await outbox.send_message("nowhere")
+
+    assert run_with_standin(scenario) is None
+
+def test_html_error_page_is_retried(monkeypatch):
+    monkeypatch.setattr(Config, "RETRY_DELAY_EXPONENT", 0.1)
+    bad_gateway = lambda: web.Response(status=502, text="<html>Bad Gateway</html>", content_type="text/html")
+    server = FlakyStandIn(failures=1, response=bad_gateway)
+    before = UPSTREAM_REQUESTS.labels("telegram", 502).get()
+
+    async def scenario(server, outbox):
+        outbox.start()
+        return await outbox.send_message("exit")
+
+    result = run_with_standin(scenario, server)
+    assert result and result["message_id"]
+    assert sent_texts(server) == ["exit"]
+    assert UPSTREAM_REQUESTS.labels("telegram", 502).get() == before + 1
+
+def test_null_body_is_rejected_not_crashed():
+    server = FlakyStandIn(failures=1, response=lambda: web.json_response(None))
+
+    async def scenario(server, outbox):
+        outbox.start()
+        return await asyncio.gather(outbox.send_message("first"), outbox.send_message("second"))
+
+    first, second = run_with_standin(scenario, server)
+    assert first is None
+    assert second and second["message_id"]
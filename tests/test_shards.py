@@ -0,0 +1,73 @@
+import asyncio
+from types import SimpleNamespace
+from bot.analyzer.goplus import GoPlusClient
+from bot.config import Config
+from bot.shards import SHARD_RESTARTS, ShardSupervisor, parse_shards
+
+class FakeProcess:
+    def __init__(self, alive: bool):
+        self.alive = alive
+        self.exitcode = None if alive else 1
+
+    def is_alive(self):
+        return self.alive
+
+def test_parse_groups_and_adds_other():
+    assert parse_shards("solana; ethereum, BSC ;base;") == {
+        "solana": ["solana"], "ethereum+bsc": ["ethereum", "bsc"], "base": ["base"], "other": ["*"]}
+
+def test_parse_keeps_explicit_catch_all():
+    assert parse_shards("solana;*") == {"solana": ["solana"], "*": ["*"]}
+
+def test_parse_auto_is_one_shard_per_chain():
+    shards = parse_shards("auto")
+    assert list(shards)[:-1] == list(GoPlusClient.CHAIN_MAP)
+    assert shards["other"] == ["*"]
+
+def test_route_by_chain_with_fallback():
+    supervisor = ShardSupervisor(SimpleNamespace(running=True), parse_shards("solana;ethereum,bsc"))
+    assert supervisor.route({"chainId": "Solana"}) == "solana"
+    assert supervisor.route({"chainId": "bsc"}) == "ethereum+bsc"
+    assert supervisor.route({"chainId": "tron"}) == "other"
+    assert supervisor.route({}) == "other"
+
+def test_monitor_restarts_exited_workers(monkeypatch):
+    monkeypatch.setattr(Config, "SHARD_CHECK_INTERVAL", 0.01)
+    bot = SimpleNamespace(running=True)
+    supervisor = ShardSupervisor(bot, parse_shards("solana;ethereum"))
+    supervisor.processes = {"solana": FakeProcess(alive=True), "ethereum": FakeProcess(alive=False),
+                            "other": FakeProcess(alive=True)}
+    spawned = []
+
+    def spawn(name):
+        spawned.append(name)
+        supervisor.processes[name] = FakeProcess(alive=True)
+    monkeypatch.setattr(supervisor, "_spawn_worker", spawn)
+    before = SHARD_RESTARTS.labels("ethereum").get()
+
+    async def main():
+        task = asyncio.create_task(supervisor._monitor_loop())
+        await asyncio.sleep(0.1)
+        bot.running = False
+        await task
+    asyncio.run(main())
+
+    assert spawned == ["ethereum"] # Once: the replacement stays alive
+    assert SHARD_RESTARTS.labels("ethereum").get() == before + 1
+
+def test_monitor_leaves_workers_alone_when_stopping(monkeypatch):
+    monkeypatch.setattr(Config, "SHARD_CHECK_INTERVAL", 0.01)
+    bot = SimpleNamespace(running=True)
+    supervisor = ShardSupervisor(bot, parse_shards("solana"))
+    supervisor.processes = {"solana": FakeProcess(alive=True)}
+    spawned = []
+    monkeypatch.setattr(supervisor, "_spawn_worker", spawned.append)
+
+    async def main():
+        task = asyncio.create_task(supervisor._monitor_loop())
+        await asyncio.sleep(0.03)
+        bot.running = False
+        supervisor.processes["solana"].alive = False # Exiting on shutdown
+        await task
+    asyncio.run(main())
+    assert spawned == []
@@ -0,0 +1,58 @@
+import json
+from bot.stream import EventHub
+
+def frames(client):
+    out = []
+    while not client.queue.empty():
+        out.append(client.queue.get_nowait().decode())
+    return out
+
+def ids(client):
+    return [int(frame.split("\n")[0][len("id: "):]) for frame in frames(client)]
+
+def published(hub, count):
+    for i in range(count):
+        hub.publish("tick", {"n": i})
+    return hub
+
+def test_live_events_reach_every_client():
+    hub = EventHub(replay_size=10, client_queue=10)
+    a, b = hub.subscribe(), hub.subscribe()
+    hub.publish("trade", {"symbol": "SYM"})
+    assert frames(a) == frames(b) == ['id: 1\nevent: trade\ndata: {"symbol":"SYM"}\n\n']
+
+def test_new_client_gets_no_backlog():
+    assert frames(published(EventHub(replay_size=10, client_queue=10), 3).subscribe()) == []
+
+def test_resume_replays_what_was_missed():
+    hub = published(EventHub(replay_size=10, client_queue=10), 5)
+    assert ids(hub.subscribe(last_event_id=2)) == [3, 4, 5]
+    assert ids(hub.subscribe(last_event_id=5)) == []
+
+def test_resume_past_the_replay_window_resets():
+    hub = published(EventHub(replay_size=3, client_queue=10), 6) # Keeps 4..6
+    assert ids(hub.subscribe(last_event_id=3)) == [4, 5, 6]
+    frame = frames(hub.subscribe(last_event_id=2))
+    assert len(frame) == 1 and frame[0].startswith("event: reset\n")
+    assert json.loads(frame[0].split("data: ")[1]) == {"last_id": 6}
+
+def test_resume_from_before_a_restart_resets():
+    hub = published(EventHub(replay_size=10, client_queue=10), 3) # Ids started over at 1
+    frame = frames(hub.subscribe(last_event_id=500))
+    assert len(frame) == 1 and frame[0].startswith("event: reset\n")
+    assert frames(published(EventHub(replay_size=10, client_queue=10), 0).subscribe(last_event_id=7))[0].startswith("event: reset\n")
+
+def test_resume_larger_than_client_queue_resets():
+    hub = published(EventHub(replay_size=10, client_queue=3), 5)
+    assert ids(hub.subscribe(last_event_id=3)) == [4, 5]
+    assert frames(hub.subscribe(last_event_id=2))[0].startswith("event: reset\n")
+
+def test_slow_client_is_dropped():
+    hub = EventHub(replay_size=10, client_queue=2)
+    slow, fast = hub.subscribe(), hub.subscribe()
+    hub.publish("tick", 1)
+    hub.publish("tick", 2)
+    frames(fast)
+    hub.publish("tick", 3)
+    assert slow.dropped and slow not in hub.clients
+    assert not fast.dropped and ids(fast) == [3]
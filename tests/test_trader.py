@@ -0,0 +1,76 @@
+import sqlite3
+import pytest
+from bot.models.token import Token
+from bot.simulator.trader import PaperTrader
+from bot.storage.db import Database
+
+def make_token(pair: str, price: float) -> Token:
+    return Token("solana", pair, "A" + pair, "Name", "SYM" + pair, "q", "SOL", price,
+                 1000, 5000, 0, 1, 1, 1, 0, 0, 0, 0, 0, "url")
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "cache.db")
+    Database(path) # Creates the tables
+    return path
+
+def test_checkpoint_round_trip(db_path):
+    trader = PaperTrader(db_path)
+    assert trader.enter_trade(make_token("open", 1.0))
+    assert trader.enter_trade(make_token("closed", 1.0))
+    trader.update_positions({"open": make_token("open", 1.5), "closed": make_token("closed", 2.0)})
+    assert trader.checkpoint()
+
+    recovered = PaperTrader(db_path)
+    assert recovered.portfolio == pytest.approx(trader.portfolio)
+    assert set(recovered.open_positions) == {"open"}
+    assert recovered.trades["closed"]["status"] == "TAKE_PROFIT_2X"
+    assert recovered.trades["open"]["current_price"] == 1.5
+    assert [entry["action"] for entry in recovered.trades["closed"]["log"]] == ["BUY", "TAKE_PROFIT_2X"]
+
+    # Recovered positions are re-armed at their original levels
+    assert recovered.update_positions({"open": make_token("open", 0.5)})
+    assert not recovered.open_positions
+
+def test_nothing_persists_without_checkpoint(db_path):
+    trader = PaperTrader(db_path)
+    trader.enter_trade(make_token("pair", 1.0))
+    recovered = PaperTrader(db_path)
+    assert recovered.trades == {}
+    assert recovered.portfolio["balance"] == 200.0
+
+def test_failed_checkpoint_keeps_journal(db_path):
+    trader = PaperTrader(db_path)
+    trader.enter_trade(make_token("pair", 1.0))
+    conn = sqlite3.connect(db_path)
+    conn.execute("DROP TABLE trades")
+    conn.close()
+
+    assert not trader.checkpoint()
+    assert trader._journal
+
+    Database(db_path)
+    assert trader.checkpoint()
+    assert not trader._journal
+    assert set(PaperTrader(db_path).open_positions) == {"pair"}
+
+def test_reentry_keeps_closed_trade(db_path):
+    trader = PaperTrader(db_path)
+    trader.enter_trade(make_token("pair", 1.0))
+    trader.update_positions({"pair": make_token("pair", 0.4)})
+    balance = trader.portfolio["balance"]
+
+    assert not trader.enter_trade(make_token("pair", 0.4))
+    assert trader.portfolio["balance"] == balance
+    trader.checkpoint()
+    assert PaperTrader(db_path).trades["pair"]["log"][-1]["action"] == "STOP_LOSS_50"
+
+def test_reset_clears_persisted_state(db_path):
+    trader = PaperTrader(db_path)
+    trader.enter_trade(make_token("pair", 1.0))
+    trader.checkpoint()
+    trader.reset_portfolio(100.0)
+
+    recovered = PaperTrader(db_path)
+    assert recovered.trades == {}
+    assert recovered.portfolio["balance"] == 100.0
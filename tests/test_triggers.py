@@ -0,0 +1,48 @@
+from bot.simulator.triggers import TriggerIndex
+
+def make_index():
+    index = TriggerIndex()
+    index.add("pair", "a", stop=0.5, take_profit=2.0)
+    index.add("pair", "b", stop=0.8, take_profit=3.0)
+    return index
+
+def test_stop_fires_at_and_below_level():
+    index = make_index()
+    assert index.crossed("pair", 0.81) == ([], [])
+    assert index.crossed("pair", 0.8) == (["b"], [])
+    assert sorted(index.crossed("pair", 0.5)[0]) == ["a", "b"]
+    assert sorted(index.crossed("pair", 0.1)[0]) == ["a", "b"]
+
+def test_take_profit_fires_at_and_above_level():
+    index = make_index()
+    assert index.crossed("pair", 1.99) == ([], [])
+    assert index.crossed("pair", 2.0) == ([], ["a"])
+    assert sorted(index.crossed("pair", 3.0)[1]) == ["a", "b"]
+
+def test_equal_levels_keep_every_key():
+    index = TriggerIndex()
+    index.add("pair", "a", stop=1.0, take_profit=4.0)
+    index.add("pair", "b", stop=1.0, take_profit=4.0)
+    assert sorted(index.crossed("pair", 1.0)[0]) == ["a", "b"]
+    index.remove("a")
+    assert index.crossed("pair", 1.0) == (["b"], [])
+    assert index.crossed("pair", 4.0) == ([], ["b"])
+
+def test_readding_a_key_moves_its_levels():
+    index = make_index()
+    index.add("pair", "a", stop=0.9, take_profit=1.5)
+    assert len(index) == 2
+    assert index.crossed("pair", 0.85) == (["a"], [])
+    assert index.crossed("pair", 1.5) == ([], ["a"])
+
+def test_removing_last_key_drops_the_pair():
+    index = make_index()
+    index.remove("a")
+    index.remove("b")
+    index.remove("missing") # No-op
+    assert not index.has_pair("pair")
+    assert len(index) == 0
+    assert index.crossed("pair", 0.0) == ([], [])
+
+def test_unknown_pair_crosses_nothing():
+    assert make_index().crossed("other", 0.0) == ([], [])